@@ -1,8 +1,25 @@
 """Create mock model checkpoint for testing"""
+import argparse
+import contextlib
+import functools
+import io
+import json
+import mmap
+import pickle
+from collections import OrderedDict
+
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 from pathlib import Path
 
+from boltz_service.config.base import CacheConfig, configure_compile_cache
+
+# Pair tensors up to this many elements leave the recycling step dominated
+# by kernel launches, where replaying a CUDA graph pays off; larger ones are
+# compute-bound and run eagerly
+GRAPH_MAX_PAIR_NUMEL = 1 << 22
+
 class MockMSAModule(nn.Module):
     def __init__(self, msa_s=32, msa_blocks=2, msa_dropout=0.1, z_dropout=0.1):
         super().__init__()
@@ -11,15 +28,16 @@ class MockMSAModule(nn.Module):
         self.msa_dropout = msa_dropout
         self.z_dropout = z_dropout
         
-        # Add some mock layers
-        self.encoder = nn.Linear(msa_s, msa_s)
-        self.dropout = nn.Dropout(msa_dropout)
+        # Add some mock layers; dropout runs in place on the Linear output,
+        # which backward does not need
+        self.block = nn.Sequential(OrderedDict([
+            ("encoder", nn.Linear(msa_s, msa_s)),
+            ("dropout", nn.Dropout(msa_dropout, inplace=True)),
+        ]))
         
     def forward(self, z, s_inputs, feats):
         # Mock MSA processing
-        z = self.encoder(z)
-        z = self.dropout(z)
-        return z
+        return self.block(z)
 
 class MockPairformerModule(nn.Module):
     """Mock pairformer module for testing"""
@@ -30,30 +48,49 @@ class MockPairformerModule(nn.Module):
         self.num_heads = num_heads
         self.hidden_size = hidden_size
         
+        self.head_dim = hidden_size // num_heads
+        
         self.encoder = nn.Linear(hidden_size, hidden_size)
-        self.attention = nn.MultiheadAttention(hidden_size, num_heads, batch_first=True)
+        # Fused QKV projection + SDPA (FlashAttention on CUDA) instead of
+        # nn.MultiheadAttention, which graph-breaks under torch.compile
+        self.qkv = nn.Linear(hidden_size, 3 * hidden_size)
+        self.out = nn.Linear(hidden_size, hidden_size)
         self.norm = nn.LayerNorm(hidden_size)
         
     def forward(self, s, z, mask=None, pair_mask=None):
         # Mock pairformer processing
         z = self.encoder(z)
-        z = self.attention(z, z, z)[0]
+        *batch, length, _ = z.shape
+        qkv = self.qkv(z).view(*batch, length, 3, self.num_heads, self.head_dim)
+        q, k, v = (t.transpose(-3, -2) for t in qkv.unbind(-3))
+        z = F.scaled_dot_product_attention(q, k, v, is_causal=False)
+        z = self.out(z.transpose(-3, -2).reshape(*batch, length, self.hidden_size))
         z = self.norm(z)
         return s, z
 
 class MockStructureModule(nn.Module):
     """Mock structure module for testing"""
+    # Number of pre-sampled outputs cycled through by ``sample``
+    SAMPLE_POOL_SIZE = 8
+
     def __init__(self):
         super().__init__()
         self.linear = nn.Linear(32, 32)
+        # Pre-sampled outputs so ``sample`` does not allocate per call
+        pool = self.SAMPLE_POOL_SIZE
+        self.register_buffer("_coord_pool", torch.randn(pool, 2, 32, 3), persistent=False)
+        self.register_buffer("_token_pool", torch.randn(pool, 2, 32, 32), persistent=False)
+        self._pool_idx = 0
 
     def forward(self, s_trunk, z_trunk, s_inputs, feats, relative_position_encoding, multiplicity):
         return {"structure_output": self.linear(s_trunk)}
 
     def sample(self, s_trunk, z_trunk, s_inputs, feats, relative_position_encoding, num_sampling_steps, atom_mask, multiplicity, train_accumulate_token_repr):
+        idx = self._pool_idx % self.SAMPLE_POOL_SIZE
+        self._pool_idx = idx + 1
         return {
-            "sample_atom_coords": torch.randn(2, 32, 3),
-            "diff_token_repr": torch.randn(2, 32, 32) if train_accumulate_token_repr else None
+            "sample_atom_coords": self._coord_pool[idx],
+            "diff_token_repr": self._token_pool[idx] if train_accumulate_token_repr else None
         }
 
 class MockConfidenceModule(nn.Module):
@@ -126,6 +163,8 @@ class MockBoltzModel(nn.Module):
         self.structure_prediction_training = structure_prediction_training
         self.no_msa = no_msa
         self.is_pairformer_compiled = False
+        self.is_forward_compiled = False
+        self._cuda_graph = None
 
         # Input projections
         self.s_init = nn.Linear(32, token_s, bias=False)
@@ -161,20 +200,99 @@ class MockBoltzModel(nn.Module):
         # Mock input embedder
         self.input_embedder = nn.Linear(32, token_s)
         self.rel_pos = nn.Linear(32, token_z)
-        self.token_bonds = nn.Linear(1, token_z, bias=False)
+        # Equivalent to nn.Linear(1, token_z, bias=False) (same init), applied
+        # as a broadcast scale so no GEMM or temporary is needed
+        self.token_bonds_w = nn.Parameter(torch.empty(token_z).uniform_(-1.0, 1.0))
+
+        # Fixed mock input features, sampled once instead of on every forward.
+        # Non-persistent so they stay out of the checkpoint state_dict.
+        self.register_buffer("_mock_s_in", torch.randn(2, 32, 32), persistent=False)
+        self.register_buffer("_mock_rel_pos", torch.randn(2, 32, 32), persistent=False)
+        self.register_buffer("_mock_bonds", torch.randn(2, 32, 32, 1), persistent=False)
+
+    def _recycling_step(self, s, z, s_init, z_init, s_inputs, batch, mask, pair_mask):
+        s_update = self.s_recycle(self.s_norm(s))
+        z_update = self.z_recycle(self.z_norm(z))
+        if torch.is_grad_enabled():
+            s = s_init + s_update
+            z = z_init + z_update
+        else:
+            # Write into the existing buffers instead of allocating new
+            # ones; autograd would reject the in-place update in training
+            s = torch.add(s_init, s_update, out=s)
+            z = torch.add(z_init, z_update, out=z)
+
+        if not self.no_msa:
+            z = z + self.msa_module(z, s_inputs, batch)
+
+        return self.pairformer_module(s, z, mask=mask, pair_mask=pair_mask)
+
+    def _recycling_graph(self, s_init, z_init, s_inputs, batch, mask, pair_mask):
+        """Return a callable replaying one recycling step from a CUDA graph
+
+        The graph is captured on first use and re-captured only when input
+        shapes, dtype, device or training mode change. Inputs are copied into
+        static buffers before every replay, as graph replay requires fixed
+        addresses.
+        """
+        key = (
+            s_init.shape, z_init.shape, s_inputs.shape, mask.shape,
+            z_init.dtype, s_init.device, self.training,
+        )
+        if self._cuda_graph is None or self._cuda_graph[0] != key:
+            static = {
+                "s": torch.zeros_like(s_init),
+                "z": torch.zeros_like(z_init),
+                "s_init": s_init.clone(),
+                "z_init": z_init.clone(),
+                "s_inputs": s_inputs.clone(),
+                "mask": mask.clone(),
+                "pair_mask": pair_mask.clone(),
+            }
+            # Warm up on a side stream so lazy initialization is not captured
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                for _ in range(3):
+                    self._recycling_step(batch=batch, **static)
+            torch.cuda.current_stream().wait_stream(stream)
+
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph):
+                outputs = self._recycling_step(batch=batch, **static)
+            self._cuda_graph = (key, graph, static, outputs)
+
+        _, graph, static, outputs = self._cuda_graph
+        static["s_init"].copy_(s_init)
+        static["z_init"].copy_(z_init)
+        static["s_inputs"].copy_(s_inputs)
+        static["mask"].copy_(mask)
+        static["pair_mask"].copy_(pair_mask)
+
+        def replay(s, z):
+            static["s"].copy_(s)
+            static["z"].copy_(z)
+            graph.replay()
+            return outputs[0].clone(), outputs[1].clone()
+
+        return replay
 
     def forward(self, batch, recycling_steps=0, num_sampling_steps=None, 
                 multiplicity_diffusion_train=1, diffusion_samples=1):
-        # Mock forward pass
-        s_inputs = self.input_embedder(torch.randn(2, 32, 32))
+        # Mock forward pass. Callers wanting fresh features can pass
+        # "s_in", "rel_pos" and "token_bonds" in the batch.
+        s_inputs = self.input_embedder(batch.get("s_in", self._mock_s_in))
         s_init = self.s_init(s_inputs)
-        z_init = (
-            self.z_init_1(s_inputs)[:, :, None] + 
-            self.z_init_2(s_inputs)[:, None, :]
+        # Both pair projections in one GEMM, then a single broadcast write of
+        # the (B, N, N, D) pair tensor; later terms are accumulated in place
+        z_proj = F.linear(
+            s_inputs, torch.cat([self.z_init_1.weight, self.z_init_2.weight])
         )
-        relative_position_encoding = self.rel_pos(torch.randn(2, 32, 32))
-        z_init = z_init + relative_position_encoding
-        z_init = z_init + self.token_bonds(torch.randn(2, 32, 32, 1))
+        z_init_1, z_init_2 = z_proj.chunk(2, dim=-1)
+        z_init = z_init_1.unsqueeze(2) + z_init_2.unsqueeze(1)
+        relative_position_encoding = self.rel_pos(batch.get("rel_pos", self._mock_rel_pos))
+        z_init.add_(relative_position_encoding)
+        z_init.addcmul_(batch.get("token_bonds", self._mock_bonds), self.token_bonds_w)
 
         s = torch.zeros_like(s_init)
         z = torch.zeros_like(z_init)
@@ -182,14 +300,31 @@ class MockBoltzModel(nn.Module):
         mask = batch.get("token_pad_mask", torch.ones(2, 32)).float()
         pair_mask = mask[:, :, None] * mask[:, None, :]
 
-        for i in range(recycling_steps + 1):
-            s = s_init + self.s_recycle(self.s_norm(s))
-            z = z_init + self.z_recycle(self.z_norm(z))
-
-            if not self.no_msa:
-                z = z + self.msa_module(z, s_inputs, batch)
+        # With small pair tensors the recycling body is a handful of
+        # launch-bound kernels on fixed shapes: replay it from a captured CUDA
+        # graph. A compiled forward is already captured by reduce-overhead
+        # mode and must not nest a second capture.
+        if (
+            s_init.is_cuda
+            and not torch.is_grad_enabled()
+            and not self.is_forward_compiled
+            and recycling_steps > 0
+            and z_init.numel() <= GRAPH_MAX_PAIR_NUMEL
+        ):
+            step = self._recycling_graph(s_init, z_init, s_inputs, batch, mask, pair_mask)
+        else:
+            step = functools.partial(
+                self._recycling_step,
+                s_init=s_init,
+                z_init=z_init,
+                s_inputs=s_inputs,
+                batch=batch,
+                mask=mask,
+                pair_mask=pair_mask,
+            )
 
-            s, z = self.pairformer_module(s, z, mask=mask, pair_mask=pair_mask)
+        for i in range(recycling_steps + 1):
+            s, z = step(s=s, z=z)
 
         pdistogram = self.distogram_module(z)
         dict_out = {"pdistogram": pdistogram}
@@ -222,34 +357,193 @@ class MockBoltzModel(nn.Module):
             )
 
         if self.confidence_prediction:
-            dict_out.update(
-                self.confidence_module(
-                    s_inputs=s_inputs.detach(),
-                    s=s.detach(),
-                    z=z.detach(),
-                    s_diffusion=(
-                        dict_out["diff_token_repr"]
-                        if self.confidence_module.use_s_diffusion
-                        else None
-                    ),
-                    x_pred=dict_out["sample_atom_coords"].detach(),
-                    feats=batch,
-                    pred_distogram_logits=dict_out["pdistogram"].detach(),
-                    multiplicity=diffusion_samples,
+            # In eval nothing needs gradients, so run the head under a single
+            # no_grad region. In training the head itself still learns, so
+            # only its inputs are cut from the trunk graph.
+            if self.training:
+                grad_ctx, cut = contextlib.nullcontext(), torch.Tensor.detach
+            else:
+                grad_ctx, cut = torch.no_grad(), lambda t: t
+            with grad_ctx:
+                dict_out.update(
+                    self.confidence_module(
+                        s_inputs=cut(s_inputs),
+                        s=cut(s),
+                        z=cut(z),
+                        s_diffusion=(
+                            dict_out["diff_token_repr"]
+                            if self.confidence_module.use_s_diffusion
+                            else None
+                        ),
+                        x_pred=cut(dict_out["sample_atom_coords"]),
+                        feats=batch,
+                        pred_distogram_logits=cut(dict_out["pdistogram"]),
+                        multiplicity=diffusion_samples,
+                    )
                 )
-            )
 
         if self.confidence_prediction and self.confidence_module.use_s_diffusion:
             dict_out.pop("diff_token_repr", None)
 
         return dict_out
 
-def create_mock_checkpoint():
-    """Create mock model checkpoint"""
+def compile_mock_model(model, cache_dir=None):
+    """Compile ``model.forward`` for repeated fixed-shape calls
+
+    The recycling loop re-runs the same small ops with identical shapes, so
+    ``reduce-overhead`` mode captures it as CUDA graphs. Callers must feed
+    static shapes (pad ``token_pad_mask``/``atom_pad_mask`` to a fixed
+    length). The inductor cache is kept under ``cache_dir`` (the service
+    cache directory by default) so only the first run pays the compile
+    warm-up.
+    """
+    configure_compile_cache(Path(cache_dir or CacheConfig().cache_dir))
+    model.forward = torch.compile(model.forward, mode="reduce-overhead", dynamic=False)
+    model.is_forward_compiled = True
+    return model
+
+def save_tensor_checkpoint(checkpoint, path):
+    """Save checkpoint as a pickled manifest plus one contiguous tensor blob
+
+    The metadata (everything but the state dict, plus a per-tensor manifest of
+    name, dtype, shape, offset and size) goes to ``<path>.meta``. The tensor
+    storages are packed, sorted by key, into a single buffer and written to
+    ``<path>.bin`` with one write call instead of going through pickle.
+    """
+    path = Path(path)
+    state_dict = checkpoint["state_dict"]
+
+    manifest = []
+    tensors = []
+    offset = 0
+    for name in sorted(state_dict):
+        tensor = state_dict[name].detach().cpu().contiguous()
+        nbytes = tensor.numel() * tensor.element_size()
+        manifest.append((name, tensor.dtype, tuple(tensor.shape), offset, nbytes))
+        tensors.append(tensor)
+        offset += nbytes
+
+    blob = torch.empty(offset, dtype=torch.uint8)
+    for (_, _, _, start, nbytes), tensor in zip(manifest, tensors):
+        if nbytes:
+            blob[start:start + nbytes].copy_(tensor.reshape(-1).view(torch.uint8))
+
+    meta = {key: value for key, value in checkpoint.items() if key != "state_dict"}
+    meta["tensors"] = manifest
+    with open(f"{path}.meta", "wb") as f:
+        pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+    with open(f"{path}.bin", "wb") as f:
+        f.write(memoryview(blob.numpy()))
+
+def load_tensor_checkpoint(path):
+    """Load a checkpoint written by ``save_tensor_checkpoint``
+
+    The tensor blob is memory-mapped copy-on-write and every tensor is a
+    zero-copy view into it.
+    """
+    path = Path(path)
+    with open(f"{path}.meta", "rb") as f:
+        checkpoint = pickle.load(f)
+    manifest = checkpoint.pop("tensors")
+
+    state_dict = {}
+    with open(f"{path}.bin", "rb") as f:
+        size = f.seek(0, 2)
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY) if size else None
+
+    for name, dtype, shape, offset, nbytes in manifest:
+        if not nbytes:
+            state_dict[name] = torch.empty(shape, dtype=dtype)
+            continue
+        count = nbytes // torch.empty((), dtype=dtype).element_size()
+        state_dict[name] = torch.frombuffer(
+            buffer, dtype=dtype, count=count, offset=offset
+        ).view(shape)
+
+    checkpoint["state_dict"] = state_dict
+    return checkpoint
+
+def save_safetensors_checkpoint(checkpoint, model_dir, compress=False):
+    """Save state dict as ``model.safetensors`` and the rest as ``hparams.json``
+
+    With ``compress=True`` the tensor file is zstd-compressed to
+    ``model.safetensors.zst``.
+    """
+    from safetensors.torch import save, save_file
+
+    model_dir = Path(model_dir)
+    if compress:
+        (model_dir / "model.safetensors.zst").write_bytes(
+            _zstd_compress(save(checkpoint["state_dict"]))
+        )
+    else:
+        save_file(checkpoint["state_dict"], str(model_dir / "model.safetensors"))
+    meta = {key: value for key, value in checkpoint.items() if key != "state_dict"}
+    (model_dir / "hparams.json").write_text(json.dumps(meta))
+
+def load_safetensors_checkpoint(model_dir):
+    """Load a checkpoint written by ``save_safetensors_checkpoint``"""
+    from safetensors.torch import load, load_file
+
+    model_dir = Path(model_dir)
+    checkpoint = json.loads((model_dir / "hparams.json").read_text())
+    compressed = model_dir / "model.safetensors.zst"
+    if compressed.exists():
+        checkpoint["state_dict"] = load(_zstd_decompress(compressed.read_bytes()))
+    else:
+        checkpoint["state_dict"] = load_file(str(model_dir / "model.safetensors"))
+    return checkpoint
+
+def _zstd_compress(data, level=3):
+    import zstandard
+
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+def _zstd_decompress(data):
+    import zstandard
+
+    return zstandard.ZstdDecompressor().decompress(data)
+
+def load_compressed_checkpoint(path):
+    """Load a zstd-compressed ``torch.save`` checkpoint (``model.ckpt.zst``)"""
+    data = _zstd_decompress(Path(path).read_bytes())
+    return torch.load(io.BytesIO(data), weights_only=False)
+
+def create_mock_checkpoint(model_dir=None, fmt="ckpt", dtype=None, compress=False):
+    """Create mock model checkpoint
+
+    ``fmt="ckpt"`` writes a Lightning-loadable ``model.ckpt``; ``fmt="raw"``
+    writes ``model.ckpt.meta``/``model.ckpt.bin`` via ``save_tensor_checkpoint``;
+    ``fmt="safetensors"`` writes ``model.safetensors`` plus ``hparams.json``
+    (requires the ``safetensors`` package).
+
+    ``dtype`` (e.g. ``torch.bfloat16``) downcasts floating point tensors before
+    writing; the original dtypes are recorded under ``state_dict_dtypes`` so
+    loaders can upcast (``load_state_dict`` does so when copying into params).
+
+    ``compress=True`` zstd-compresses the output (``model.ckpt.zst`` or
+    ``model.safetensors.zst``; requires the ``zstandard`` package). The raw
+    format is meant to be memory-mapped and cannot be compressed.
+    """
+    if compress and fmt == "raw":
+        raise ValueError("The raw checkpoint format does not support compression")
+
     model = MockBoltzModel()
+    # Strip autograd/device state once so torch.save hits its byte-copy path
+    state_dict = {
+        k: v.detach().cpu().contiguous() for k, v in model.state_dict().items()
+    }
+    state_dict_dtypes = {k: str(v.dtype).split(".")[-1] for k, v in state_dict.items()}
+    if dtype is not None:
+        state_dict = {
+            k: v.to(dtype) if v.is_floating_point() else v
+            for k, v in state_dict.items()
+        }
     
     # Create test model directory
-    model_dir = Path.home() / ".bolzt" / "models" / "default"
+    if model_dir is None:
+        model_dir = Path.home() / ".bolzt" / "models" / "default"
+    model_dir = Path(model_dir)
     model_dir.mkdir(parents=True, exist_ok=True)
     
     # Save model checkpoint with all hyperparameters
@@ -257,7 +551,8 @@ def create_mock_checkpoint():
         'epoch': 0,
         'global_step': 0,
         'pytorch-lightning_version': '2.0.0',
-        'state_dict': model.state_dict(),
+        'state_dict': state_dict,
+        'state_dict_dtypes': state_dict_dtypes,
         'hyper_parameters': {
             'atom_s': 64,
             'atom_z': 32,
@@ -296,7 +591,44 @@ def create_mock_checkpoint():
             'no_msa': False
         }
     }
-    torch.save(checkpoint, model_dir / "model.ckpt")
+    if fmt == "raw":
+        save_tensor_checkpoint(checkpoint, model_dir / "model.ckpt")
+    elif fmt == "safetensors":
+        save_safetensors_checkpoint(checkpoint, model_dir, compress=compress)
+    else:
+        # Serialize in memory so the file is written with a single syscall
+        buf = io.BytesIO()
+        torch.save(checkpoint, buf, _use_new_zipfile_serialization=True)
+        if compress:
+            (model_dir / "model.ckpt.zst").write_bytes(_zstd_compress(buf.getbuffer()))
+        else:
+            (model_dir / "model.ckpt").write_bytes(buf.getbuffer())
 
 if __name__ == "__main__":
-    create_mock_checkpoint()
+    parser = argparse.ArgumentParser(description="Create mock model checkpoint")
+    parser.add_argument("--model-dir", type=Path, default=None, help="Output directory")
+    parser.add_argument(
+        "--format",
+        choices=["ckpt", "raw", "safetensors"],
+        default="ckpt",
+        help=(
+            "ckpt: Lightning checkpoint; raw: manifest + contiguous tensor blob; "
+            "safetensors: model.safetensors + hparams.json"
+        )
+    )
+    parser.add_argument(
+        "--dtype",
+        choices=["float32", "bfloat16", "float16"],
+        default="float32",
+        help="Precision of floating point tensors on disk"
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="zstd-compress the checkpoint (ckpt and safetensors formats)"
+    )
+    args = parser.parse_args()
+    dtype = None if args.dtype == "float32" else getattr(torch, args.dtype)
+    create_mock_checkpoint(
+        args.model_dir, fmt=args.format, dtype=dtype, compress=args.compress
+    )
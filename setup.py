@@ -60,6 +60,8 @@ setup(
         "click==8.1.7",
         "pyyaml==6.0.2",
         "requests==2.32.3",
+        "orjson>=3.9.0",
+        "packaging>=21.0",
         "types-requests",
         "psutil>=5.9.0",
         "redis>=5.0.0",
@@ -1,27 +1,137 @@
 """Base configuration management for Boltz service."""
 
+import itertools
+import json
 import os
-from dataclasses import dataclass, field
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-@dataclass
+# Prefix of environment variables that override configuration values
+ENV_PREFIX = "BOLTZ_"
+
+# Resolved once at import instead of calling Path.home() per instance
+_DEFAULT_CACHE_DIR = Path.home() / ".boltz" / "cache"
+
+# Slotted dataclasses (Python 3.10+) give faster attribute access and smaller
+# instances; older interpreters fall back to regular dataclasses. Methods of
+# slotted subclasses must use explicit ``super(Cls, self)``, since dataclass
+# rebuilds the class and breaks the zero-argument form.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+def configure_compile_cache(cache_dir: Path):
+    """Point the torch.compile caches at a service cache directory.
+    
+    Persisting compiled kernels across restarts avoids paying the compile
+    warm-up on every cold start. This changes process-wide environment, so
+    call it once at startup with the final cache directory; variables that
+    are already set win.
+    """
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(cache_dir / "inductor"))
+    os.environ.setdefault("TORCH_COMPILE_DEBUG_DIR", str(cache_dir / "compile_debug"))
+    try:
+        Path(os.environ["TORCHINDUCTOR_CACHE_DIR"]).mkdir(parents=True, exist_ok=True)
+    except OSError:
+        pass  # Inductor falls back to its temp-dir default
+
+def default_max_workers(requested: Optional[int] = None) -> int:
+    """Return ``requested`` if set, else a worker count sized to the host.
+    
+    Two threads per core (capped at 32) keeps CPU-bound handlers busy
+    without piling up GIL contention on large machines.
+    """
+    if requested:
+        return requested
+    return min(32, (os.cpu_count() or 2) * 2)
+
+def _core_pinner() -> Optional[Callable[[], None]]:
+    """Return a thread initializer pinning each new thread to the next core.
+    
+    Cores are handed out round-robin from the process's allowed CPU set.
+    Returns None where thread affinity is unsupported (non-Linux).
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+    cores = itertools.cycle(sorted(os.sched_getaffinity(0)))
+    
+    def pin():
+        # pid 0 is the calling thread on Linux
+        os.sched_setaffinity(0, {next(cores)})
+        
+    return pin
+
+@dataclass(**DATACLASS_SLOTS)
 class AcceleratorConfig:
     """Configuration for compute accelerators."""
     type: str = "cpu"  # cpu, gpu, tpu
     device_ids: List[int] = field(default_factory=lambda: [0])
     memory_limit: Optional[int] = None  # in MB
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NetworkConfig:
     """Network-related configuration."""
     host: str = "0.0.0.0"
     port: int = 50051
-    max_workers: int = 10
+    max_workers: int = field(default_factory=default_max_workers)
     max_concurrent_rpcs: int = 100
-    keepalive_time_ms: int = 7200000  # 2 hours
+    # Ping idle connections often enough that proxies and NATs don't drop
+    # clients waiting on long-running exports
+    keepalive_time_ms: int = 30000
+    keepalive_timeout_ms: int = 10000
+    keepalive_permit_without_calls: bool = True
+    max_pings_without_data: int = 0
+    # Must not exceed the client ping interval or clients get GOAWAY
+    min_ping_interval_ms: int = 2000
+    max_ping_strikes: int = 2
+    grace_s: float = 5.0  # drain period for in-flight RPCs on shutdown
+    max_send_message_length: int = 256 * 1024 * 1024
+    max_receive_message_length: int = 256 * 1024 * 1024
+    http2_max_frame_size: int = 4 * 1024 * 1024
+    so_reuseport: bool = True
+    compression: str = "gzip"  # none, deflate or gzip
+    tcp_tx_zerocopy: bool = True
+    enable_reflection: bool = False  # service discovery for dev tooling
+    pin_threads: bool = False  # pin handler threads to cores (Linux only)
+    
+    def worker_pool(self) -> ThreadPoolExecutor:
+        """Return the thread pool that runs sync RPC handlers.
+        
+        Its size bounds how many sync handlers run at once. Async handlers,
+        streams and health checks run on the event loop and only count
+        against ``max_concurrent_rpcs``.
+        """
+        return ThreadPoolExecutor(
+            max_workers=default_max_workers(self.max_workers),
+            thread_name_prefix="boltz-grpc",
+            initializer=_core_pinner() if self.pin_threads else None,
+        )
+        
+    def grpc_options(self) -> List[Tuple[str, int]]:
+        """Return the gRPC server channel options for this configuration."""
+        return [
+            ('grpc.keepalive_time_ms', self.keepalive_time_ms),
+            ('grpc.keepalive_timeout_ms', self.keepalive_timeout_ms),
+            ('grpc.keepalive_permit_without_calls',
+             int(self.keepalive_permit_without_calls)),
+            ('grpc.http2.max_pings_without_data', self.max_pings_without_data),
+            ('grpc.http2.min_time_between_pings_ms', self.min_ping_interval_ms),
+            ('grpc.http2.min_ping_interval_without_data_ms',
+             self.min_ping_interval_ms),
+            ('grpc.http2.max_ping_strikes', self.max_ping_strikes),
+            # Advertise the RPC limit to clients via HTTP/2 SETTINGS
+            ('grpc.max_concurrent_streams', self.max_concurrent_rpcs),
+            # Large MSA/structure payloads
+            ('grpc.max_send_message_length', self.max_send_message_length),
+            ('grpc.max_receive_message_length', self.max_receive_message_length),
+            ('grpc.http2.max_frame_size', self.http2_max_frame_size),
+            ('grpc.so_reuseport', int(self.so_reuseport)),
+            ('grpc.tcp_tx_zerocopy_enabled', int(self.tcp_tx_zerocopy)),
+        ]
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SecurityConfig:
     """Security-related configuration."""
     enable_ssl: bool = False
@@ -29,18 +139,21 @@ class SecurityConfig:
     key_path: Optional[str] = None
     require_client_auth: bool = False
     allowed_clients: List[str] = field(default_factory=list)
+    # Loaded from cert_path/key_path by BaseConfig.validate()
+    cert_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    key_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CacheConfig:
     """Cache configuration."""
-    cache_dir: Path = field(default_factory=lambda: Path.home() / ".boltz" / "cache")
+    cache_dir: Path = _DEFAULT_CACHE_DIR
     max_cache_size_gb: int = 100
     enable_redis: bool = False
     redis_host: str = "localhost"
     redis_port: int = 6379
     redis_db: int = 0
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DatabaseConfig:
     """Database configuration."""
     db_type: str = "sqlite"  # sqlite, postgres
@@ -53,7 +166,7 @@ class DatabaseConfig:
     pool_size: int = 5
     max_overflow: int = 10
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LogConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -64,7 +177,7 @@ class LogConfig:
     backup_count: int = 5
     enable_json_logging: bool = False
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MetricsConfig:
     """Metrics and monitoring configuration."""
     enable_prometheus: bool = False
@@ -96,7 +209,7 @@ class MetricsConfig:
     loki_host: str = "localhost"
     loki_port: int = 3100
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BaseConfig:
     """Base configuration for Boltz service."""
     
@@ -125,42 +238,32 @@ class BaseConfig:
         """Create configuration from environment variables."""
         config = cls()
         
-        # Load environment variables with BOLTZ_ prefix
-        for key, value in os.environ.items():
-            if key.startswith("BOLTZ_"):
-                config._set_from_env(key[6:].lower(), value)
+        # Load environment variables with BOLTZ_ prefix, filtered in one pass
+        prefix_len = len(ENV_PREFIX)
+        overrides = [
+            (key[prefix_len:].lower(), value)
+            for key, value in os.environ.items()
+            if key.startswith(ENV_PREFIX)
+        ]
+        for key, value in overrides:
+            config._set_from_env(key, value)
                 
         return config
     
     def _set_from_env(self, key: str, value: str):
         """Set configuration value from environment variable."""
-        parts = key.split('_')
+        entry = _env_dispatch(type(self)).get(key)
+        if entry is None:
+            return
+            
+        path, attr, parse = entry
         current = self
-        
-        # Navigate through nested attributes
-        for part in parts[:-1]:
-            if hasattr(current, part):
-                current = getattr(current, part)
-            else:
-                return
-                
-        # Set the final attribute if it exists
-        final_attr = parts[-1]
-        if hasattr(current, final_attr):
-            attr_type = type(getattr(current, final_attr))
-            try:
-                if attr_type == bool:
-                    setattr(current, final_attr, value.lower() in ('true', '1', 'yes'))
-                elif attr_type == int:
-                    setattr(current, final_attr, int(value))
-                elif attr_type == float:
-                    setattr(current, final_attr, float(value))
-                elif attr_type == list:
-                    setattr(current, final_attr, value.split(','))
-                else:
-                    setattr(current, final_attr, value)
-            except (ValueError, TypeError):
-                pass  # Skip invalid values
+        for part in path:
+            current = getattr(current, part)
+        try:
+            setattr(current, attr, parse(value))
+        except (ValueError, TypeError):
+            pass  # Skip invalid values
                 
     def validate(self) -> List[str]:
         """Validate configuration and return list of errors."""
@@ -174,6 +277,9 @@ class BaseConfig:
         if not 0 <= self.network.port <= 65535:
             errors.append(f"Invalid port number: {self.network.port}")
             
+        if self.network.compression not in ("none", "deflate", "gzip"):
+            errors.append(f"Invalid compression: {self.network.compression}")
+            
         # Validate SSL configuration
         if self.security.enable_ssl:
             if not self.security.cert_path or not self.security.key_path:
@@ -182,5 +288,57 @@ class BaseConfig:
                 errors.append(f"SSL cert file not found: {self.security.cert_path}")
             elif not os.path.exists(self.security.key_path):
                 errors.append(f"SSL key file not found: {self.security.key_path}")
+            else:
+                # Read once here so start() does not touch the filesystem
+                with open(self.security.cert_path, 'rb') as f:
+                    self.security.cert_bytes = f.read()
+                with open(self.security.key_path, 'rb') as f:
+                    self.security.key_bytes = f.read()
                 
         return errors
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in ('true', '1', 'yes')
+
+def _parse_list(value: str) -> List[str]:
+    return value.split(',')
+
+def _env_parser(default: Any) -> Callable[[str], Any]:
+    """Pick the parser for an environment value from the field's default."""
+    if isinstance(default, bool):
+        return _parse_bool
+    if isinstance(default, int):
+        return int
+    if isinstance(default, float):
+        return float
+    if isinstance(default, list):
+        return _parse_list
+    if isinstance(default, dict):
+        return json.loads
+    if isinstance(default, Path):
+        return Path
+    return str
+
+@lru_cache(maxsize=None)
+def _env_dispatch(config_cls: type) -> Dict[str, Tuple[Tuple[str, ...], str, Callable[[str], Any]]]:
+    """Build the env key -> (attribute path, attribute, parser) table once per class.
+    
+    Keys are the lower-cased variable names without the ``BOLTZ_`` prefix,
+    e.g. ``network_port`` or ``metrics_enable_prometheus``.
+    """
+    table = {}
+    
+    def _walk(obj: Any, path: Tuple[str, ...]):
+        for f in fields(obj):
+            if not f.init:
+                continue
+            value = getattr(obj, f.name)
+            if is_dataclass(value):
+                _walk(value, path + (f.name,))
+            else:
+                key = "_".join(path + (f.name,))
+                table[key] = (path, f.name, _env_parser(value))
+                
+    _walk(config_cls(), ())
+    return table
@@ -1,19 +1,24 @@
 """Server configuration for Boltz service."""
 
+import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List
 
-from boltz_service.config.base import BaseConfig
+from boltz_service.config.base import DATACLASS_SLOTS, BaseConfig
 
-@dataclass
+# Resolved once at import instead of calling Path.home() per instance
+_DEFAULT_MODEL_CACHE = Path.home() / ".boltz" / "models"
+
+@dataclass(**DATACLASS_SLOTS)
 class ServerConfig(BaseConfig):
     """Server-specific configuration."""
     
     # Model configuration
     model_name: str = "boltz-1"
     model_version: str = "v1.0.0"
-    model_cache: Path = field(default_factory=lambda: Path.home() / ".boltz" / "models")
+    model_cache: Path = _DEFAULT_MODEL_CACHE
     model_config: Dict = field(default_factory=dict)
     
     # Inference configuration
@@ -35,6 +40,10 @@ class ServerConfig(BaseConfig):
     max_epochs: int = 100
     gradient_clip_val: float = 1.0
     
+    def create_directories(self):
+        """Create the model cache directory; call once at server startup."""
+        self.model_cache.mkdir(parents=True, exist_ok=True)
+    
     def validate(self) -> List[str]:
         """Validate server configuration.
         
@@ -43,11 +52,7 @@ class ServerConfig(BaseConfig):
         List[str]
             List of validation errors
         """
-        errors = super().validate()
-        
-        # Validate model configuration
-        if not self.model_cache.exists():
-            self.model_cache.mkdir(parents=True, exist_ok=True)
+        errors = super(ServerConfig, self).validate()
             
         # Validate sequence parameters
         if self.max_sequence_length <= 0:
@@ -105,7 +110,7 @@ class ServerConfig(BaseConfig):
         ServerConfig
             Server configuration
         """
-        config = super().from_env()
+        config = super(ServerConfig, cls).from_env()
         
         # Add model-specific configuration
         if "BOLTZ_MODEL_CONFIG" in os.environ:
@@ -34,7 +34,10 @@ def _parse_a3m(  # noqa: C901
     sequences = []
     deletions = []
     residues = []
+    # UniRef ID of each kept sequence, resolved in one batch at the end
+    uniref_ids = []
 
+    uniref_id = None
     seq_idx = 0
     for line in lines:
         line: str
@@ -47,11 +50,8 @@ def _parse_a3m(  # noqa: C901
             header = line.split()[0]
             if taxonomy and header.startswith(">UniRef100"):
                 uniref_id = header.split("_")[1]
-                taxonomy_id = taxonomy.get(uniref_id)
-                if taxonomy_id is None:
-                    taxonomy_id = -1
             else:
-                taxonomy_id = -1
+                uniref_id = None
             continue
 
         # Skip if duplicate sequence
@@ -84,7 +84,8 @@ def _parse_a3m(  # noqa: C901
         del_start = len(deletions)
         del_end = del_start + len(deletion)
 
-        sequences.append((seq_idx, taxonomy_id, res_start, res_end, del_start, del_end))
+        sequences.append((seq_idx, -1, res_start, res_end, del_start, del_end))
+        uniref_ids.append(uniref_id)
         residues.extend(residue)
         deletions.extend(deletion)
 
@@ -92,6 +93,18 @@ def _parse_a3m(  # noqa: C901
         if (max_seqs is not None) and (seq_idx >= max_seqs):
             break
 
+    # Look up taxonomy for all annotated sequences at once
+    ids = {uniref_id for uniref_id in uniref_ids if uniref_id is not None}
+    if ids:
+        if hasattr(taxonomy, "get_many"):
+            taxonomy_ids = taxonomy.get_many(ids)
+        else:
+            taxonomy_ids = {uniref_id: taxonomy.get(uniref_id) for uniref_id in ids}
+        for i, uniref_id in enumerate(uniref_ids):
+            taxonomy_id = taxonomy_ids.get(uniref_id)
+            if taxonomy_id is not None:
+                sequences[i] = (sequences[i][0], taxonomy_id, *sequences[i][2:])
+
     # Create MSA object
     msa = MSA(
         residues=np.array(residues, dtype=MSAResidue),
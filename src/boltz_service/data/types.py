@@ -354,12 +354,23 @@ class ServiceConfig(JSONSerializable):
     
     # MSA configuration
     max_msa_seqs: int = 4096
+    msa_workers: int = 4
     recycling_steps: int = 3
     
     # Inference configuration
     sampling_steps: int = 200
     diffusion_samples: int = 1
     output_format: str = 'mmcif'
+    max_jobs: int = 10000
+    job_ttl: int = 86400
+    max_gpu_models: int = 1
+    max_host_models: int = 2
+    max_batch_size: int = 8
+    max_batch_wait_ms: int = 5
+    prediction_timeout: int = 3600  # seconds, when the client sets no deadline
+    
+    # Training configuration
+    max_training_jobs: int = 1
 
 
 @dataclass(frozen=True)
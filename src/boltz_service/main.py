@@ -2,35 +2,149 @@
 
 import argparse
 import asyncio
+import inspect
 import os
 import signal
 import sys
-from concurrent import futures
+import threading
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import grpc
 from grpc_health.v1 import health, health_pb2, health_pb2_grpc
 from grpc_reflection.v1alpha import reflection
 
-from boltz_service.config.base import BaseConfig
+from boltz_service.config.base import BaseConfig, configure_compile_cache
+from boltz_service.config.server import ServerConfig
 from boltz_service.protos import (
+    inference_service_pb2,
     inference_service_pb2_grpc,
+    msa_service_pb2,
     msa_service_pb2_grpc,
+    training_service_pb2,
     training_service_pb2_grpc,
 )
 from boltz_service.services.inference import InferenceService
 from boltz_service.services.msa import MSAService
 from boltz_service.services.training import TrainingService
-from boltz_service.utils.errors import ServiceError
+from boltz_service.utils.errors import ErrorCode, ServiceError
 from boltz_service.utils.logging import setup_logging, get_logger
 from boltz_service.utils.resources import ResourceManager
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Fully-qualified service names, resolved from the descriptors once
+_INFERENCE_SERVICE = inference_service_pb2.DESCRIPTOR.services_by_name["InferenceService"].full_name
+_MSA_SERVICE = msa_service_pb2.DESCRIPTOR.services_by_name["MSAService"].full_name
+_TRAINING_SERVICE = training_service_pb2.DESCRIPTOR.services_by_name["TrainingService"].full_name
+
+# Services advertised through server reflection
+_SERVICE_NAMES = (
+    _INFERENCE_SERVICE,
+    _MSA_SERVICE,
+    _TRAINING_SERVICE,
+    reflection.SERVICE_NAME,
+    health.SERVICE_NAME,
+)
+
+_COMPRESSION = {
+    "none": grpc.Compression.NoCompression,
+    "deflate": grpc.Compression.Deflate,
+    "gzip": grpc.Compression.Gzip,
+}
+
+class _LazyServicer:
+    """Servicer shim that constructs the real service on its first RPC.
+    
+    Handler kinds (sync, coroutine, async generator) are read from the
+    service class so the aio server dispatches them exactly as it would
+    the real service. ``on_ready`` is called once the service is built.
+    """
+    
+    def __init__(
+        self,
+        service_cls: type,
+        config: BaseConfig,
+        on_ready: Optional[Callable[[], None]] = None,
+    ):
+        self._service_cls = service_cls
+        self._config = config
+        self._on_ready = on_ready
+        self._service = None
+        self._lock = threading.Lock()
+        
+    def _get(self):
+        """Return the service, creating it once under the lock."""
+        if self._service is None:
+            with self._lock:
+                if self._service is None:
+                    try:
+                        self._service = self._service_cls(self._config)
+                    except Exception as e:
+                        raise ServiceError(
+                            ErrorCode.UNAVAILABLE,
+                            f"Failed to initialize {self._service_cls.__name__}",
+                            {"error": str(e)}
+                        ) from e
+                    if self._on_ready is not None:
+                        self._on_ready()
+        return self._service
+        
+    def shutdown(self):
+        """Shut down the service if it was ever constructed."""
+        with self._lock:
+            service = self._service
+        shutdown = getattr(service, "shutdown", None)
+        if shutdown is not None:
+            shutdown()
+            
+    def __getattr__(self, name: str):
+        method = getattr(self._service_cls, name)
+        
+        if inspect.isasyncgenfunction(method):
+            async def call(request, context):
+                try:
+                    service = await asyncio.to_thread(self._get)
+                except ServiceError as e:
+                    await context.abort(ErrorCode.to_grpc_code(e.code), str(e))
+                    return
+                async for response in getattr(service, name)(request, context):
+                    yield response
+        elif inspect.iscoroutinefunction(method):
+            async def call(request, context):
+                try:
+                    service = await asyncio.to_thread(self._get)
+                except ServiceError as e:
+                    await context.abort(ErrorCode.to_grpc_code(e.code), str(e))
+                    return None
+                return await getattr(service, name)(request, context)
+        else:
+            def call(request, context):
+                try:
+                    service = self._get()
+                except ServiceError as e:
+                    context.abort(ErrorCode.to_grpc_code(e.code), str(e))
+                    return None
+                return getattr(service, name)(request, context)
+                
+        return call
+
+def _warm_up():
+    """Import the model stack ahead of the first request."""
+    try:
+        import boltz_service.data.write.writer  # noqa: F401
+        import boltz_service.model.model  # noqa: F401
+    except Exception as e:
+        logger.warning("Background warm-up failed: %s", e)
+
 class BoltzServer:
-    """Main server class for Boltz service."""
+    """Main server class for Boltz service.
+    
+    Runs on ``grpc.aio``: async handlers are served on the event loop and
+    the existing sync servicers are dispatched to a bounded migration pool.
+    """
     
     def __init__(self, config: BaseConfig):
         """Initialize server.
@@ -44,74 +158,96 @@ class BoltzServer:
         self.logger = setup_logging(config.logging, "boltz")
         self.resource_manager = ResourceManager(config.accelerator)
         
-        # Initialize server
-        self.server = grpc.server(
-            futures.ThreadPoolExecutor(max_workers=config.network.max_workers),
+        # The aio server binds to the running event loop, so it is only
+        # built in start(); services are only constructed on first use
+        self.server: Optional[grpc.aio.Server] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.health_servicer: Optional[health.aio.HealthServicer] = None
+        self._services = self._create_services()
+        
+    def _create_services(self):
+        """Create lazily-initialized servicers for all services."""
+        return [
+            (_INFERENCE_SERVICE,
+             inference_service_pb2_grpc.add_InferenceServiceServicer_to_server,
+             _LazyServicer(InferenceService, self.config,
+                           partial(self._mark_serving, _INFERENCE_SERVICE))),
+            (_MSA_SERVICE,
+             msa_service_pb2_grpc.add_MSAServiceServicer_to_server,
+             _LazyServicer(MSAService, self.config,
+                           partial(self._mark_serving, _MSA_SERVICE))),
+            (_TRAINING_SERVICE,
+             training_service_pb2_grpc.add_TrainingServiceServicer_to_server,
+             _LazyServicer(TrainingService, self.config,
+                           partial(self._mark_serving, _TRAINING_SERVICE))),
+        ]
+            
+    def _create_server(self) -> grpc.aio.Server:
+        """Build the gRPC server and register all services."""
+        config = self.config
+        
+        # Sync handlers run on this pool, which bounds how many run at once;
+        # threads are only spawned on demand. RPCs beyond the limit are
+        # rejected with RESOURCE_EXHAUSTED rather than queued.
+        server = grpc.aio.server(
+            migration_thread_pool=config.network.worker_pool(),
             maximum_concurrent_rpcs=config.network.max_concurrent_rpcs,
-            options=[
-                ('grpc.keepalive_time_ms', config.network.keepalive_time_ms),
-                ('grpc.keepalive_timeout_ms', 20000),
-                ('grpc.keepalive_permit_without_calls', True),
-                ('grpc.http2.max_pings_without_data', 0),
-                ('grpc.http2.min_time_between_pings_ms', 10000),
-                ('grpc.http2.min_ping_interval_without_data_ms', 5000),
-            ]
+            compression=_COMPRESSION[config.network.compression],
+            options=config.network.grpc_options(),
         )
         
         # Add services
-        self._add_services()
+        for _, add_to_server, servicer in self._services:
+            add_to_server(servicer, server)
         
-        # Add health checking
-        health_servicer = health.HealthServicer(
-            experimental_non_blocking=True,
-            experimental_thread_pool=futures.ThreadPoolExecutor(max_workers=4)
-        )
-        health_pb2_grpc.add_HealthServicer_to_server(health_servicer, self.server)
+        # Add health checking. The async servicer runs on the event loop, so
+        # a saturated migration pool cannot starve liveness probes.
+        self.health_servicer = health.aio.HealthServicer()
+        health_pb2_grpc.add_HealthServicer_to_server(self.health_servicer, server)
         
-        # Enable reflection
-        service_names = (
-            reflection.SERVICE_NAME,
-            health.SERVICE_NAME,
-            *self.server.get_service_names()
-        )
-        reflection.enable_server_reflection(service_names, self.server)
+        # Reflection is only useful for dev tooling
+        if config.network.enable_reflection:
+            reflection.enable_server_reflection(_SERVICE_NAMES, server)
         
-    def _add_services(self):
-        """Add all services to the server."""
+        return server
+        
+    def _mark_serving(self, name: str):
+        """Report a service as ``SERVING`` once its servicer has been built.
+        
+        Called from the thread that built the servicer, never the loop.
+        """
+        if self.health_servicer is None:
+            return
+        coro = self.health_servicer.set(name, health_pb2.HealthCheckResponse.SERVING)
         try:
-            # Inference service
-            inference_service = InferenceService(self.config)
-            inference_service_pb2_grpc.add_InferenceServiceServicer_to_server(
-                inference_service, self.server
-            )
-            
-            # MSA service
-            msa_service = MSAService(self.config)
-            msa_service_pb2_grpc.add_MSAServiceServicer_to_server(
-                msa_service, self.server
-            )
-            
-            # Training service
-            training_service = TrainingService(self.config)
-            training_service_pb2_grpc.add_TrainingServiceServicer_to_server(
-                training_service, self.server
-            )
-            
-        except Exception as e:
-            raise ServiceError("Failed to initialize services", str(e))
-            
-    def start(self):
+            asyncio.run_coroutine_threadsafe(coro, self.loop)
+        except RuntimeError:
+            coro.close()  # Loop already closed
+            return
+        logger.info("%s ready", name)
+        
+    async def start(self):
         """Start the server."""
+        self.loop = asyncio.get_running_loop()
+        self.server = self._create_server()
+        
+        # Readiness gate: the server itself is up as soon as it listens, but
+        # each service only reports SERVING once its first RPC has built it
+        await self.health_servicer.set("", health_pb2.HealthCheckResponse.SERVING)
+        for name, _, _ in self._services:
+            await self.health_servicer.set(name, health_pb2.HealthCheckResponse.NOT_SERVING)
+        
         # Add secure credentials if SSL is enabled
-        if self.config.security.enable_ssl:
-            with open(self.config.security.cert_path, 'rb') as f:
-                cert = f.read()
-            with open(self.config.security.key_path, 'rb') as f:
-                key = f.read()
-                
+        security = self.config.security
+        if security.enable_ssl:
+            if security.cert_bytes is None or security.key_bytes is None:
+                raise ServiceError(
+                    ErrorCode.FAILED_PRECONDITION,
+                    "SSL enabled but certificates not loaded; call config.validate() first"
+                )
             credentials = grpc.ssl_server_credentials(
-                [(key, cert)],
-                require_client_auth=self.config.security.require_client_auth
+                [(security.key_bytes, security.cert_bytes)],
+                require_client_auth=security.require_client_auth
             )
             self.server.add_secure_port(
                 f"{self.config.network.host}:{self.config.network.port}",
@@ -123,39 +259,63 @@ class BoltzServer:
             )
             
         # Start server
-        self.server.start()
+        await self.server.start()
         logger.info(
-            f"Server started on {self.config.network.host}:{self.config.network.port}"
+            "Server started on %s:%s", self.config.network.host, self.config.network.port
         )
         
-        # Set up signal handlers
-        for sig in [signal.SIGTERM, signal.SIGINT]:
-            signal.signal(sig, self._handle_shutdown)
-            
         # Start resource monitoring
         self.resource_manager.monitor.start()
         
-    def _handle_shutdown(self, signum, frame):
-        """Handle shutdown signals."""
-        logger.info("Received shutdown signal")
-        self.stop()
-        sys.exit(0)
+        # Services import their heavy dependencies on first use; pay that
+        # cost in the background now that the server is already serving
+        threading.Thread(target=_warm_up, name="boltz-warmup", daemon=True).start()
         
-    def stop(self):
+    async def stop(self):
         """Stop the server."""
         logger.info("Stopping server...")
         
-        # Stop accepting new requests
-        self.server.stop(grace=5)
+        # Report NOT_SERVING so load balancers stop routing here, then stop
+        # accepting new requests and drain in-flight RPCs
+        if self.health_servicer is not None:
+            await self.health_servicer.enter_graceful_shutdown()
+        if self.server is not None:
+            await self.server.stop(grace=self.config.network.grace_s)
         
-        # Clean up resources
-        self.resource_manager.cleanup()
+        # Release service worker pools, then other resources, without
+        # blocking the event loop
+        for _, _, servicer in self._services:
+            await asyncio.to_thread(servicer.shutdown)
+        await asyncio.to_thread(self.resource_manager.cleanup)
         
         logger.info("Server stopped")
         
-    def wait_for_termination(self):
+    async def wait_for_termination(self):
         """Wait for server termination."""
-        self.server.wait_for_termination()
+        await self.server.wait_for_termination()
+        
+    async def serve(self):
+        """Start the server and block until it terminates."""
+        await self.start()
+        try:
+            await self.wait_for_termination()
+        finally:
+            await self.stop()
+
+async def _serve(config: BaseConfig):
+    """Run the server until SIGTERM/SIGINT, then drain and stop it."""
+    shutdown = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, shutdown.set)
+        
+    server = BoltzServer(config)
+    await server.start()
+    try:
+        await shutdown.wait()
+        logger.info("Received shutdown signal")
+    finally:
+        await server.stop()
 
 def parse_args():
     """Parse command line arguments."""
@@ -169,7 +329,8 @@ def parse_args():
     serve_parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     serve_parser.add_argument("--port", type=int, default=50051, help="Port to bind to")
     serve_parser.add_argument(
-        "--workers", type=int, default=10, help="Number of worker threads"
+        "--workers", type=int, default=None,
+        help="Number of worker threads (default: 2 per core, at most 32)"
     )
     serve_parser.add_argument(
         "--cache", default="~/.boltz", help="Cache directory"
@@ -188,18 +349,18 @@ def parse_args():
 
 def main():
     """Main entry point."""
-    print("Starting Boltz service...")
     try:
         args = parse_args()
         
         if args.command == "serve":
             # Create configuration
-            config = BaseConfig()
+            config = ServerConfig()
             
             # Update from command line args
             config.network.host = args.host
             config.network.port = args.port
-            config.network.max_workers = args.workers
+            if args.workers:
+                config.network.max_workers = args.workers
             config.cache.cache_dir = Path(os.path.expanduser(args.cache))
             config.accelerator.type = args.accelerator
             config.accelerator.device_ids = list(range(args.devices))
@@ -209,16 +370,22 @@ def main():
             if errors:
                 logger.error("Configuration validation failed:")
                 for error in errors:
-                    logger.error(f"- {error}")
+                    logger.error("- %s", error)
                 sys.exit(1)
+            config.create_directories()
+            configure_compile_cache(config.cache.cache_dir)
                 
             # Start server
-            server = BoltzServer(config)
             try:
-                server.start()
-                server.wait_for_termination()
+                # uvloop is optional; fall back to the default event loop
+                try:
+                    import uvloop
+                    uvloop.install()
+                except ImportError:
+                    pass
+                asyncio.run(_serve(config))
             except Exception as e:
-                logger.error(f"Server failed: {e}")
+                logger.error("Server failed: %s", e)
                 sys.exit(1)
                 
     except Exception as e:
@@ -3,10 +3,13 @@
 import json
 import os
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from boltz_service.config.base import BaseConfig
 from boltz_service.monitoring.grafana_config import (LOGGING_DASHBOARD, MODEL_DASHBOARD,
@@ -16,6 +19,10 @@ from boltz_service.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Accepted API status codes; 409 on create means the object already exists
+_OK = frozenset({200})
+_OK_CREATE = frozenset({200, 409})
+
 class GrafanaService:
     """Service for managing Grafana dashboards and data sources."""
     
@@ -29,6 +36,15 @@ class GrafanaService:
         """
         self.config = config
         self.base_url = f"http://{config.metrics.grafana_host}:{config.metrics.grafana_port}"
+        
+        # API endpoints
+        self._url_health = urljoin(self.base_url, "api/health")
+        self._url_datasources = urljoin(self.base_url, "api/datasources")
+        self._url_datasource_name = self._url_datasources + "/name/"
+        self._url_dashboards_db = urljoin(self.base_url, "api/dashboards/db")
+        self._url_dashboard_uid = urljoin(self.base_url, "api/dashboards/uid/")
+        self._url_alerts = urljoin(self.base_url, "api/alerts")
+        
         self.api_key = config.metrics.grafana_api_key
         
         self.headers = {
@@ -36,6 +52,21 @@ class GrafanaService:
             "Content-Type": "application/json"
         }
         
+        # Reuse pooled connections across API calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504]
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
         # Default dashboards
         self.dashboards = {
             "system": SYSTEM_DASHBOARD,
@@ -47,36 +78,89 @@ class GrafanaService:
         
     def setup(self):
         """Set up Grafana with required data sources and dashboards."""
-        try:
-            # Wait for Grafana to be ready
-            self._wait_for_grafana()
+        # Wait for Grafana to be ready
+        self._wait_for_grafana()
+        
+        # Data sources and dashboards are independent, so push them
+        # concurrently over the pooled session. API errors are logged by
+        # each call; anything reaching here is a bug and is re-raised.
+        failures = []
+        with ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="grafana-setup"
+        ) as executor:
+            pending = self._setup_data_sources(executor)
+            pending.update(self._setup_dashboards(executor))
             
-            # Set up data sources
-            self._setup_data_sources()
+            for future in as_completed(pending):
+                exc = future.exception()
+                if exc is not None:
+                    failures.append((pending[future], exc))
+                    
+        if failures:
+            logger.error(
+                "Failed to set up Grafana: %s",
+                "; ".join(f"{name}: {exc}" for name, exc in failures)
+            )
+            raise failures[0][1]
+        
+        logger.info("Grafana setup completed successfully")
             
-            # Create dashboards
-            self._setup_dashboards()
+    def _check(
+        self,
+        response: requests.Response,
+        success: str,
+        failure: str,
+        ok: frozenset = _OK
+    ) -> bool:
+        """Log the outcome of a Grafana API call.
+        
+        Parameters
+        ----------
+        response : requests.Response
+            API response
+        success : str
+            Message logged when the status is accepted
+        failure : str
+            Message logged, with the response body, otherwise
+        ok : frozenset
+            Accepted status codes
             
-            logger.info("Grafana setup completed successfully")
-        except Exception as e:
-            logger.error(f"Failed to set up Grafana: {e}")
-            raise
+        Returns
+        -------
+        bool
+            Whether the call succeeded
+        """
+        if response.status_code in ok:
+            logger.info(success)
+            return True
+        logger.error("%s: %s", failure, response.text)
+        return False
+        
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.session.close()
             
-    def _wait_for_grafana(self, timeout: int = 60, interval: int = 5):
+    def _wait_for_grafana(self, timeout: int = 60, max_interval: float = 2.0):
         """Wait for Grafana to be ready.
         
+        Polls with exponential backoff starting at 100ms.
+        
         Parameters
         ----------
         timeout : int
             Maximum time to wait in seconds
-        interval : int
-            Time between health checks in seconds
+        max_interval : float
+            Upper bound on the delay between health checks in seconds
         """
         start_time = time.time()
+        delay = 0.1
         while True:
             try:
-                response = requests.get(urljoin(self.base_url, "api/health"))
-                if response.status_code == 200:
+                response = self.session.get(
+                    self._url_health,
+                    timeout=(1.0, 2.0)
+                )
+                if response.status_code in _OK:
                     logger.info("Grafana is ready")
                     return
             except requests.exceptions.RequestException:
@@ -85,12 +169,26 @@ class GrafanaService:
             if time.time() - start_time > timeout:
                 raise TimeoutError("Grafana failed to become ready")
                 
-            time.sleep(interval)
+            time.sleep(delay)
+            delay = min(delay * 2, max_interval)
             
-    def _setup_data_sources(self):
-        """Set up required data sources."""
+    def _setup_data_sources(self, executor: ThreadPoolExecutor) -> Dict[Future, str]:
+        """Submit creation of the required data sources.
+        
+        Parameters
+        ----------
+        executor : ThreadPoolExecutor
+            Executor to run the API calls on
+            
+        Returns
+        -------
+        Dict[Future, str]
+            Pending calls mapped to a description for error reporting
+        """
+        data_sources = []
+        
         # Prometheus data source
-        self._create_data_source({
+        data_sources.append({
             "name": "Prometheus",
             "type": "prometheus",
             "url": f"http://{self.config.metrics.prometheus_host}:{self.config.metrics.prometheus_port}",
@@ -99,7 +197,7 @@ class GrafanaService:
         })
         
         # Loki data source
-        self._create_data_source({
+        data_sources.append({
             "name": "Loki",
             "type": "loki",
             "url": f"http://{self.config.metrics.loki_host}:{self.config.metrics.loki_port}",
@@ -110,7 +208,7 @@ class GrafanaService:
         })
         
         # Jaeger data source
-        self._create_data_source({
+        data_sources.append({
             "name": "Jaeger",
             "type": "jaeger",
             "url": f"http://{self.config.metrics.jaeger_host}:{self.config.metrics.jaeger_query_port}",
@@ -122,8 +220,14 @@ class GrafanaService:
             }
         })
         
+        return {
+            executor.submit(self._create_data_source, data_source):
+                f"data source '{data_source['name']}'"
+            for data_source in data_sources
+        }
+        
     def _create_data_source(self, data_source: Dict):
-        """Create a Grafana data source.
+        """Create a Grafana data source unless an identical one exists.
         
         Parameters
         ----------
@@ -131,27 +235,65 @@ class GrafanaService:
             Data source configuration
         """
         try:
-            response = requests.post(
-                urljoin(self.base_url, "api/datasources"),
-                headers=self.headers,
-                json=data_source
+            existing = self.session.get(
+                self._url_datasource_name + data_source["name"]
             )
             
-            if response.status_code in (200, 409):  # 409 means already exists
-                logger.info(f"Data source '{data_source['name']}' configured")
+            if existing.status_code in _OK:
+                current = existing.json()
+                if current.get("url") == data_source["url"]:
+                    logger.info("Data source '%s' unchanged", data_source["name"])
+                    return
+                response = self.session.put(
+                    f"{self._url_datasources}/{current['id']}",
+                    json=data_source
+                )
             else:
-                logger.error(f"Failed to create data source: {response.text}")
-        except Exception as e:
-            logger.error(f"Error creating data source: {e}")
+                response = self.session.post(
+                    self._url_datasources,
+                    json=data_source
+                )
             
-    def _setup_dashboards(self):
-        """Set up predefined dashboards."""
-        for name, dashboard in self.dashboards.items():
-            try:
-                self.create_dashboard(dashboard)
-                logger.info(f"Dashboard '{name}' created successfully")
-            except Exception as e:
-                logger.error(f"Failed to create dashboard '{name}': {e}")
+            self._check(
+                response,
+                f"Data source '{data_source['name']}' configured",
+                "Failed to create data source",
+                _OK_CREATE
+            )
+        except requests.RequestException as e:
+            logger.error("Error creating data source: %s", e)
+            
+    def _setup_dashboards(self, executor: ThreadPoolExecutor) -> Dict[Future, str]:
+        """Submit creation of the predefined dashboards.
+        
+        Parameters
+        ----------
+        executor : ThreadPoolExecutor
+            Executor to run the API calls on
+            
+        Returns
+        -------
+        Dict[Future, str]
+            Pending calls mapped to a description for error reporting
+        """
+        return {
+            executor.submit(self._sync_dashboard, dashboard): f"dashboard '{name}'"
+            for name, dashboard in self.dashboards.items()
+        }
+        
+    def _sync_dashboard(self, dashboard: 'GrafanaDashboard'):
+        """Push a dashboard only if Grafana holds a different version.
+        
+        Parameters
+        ----------
+        dashboard : GrafanaDashboard
+            Dashboard configuration
+        """
+        existing = self.get_dashboard(dashboard.uid)
+        if existing and dashboard.sha_tag in existing.get("dashboard", {}).get("tags", []):
+            logger.info("Dashboard '%s' unchanged", dashboard.title)
+            return
+        self.create_dashboard(dashboard)
                 
     def create_dashboard(self, dashboard: 'GrafanaDashboard'):
         """Create or update a Grafana dashboard.
@@ -162,18 +304,18 @@ class GrafanaService:
             Dashboard configuration
         """
         try:
-            response = requests.post(
-                urljoin(self.base_url, "api/dashboards/db"),
-                headers=self.headers,
-                json=dashboard.to_json()
+            response = self.session.post(
+                self._url_dashboards_db,
+                data=dashboard._serialized
             )
             
-            if response.status_code == 200:
-                logger.info(f"Dashboard '{dashboard.title}' created/updated")
-            else:
-                logger.error(f"Failed to create dashboard: {response.text}")
-        except Exception as e:
-            logger.error(f"Error creating dashboard: {e}")
+            self._check(
+                response,
+                f"Dashboard '{dashboard.title}' created/updated",
+                "Failed to create dashboard"
+            )
+        except requests.RequestException as e:
+            logger.error("Error creating dashboard: %s", e)
             
     def get_dashboard(self, uid: str) -> Optional[Dict]:
         """Get a dashboard by UID.
@@ -189,15 +331,14 @@ class GrafanaService:
             Dashboard configuration if found
         """
         try:
-            response = requests.get(
-                urljoin(self.base_url, f"api/dashboards/uid/{uid}"),
-                headers=self.headers
+            response = self.session.get(
+                self._url_dashboard_uid + uid
             )
             
-            if response.status_code == 200:
+            if response.status_code in _OK:
                 return response.json()
-        except Exception as e:
-            logger.error(f"Error getting dashboard: {e}")
+        except requests.RequestException as e:
+            logger.error("Error getting dashboard: %s", e)
             
         return None
         
@@ -210,17 +351,17 @@ class GrafanaService:
             Dashboard UID
         """
         try:
-            response = requests.delete(
-                urljoin(self.base_url, f"api/dashboards/uid/{uid}"),
-                headers=self.headers
+            response = self.session.delete(
+                self._url_dashboard_uid + uid
             )
             
-            if response.status_code == 200:
-                logger.info(f"Dashboard {uid} deleted")
-            else:
-                logger.error(f"Failed to delete dashboard: {response.text}")
-        except Exception as e:
-            logger.error(f"Error deleting dashboard: {e}")
+            self._check(
+                response,
+                f"Dashboard {uid} deleted",
+                "Failed to delete dashboard"
+            )
+        except requests.RequestException as e:
+            logger.error("Error deleting dashboard: %s", e)
             
     def create_alert_rule(
         self,
@@ -267,18 +408,18 @@ class GrafanaService:
                 }]
             }
             
-            response = requests.post(
-                urljoin(self.base_url, "api/alerts"),
-                headers=self.headers,
+            response = self.session.post(
+                self._url_alerts,
                 json=alert_data
             )
             
-            if response.status_code == 200:
-                logger.info(f"Alert rule '{name}' created")
-            else:
-                logger.error(f"Failed to create alert rule: {response.text}")
-        except Exception as e:
-            logger.error(f"Error creating alert rule: {e}")
+            self._check(
+                response,
+                f"Alert rule '{name}' created",
+                "Failed to create alert rule"
+            )
+        except requests.RequestException as e:
+            logger.error("Error creating alert rule: %s", e)
             
     def create_error_rate_alert(
         self,
@@ -1,21 +1,29 @@
 """Grafana configuration and dashboard templates."""
 
+import hashlib
 import json
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, Optional, Tuple
 
-@dataclass
+import orjson
+
+@dataclass(frozen=True)
 class GrafanaDashboard:
     """Grafana dashboard configuration."""
     
     title: str
     uid: str
-    panels: List[Dict]
+    panels: Tuple[Dict, ...]
     datasource: str
     refresh: str = "5s"
     time_from: str = "now-1h"
     time_to: str = "now"
     
+    def __post_init__(self):
+        object.__setattr__(self, "panels", tuple(self.panels))
+        
     def to_json(self) -> dict:
         """Convert dashboard to Grafana JSON format.
         
@@ -29,7 +37,7 @@ class GrafanaDashboard:
                 "id": None,
                 "uid": self.uid,
                 "title": self.title,
-                "tags": ["boltz"],
+                "tags": ["boltz", self.sha_tag],
                 "timezone": "browser",
                 "refresh": self.refresh,
                 "schemaVersion": 30,
@@ -38,67 +46,126 @@ class GrafanaDashboard:
                     "from": self.time_from,
                     "to": self.time_to
                 },
-                "panels": self.panels
+                "panels": list(self.panels)
             },
             "folderId": 0,
             "overwrite": True
         }
+        
+    @cached_property
+    def sha_tag(self) -> str:
+        """Tag identifying the dashboard content.
+        
+        Returns
+        -------
+        str
+            ``sha:<hex digest>`` of the user-defined dashboard fields
+        """
+        content = json.dumps(
+            [self.uid, self.title, self.refresh, self.time_from,
+             self.time_to, list(self.panels)],
+            sort_keys=True
+        )
+        return f"sha:{hashlib.sha256(content.encode()).hexdigest()}"
+        
+    def to_bytes(self) -> bytes:
+        """Encode dashboard to Grafana JSON bytes.
+        
+        Returns
+        -------
+        bytes
+            UTF-8 encoded dashboard payload
+        """
+        return orjson.dumps(self.to_json())
+        
+    @cached_property
+    def _serialized(self) -> bytes:
+        """Dashboard JSON payload, encoded once per dashboard."""
+        return self.to_bytes()
+
+_K = {k: sys.intern(k) for k in (
+    "id", "title", "type", "datasource", "targets", "expr", "query",
+    "legendFormat", "gridPos", "h", "w", "x", "y"
+)}
+
+def _panel(
+    panel_id: int,
+    title: str,
+    ptype: str,
+    expr: str,
+    legend: Optional[str],
+    x: int,
+    y: int,
+    w: int = 12,
+    h: int = 8,
+    datasource: str = "Prometheus",
+    target_key: str = "expr"
+) -> dict:
+    """Build a single-target Grafana panel.
+    
+    Parameters
+    ----------
+    panel_id : int
+        Panel ID within the dashboard
+    title : str
+        Panel title
+    ptype : str
+        Panel type, e.g. ``graph`` or ``heatmap``
+    expr : str
+        Target query
+    legend : Optional[str]
+        Legend format, omitted if None
+    x, y, w, h : int
+        Grid position and size
+    datasource : str
+        Data source name
+    target_key : str
+        Key of the query in the target, ``expr`` or ``query``
+        
+    Returns
+    -------
+    dict
+        Panel in Grafana JSON format
+    """
+    target = {_K[target_key]: expr}
+    if legend is not None:
+        target[_K["legendFormat"]] = legend
+    return {
+        _K["id"]: panel_id,
+        _K["title"]: title,
+        _K["type"]: ptype,
+        _K["datasource"]: datasource,
+        _K["targets"]: [target],
+        _K["gridPos"]: {_K["h"]: h, _K["w"]: w, _K["x"]: x, _K["y"]: y},
+    }
 
 # System metrics dashboard
 SYSTEM_DASHBOARD = GrafanaDashboard(
     title="Boltz System Metrics",
     uid="boltz-system",
     datasource="Prometheus",
-    panels=[
+    panels=(
         # CPU Usage Panel
-        {
-            "id": 1,
-            "title": "CPU Usage",
-            "type": "graph",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "boltz_cpu_utilization",
-                "legendFormat": "CPU %"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 0, "y": 0}
-        },
+        _panel(1, "CPU Usage", "graph", "boltz_cpu_utilization", "CPU %", 0, 0),
         # Memory Usage Panel
-        {
-            "id": 2,
-            "title": "Memory Usage",
-            "type": "graph",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "boltz_memory_utilization",
-                "legendFormat": "Memory %"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 12, "y": 0}
-        },
+        _panel(
+            2, "Memory Usage", "graph",
+            "boltz_memory_utilization", "Memory %",
+            12, 0
+        ),
         # GPU Utilization Panel
-        {
-            "id": 3,
-            "title": "GPU Utilization",
-            "type": "graph",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "boltz_gpu_utilization{device=~'gpu.*'}",
-                "legendFormat": "{{device}}"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 0, "y": 8}
-        },
+        _panel(
+            3, "GPU Utilization", "graph",
+            "boltz_gpu_utilization{device=~'gpu.*'}", "{{device}}",
+            0, 8
+        ),
         # GPU Memory Panel
-        {
-            "id": 4,
-            "title": "GPU Memory",
-            "type": "graph",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "boltz_gpu_memory_bytes{device=~'gpu.*'} / 1024 / 1024",
-                "legendFormat": "{{device}} MB"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 12, "y": 8}
-        }
-    ]
+        _panel(
+            4, "GPU Memory", "graph",
+            "boltz_gpu_memory_bytes{device=~'gpu.*'} / 1024 / 1024", "{{device}} MB",
+            12, 8
+        )
+    )
 )
 
 # Request metrics dashboard
@@ -106,56 +173,32 @@ REQUEST_DASHBOARD = GrafanaDashboard(
     title="Boltz Request Metrics",
     uid="boltz-requests",
     datasource="Prometheus",
-    panels=[
+    panels=(
         # Request Rate Panel
-        {
-            "id": 1,
-            "title": "Request Rate",
-            "type": "graph",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "rate(boltz_requests_total[5m])",
-                "legendFormat": "{{method}} - {{status}}"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 0, "y": 0}
-        },
+        _panel(
+            1, "Request Rate", "graph",
+            "rate(boltz_requests_total[5m])", "{{method}} - {{status}}",
+            0, 0
+        ),
         # Request Duration Panel
-        {
-            "id": 2,
-            "title": "Request Duration",
-            "type": "graph",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "histogram_quantile(0.95, rate(boltz_request_duration_seconds_bucket[5m]))",
-                "legendFormat": "{{method}} p95"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 12, "y": 0}
-        },
+        _panel(
+            2, "Request Duration", "graph",
+            "histogram_quantile(0.95, rate(boltz_request_duration_seconds_bucket[5m]))",
+            "{{method}} p95", 12, 0
+        ),
         # Error Rate Panel
-        {
-            "id": 3,
-            "title": "Error Rate",
-            "type": "graph",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "rate(boltz_requests_total{status='error'}[5m])",
-                "legendFormat": "{{method}}"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 0, "y": 8}
-        },
+        _panel(
+            3, "Error Rate", "graph",
+            "rate(boltz_requests_total{status='error'}[5m])", "{{method}}",
+            0, 8
+        ),
         # Success Rate Panel
-        {
-            "id": 4,
-            "title": "Success Rate",
-            "type": "graph",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "rate(boltz_requests_total{status='success'}[5m]) / rate(boltz_requests_total[5m])",
-                "legendFormat": "{{method}}"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 12, "y": 8}
-        }
-    ]
+        _panel(
+            4, "Success Rate", "graph",
+            "rate(boltz_requests_total{status='success'}[5m]) / rate(boltz_requests_total[5m])",
+            "{{method}}", 12, 8
+        )
+    )
 )
 
 # Model metrics dashboard
@@ -163,56 +206,32 @@ MODEL_DASHBOARD = GrafanaDashboard(
     title="Boltz Model Metrics",
     uid="boltz-models",
     datasource="Prometheus",
-    panels=[
+    panels=(
         # Model Load Time Panel
-        {
-            "id": 1,
-            "title": "Model Load Time",
-            "type": "graph",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "histogram_quantile(0.95, rate(boltz_model_load_time_seconds_bucket[5m]))",
-                "legendFormat": "{{model_name}} - {{model_version}}"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 0, "y": 0}
-        },
+        _panel(
+            1, "Model Load Time", "graph",
+            "histogram_quantile(0.95, rate(boltz_model_load_time_seconds_bucket[5m]))",
+            "{{model_name}} - {{model_version}}", 0, 0
+        ),
         # Inference Time Panel
-        {
-            "id": 2,
-            "title": "Inference Time",
-            "type": "graph",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "histogram_quantile(0.95, rate(boltz_inference_time_seconds_bucket[5m]))",
-                "legendFormat": "{{model_name}} - {{model_version}}"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 12, "y": 0}
-        },
+        _panel(
+            2, "Inference Time", "graph",
+            "histogram_quantile(0.95, rate(boltz_inference_time_seconds_bucket[5m]))",
+            "{{model_name}} - {{model_version}}", 12, 0
+        ),
         # Batch Size Distribution Panel
-        {
-            "id": 3,
-            "title": "Batch Size Distribution",
-            "type": "heatmap",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "rate(boltz_batch_size_bucket[5m])",
-                "legendFormat": "{{model_name}}"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 0, "y": 8}
-        },
+        _panel(
+            3, "Batch Size Distribution", "heatmap",
+            "rate(boltz_batch_size_bucket[5m])", "{{model_name}}",
+            0, 8
+        ),
         # Sequence Length Distribution Panel
-        {
-            "id": 4,
-            "title": "Sequence Length Distribution",
-            "type": "heatmap",
-            "datasource": "Prometheus",
-            "targets": [{
-                "expr": "rate(boltz_sequence_length_bucket[5m])",
-                "legendFormat": "{{model_name}}"
-            }],
-            "gridPos": {"h": 8, "w": 12, "x": 12, "y": 8}
-        }
-    ]
+        _panel(
+            4, "Sequence Length Distribution", "heatmap",
+            "rate(boltz_sequence_length_bucket[5m])", "{{model_name}}",
+            12, 8
+        )
+    )
 )
 
 # Logging dashboard
@@ -220,32 +239,20 @@ LOGGING_DASHBOARD = GrafanaDashboard(
     title="Boltz Logs",
     uid="boltz-logs",
     datasource="Loki",
-    panels=[
+    panels=(
         # Log Volume Panel
-        {
-            "id": 1,
-            "title": "Log Volume",
-            "type": "graph",
-            "datasource": "Loki",
-            "targets": [{
-                "expr": 'sum(count_over_time({job="boltz"}[5m])) by (level)',
-                "legendFormat": "{{level}}"
-            }],
-            "gridPos": {"h": 8, "w": 24, "x": 0, "y": 0}
-        },
+        _panel(
+            1, "Log Volume", "graph",
+            'sum(count_over_time({job="boltz"}[5m])) by (level)', "{{level}}",
+            0, 0, w=24, datasource="Loki"
+        ),
         # Error Logs Panel
-        {
-            "id": 2,
-            "title": "Error Logs",
-            "type": "logs",
-            "datasource": "Loki",
-            "targets": [{
-                "expr": '{job="boltz"} |= "ERROR"',
-                "legendFormat": ""
-            }],
-            "gridPos": {"h": 12, "w": 24, "x": 0, "y": 8}
-        }
-    ]
+        _panel(
+            2, "Error Logs", "logs",
+            '{job="boltz"} |= "ERROR"', "",
+            0, 8, w=24, h=12, datasource="Loki"
+        )
+    )
 )
 
 # Tracing dashboard
@@ -253,29 +260,24 @@ TRACING_DASHBOARD = GrafanaDashboard(
     title="Boltz Traces",
     uid="boltz-traces",
     datasource="Jaeger",
-    panels=[
+    panels=(
         # Service Latency Panel
-        {
-            "id": 1,
-            "title": "Service Latency",
-            "type": "graph",
-            "datasource": "Jaeger",
-            "targets": [{
-                "expr": "histogram_quantile(0.95, sum(rate(service_latency_bucket[5m])) by (le))",
-                "legendFormat": "p95"
-            }],
-            "gridPos": {"h": 8, "w": 24, "x": 0, "y": 0}
-        },
+        _panel(
+            1, "Service Latency", "graph",
+            "histogram_quantile(0.95, sum(rate(service_latency_bucket[5m])) by (le))",
+            "p95", 0, 0, w=24, datasource="Jaeger"
+        ),
         # Trace Browser Panel
-        {
-            "id": 2,
-            "title": "Trace Browser",
-            "type": "traces",
-            "datasource": "Jaeger",
-            "targets": [{
-                "query": "service.name='boltz'"
-            }],
-            "gridPos": {"h": 12, "w": 24, "x": 0, "y": 8}
-        }
-    ]
+        _panel(
+            2, "Trace Browser", "traces",
+            "service.name='boltz'", None,
+            0, 8, w=24, h=12, datasource="Jaeger", target_key="query"
+        )
+    )
 )
+
+# Dashboards are static, so encode their payloads once at import
+for _dashboard in (SYSTEM_DASHBOARD, REQUEST_DASHBOARD, MODEL_DASHBOARD,
+                   LOGGING_DASHBOARD, TRACING_DASHBOARD):
+    _dashboard._serialized
+del _dashboard
@@ -1,10 +1,12 @@
 """Monitoring service for Boltz."""
 
 import os
+import threading
 import time
 from typing import Optional
 
 import psutil
+from opentelemetry import trace
 
 from boltz_service.config.base import BaseConfig
 from boltz_service.utils.logging import get_logger
@@ -14,6 +16,12 @@ from boltz_service.utils.tracing import TracingManager
 
 logger = get_logger(__name__)
 
+# psutil.cpu_percent(interval=None) is inaccurate for intervals below ~0.1s
+_MIN_CPU_SAMPLE_INTERVAL = 0.1
+
+_SERVER_KIND = trace.SpanKind.SERVER
+_INTERNAL_KIND = trace.SpanKind.INTERNAL
+
 class MonitoringService:
     """Service for managing monitoring, metrics, and tracing."""
     
@@ -28,6 +36,28 @@ class MonitoringService:
         self.config = config
         self.process = psutil.Process(os.getpid())
         
+        # Seed psutil's CPU deltas so later non-blocking reads are meaningful
+        psutil.cpu_percent(interval=None)
+        self._cpu_sampled_at = time.monotonic()
+        self._cpu_percent = 0.0
+        
+        # NVML stays initialized for the process lifetime; device handles
+        # are stable, so look them up once
+        self._nvml_available = False
+        self._nvml_handles = []
+        try:
+            import pynvml
+            pynvml.nvmlInit()
+            self._nvml_handles = [
+                pynvml.nvmlDeviceGetHandleByIndex(i)
+                for i in range(pynvml.nvmlDeviceGetCount())
+            ]
+            self._nvml_available = True
+        except ImportError:
+            logger.debug("NVIDIA management library not available")
+        except Exception as e:
+            logger.warning(f"Error initializing NVML: {e}")
+        
         # Initialize managers
         self.metrics_manager = MetricsManager(config.metrics)
         self.prometheus_manager = PrometheusManager(config.metrics)
@@ -37,76 +67,115 @@ class MonitoringService:
         )
         
         # Start background monitoring if enabled
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
         if config.metrics.enable_prometheus:
-            self._start_monitoring()
+            self._thread = threading.Thread(
+                target=self._start_monitoring,
+                name="boltz-monitoring",
+                daemon=True
+            )
+            self._thread.start()
             
     def _start_monitoring(self):
-        """Start background resource monitoring."""
+        """Run the resource monitoring loop until shutdown."""
         try:
-            while True:
+            while not self._stop_event.is_set():
                 self._update_metrics()
-                time.sleep(self.config.metrics.collection_interval)
+                self._stop_event.wait(self.config.metrics.collection_interval)
         except Exception as e:
             logger.error(f"Error in monitoring loop: {e}")
             
     def _update_metrics(self):
         """Update all metrics."""
         try:
+            snapshot = self._snapshot()
+            
             # Update process metrics
-            self.prometheus_manager.update_resource_metrics(self.process)
+            self.prometheus_manager.update_process_metrics(
+                snapshot["memory_info"],
+                snapshot["cpu_times"]
+            )
             
             # Update custom metrics
-            self._update_custom_metrics()
+            self._update_custom_metrics(snapshot)
         except Exception as e:
             logger.error(f"Error updating metrics: {e}")
             
-    def _update_custom_metrics(self):
-        """Update custom service metrics."""
-        try:
-            # Get CPU stats
-            cpu_percent = psutil.cpu_percent(interval=1)
-            self.metrics_manager.update_resource_metrics(
-                cpu_util=cpu_percent,
-                memory_util=psutil.virtual_memory().percent
-            )
+    def _snapshot(self) -> dict:
+        """Collect system and process resource usage in one pass.
+        
+        Process reads share a single set of /proc reads via ``oneshot()``.
+        
+        Returns
+        -------
+        dict
+            System ``cpu`` and ``mem`` utilization percentages and the
+            process ``memory_info`` and ``cpu_times``
+        """
+        with self.process.oneshot():
+            return {
+                "cpu": self._sample_cpu_percent(),
+                "mem": psutil.virtual_memory().percent,
+                "memory_info": self.process.memory_info(),
+                "cpu_times": self.process.cpu_times(),
+            }
             
+    def _update_custom_metrics(self, snapshot: dict):
+        """Update custom service metrics.
+        
+        Parameters
+        ----------
+        snapshot : dict
+            Resource snapshot from ``_snapshot()``
+        """
+        try:
             # Get GPU stats if available
-            try:
-                import pynvml
-                pynvml.nvmlInit()
-                device_count = pynvml.nvmlDeviceGetCount()
-                
-                gpu_utils = []
-                gpu_memory_utils = []
-                
-                for i in range(device_count):
-                    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                    
-                    # GPU utilization
-                    util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-                    gpu_utils.append(util.gpu)
+            gpu_utils = []
+            gpu_memory_utils = []
+            if self._nvml_available:
+                try:
+                    import pynvml
                     
-                    # GPU memory
-                    memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
-                    memory_util = (memory.used / memory.total) * 100
-                    gpu_memory_utils.append(memory_util)
+                    for handle in self._nvml_handles:
+                        # GPU utilization
+                        util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                        gpu_utils.append(util.gpu)
+                        
+                        # GPU memory
+                        memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                        memory_util = (memory.used / memory.total) * 100
+                        gpu_memory_utils.append(memory_util)
+                except Exception as e:
+                    logger.warning(f"Error getting GPU metrics: {e}")
+                    gpu_utils, gpu_memory_utils = [], []
                     
-                self.metrics_manager.update_resource_metrics(
-                    cpu_util=cpu_percent,
-                    memory_util=psutil.virtual_memory().percent,
-                    gpu_utils=gpu_utils,
-                    gpu_memory_utils=gpu_memory_utils
-                )
-                
-                pynvml.nvmlShutdown()
-            except ImportError:
-                logger.debug("NVIDIA management library not available")
-            except Exception as e:
-                logger.warning(f"Error getting GPU metrics: {e}")
-                
+            self.metrics_manager.update_resource_metrics(
+                cpu_util=snapshot["cpu"],
+                memory_util=snapshot["mem"],
+                gpu_utils=gpu_utils,
+                gpu_memory_utils=gpu_memory_utils
+            )
         except Exception as e:
             logger.error(f"Error updating custom metrics: {e}")
             
+    def _sample_cpu_percent(self) -> float:
+        """Return system CPU utilization without blocking.
+        
+        Reads closer together than ``_MIN_CPU_SAMPLE_INTERVAL`` return the
+        previous sample.
+        
+        Returns
+        -------
+        float
+            CPU utilization percentage since the previous sample
+        """
+        now = time.monotonic()
+        if now - self._cpu_sampled_at >= _MIN_CPU_SAMPLE_INTERVAL:
+            self._cpu_percent = psutil.cpu_percent(interval=None)
+            self._cpu_sampled_at = now
+        return self._cpu_percent
+        
     def start_request_trace(
         self,
         request_id: str,
@@ -135,7 +204,7 @@ class MonitoringService:
         return self.tracing_manager.span(
             f"{method}_request",
             attributes=attributes,
-            kind=trace.SpanKind.SERVER
+            kind=_SERVER_KIND
         )
         
     def record_model_metrics(
@@ -206,7 +275,7 @@ class MonitoringService:
             )
             trace_decorator = self.tracing_manager.trace(
                 name,
-                kind=trace.SpanKind.INTERNAL
+                kind=_INTERNAL_KIND
             )
             
             # Apply both decorators
@@ -216,9 +285,20 @@ class MonitoringService:
     def shutdown(self):
         """Shutdown monitoring service."""
         try:
+            # Stop the monitoring loop
+            self._stop_event.set()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+                
             # Clear Prometheus metrics
             self.prometheus_manager.clear()
             
+            if self._nvml_available:
+                import pynvml
+                pynvml.nvmlShutdown()
+                self._nvml_available = False
+            
             logger.info("Monitoring service shutdown complete")
         except Exception as e:
             logger.error(f"Error during monitoring service shutdown: {e}")
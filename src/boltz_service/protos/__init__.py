@@ -1,11 +1,4 @@
-from . import common_pb2
-from . import common_pb2_grpc
-from . import inference_service_pb2
-from . import inference_service_pb2_grpc
-from . import msa_service_pb2
-from . import msa_service_pb2_grpc
-from . import training_service_pb2
-from . import training_service_pb2_grpc
+import importlib
 
 __all__ = [
     'common_pb2',
@@ -16,4 +9,16 @@ __all__ = [
     'msa_service_pb2_grpc',
     'training_service_pb2',
     'training_service_pb2_grpc',
-]
\ No newline at end of file
+]
+
+# Generated modules are imported on first access (PEP 562) so importing the
+# package only builds the descriptors a caller actually uses
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
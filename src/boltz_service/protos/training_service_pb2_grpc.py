@@ -45,6 +45,11 @@ class TrainingServiceStub(object):
                 request_serializer=common__pb2.JobStatusRequest.SerializeToString,
                 response_deserializer=training__service__pb2.TrainingJobStatusResponse.FromString,
                 _registered_method=True)
+        self.StreamTrainingStatus = channel.unary_stream(
+                '/boltz.TrainingService/StreamTrainingStatus',
+                request_serializer=common__pb2.JobStatusRequest.SerializeToString,
+                response_deserializer=training__service__pb2.TrainingJobStatusResponse.FromString,
+                _registered_method=True)
         self.CancelJob = channel.unary_unary(
                 '/boltz.TrainingService/CancelJob',
                 request_serializer=common__pb2.CancelJobRequest.SerializeToString,
@@ -75,6 +80,13 @@ class TrainingServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamTrainingStatus(self, request, context):
+        """Stream training job status until the job finishes
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CancelJob(self, request, context):
         """Cancel training job
         """
@@ -102,6 +114,11 @@ def add_TrainingServiceServicer_to_server(servicer, server):
                     request_deserializer=common__pb2.JobStatusRequest.FromString,
                     response_serializer=training__service__pb2.TrainingJobStatusResponse.SerializeToString,
             ),
+            'StreamTrainingStatus': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamTrainingStatus,
+                    request_deserializer=common__pb2.JobStatusRequest.FromString,
+                    response_serializer=training__service__pb2.TrainingJobStatusResponse.SerializeToString,
+            ),
             'CancelJob': grpc.unary_unary_rpc_method_handler(
                     servicer.CancelJob,
                     request_deserializer=common__pb2.CancelJobRequest.FromString,
@@ -178,6 +195,33 @@ class TrainingService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamTrainingStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/boltz.TrainingService/StreamTrainingStatus',
+            common__pb2.JobStatusRequest.SerializeToString,
+            training__service__pb2.TrainingJobStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CancelJob(request,
             target,
@@ -0,0 +1,88 @@
+"""PyTorch Lightning callbacks used by training workers.
+
+Kept out of ``training.py`` so the service module does not import
+pytorch_lightning, and defined at module level so DDP ranks launched with
+the spawn start method can unpickle them.
+"""
+
+import pytorch_lightning as pl
+import torch
+
+
+class StatusCallback(pl.Callback):
+    """Report epoch metrics of a training job back to the service.
+
+    Parameters
+    ----------
+    job_id : str
+        Training job ID
+    updates : multiprocessing.Queue
+        Status queue drained by the service; held by the callback so DDP
+        ranks spawned from the worker can still reach it
+    """
+
+    def __init__(self, job_id: str, updates):
+        self.job_id = job_id
+        self.updates = updates
+
+    def on_train_epoch_end(self, trainer, pl_module):
+        # Every rank sees the same synced metrics; report them once
+        if not trainer.is_global_zero:
+            return
+        # Copy all losses to the host in one transfer instead of
+        # synchronizing the device once per float()
+        metrics = trainer.callback_metrics
+        names = [name for name in ("train_loss", "val_loss") if name in metrics]
+        values = torch.stack(
+            [torch.as_tensor(metrics[name]).detach().float().reshape(())
+             for name in names]
+        ).tolist() if names else []
+        losses = dict(zip(names, values))
+        self.updates.put((self.job_id, {
+            "current_epoch": trainer.current_epoch,
+            "train_loss": losses.get("train_loss", float("inf")),
+            "val_loss": losses.get("val_loss", float("inf")),
+        }))
+
+
+class CompileCallback(pl.Callback):
+    """Compile the LightningModule in place once it reaches its rank.
+
+    A ``torch.compile`` wrapper cannot be pickled into ranks started with the
+    spawn method, so the eager module is shipped and each rank compiles its
+    own copy before training starts.
+
+    Parameters
+    ----------
+    **compile_kwargs
+        Keyword arguments forwarded to ``torch.nn.Module.compile``
+    """
+
+    def __init__(self, **compile_kwargs):
+        self.compile_kwargs = compile_kwargs
+
+    def setup(self, trainer, pl_module, stage):
+        if stage == "fit":
+            pl_module.compile(**self.compile_kwargs)
+
+
+class CancelCallback(pl.Callback):
+    """Stop training once the service cancels the job.
+
+    Parameters
+    ----------
+    cancelled : multiprocessing.Event
+        Set by the service to cancel the job. A manager proxy, so it can be
+        shipped to the worker and on to spawned DDP ranks.
+    """
+
+    def __init__(self, cancelled):
+        self.cancelled = cancelled
+
+    def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx):
+        # Ranks may see the flag at different batches; agree on it so they
+        # all stop after the same step instead of hanging in a collective
+        if trainer.strategy.reduce_boolean_decision(
+            self.cancelled.is_set(), all=False
+        ):
+            trainer.should_stop = True
@@ -1,28 +1,64 @@
 """
 Boltz inference service implementation
 """
+import asyncio
+import contextlib
 import logging
 import os
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
 from concurrent import futures
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from pathlib import Path
 
 import grpc
+import redis
 import torch
 from mashumaro import DataClassDictMixin
 from dataclasses import dataclass
+from packaging.version import InvalidVersion, Version
 
-from boltz_service.data.module.inference import BoltzInferenceDataModule
 from boltz_service.data.parse.fasta import parse_fasta
-from boltz_service.model.model import BoltzModel
+from boltz_service.config.base import NetworkConfig
 from boltz_service.data.types import Chain, EntityType, ServiceConfig
-from boltz_service.data.write.writer import save_prediction
+from boltz_service.utils.redis_cache import RedisCache, get_redis_cache
+
+# The model, data module and writer pull in pytorch_lightning; they are
+# imported on first use so the server starts answering health checks sooner
+if TYPE_CHECKING:
+    from boltz_service.model.model import BoltzModel
 
 # Generated proto code
 from boltz_service.protos import inference_service_pb2, inference_service_pb2_grpc, common_pb2
 
 logger = logging.getLogger(__name__)
 
+def _model_class() -> "type[BoltzModel]":
+    """Import and return ``BoltzModel`` on first use"""
+    from boltz_service.model.model import BoltzModel
+    return BoltzModel
+
+def __getattr__(name):
+    # Keep ``BoltzModel`` reachable from this module without importing it
+    # at startup (PEP 562)
+    if name == "BoltzModel":
+        return _model_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _version_key(name: str):
+    """Sort key for model directory names.
+
+    PEP 440 versions compare numerically (so ``v10`` > ``v2``); names that
+    don't parse sort before all versions, lexicographically.
+    """
+    try:
+        return (1, Version(name), name)
+    except InvalidVersion:
+        return (0, name)
+
 @dataclass
 class PredictionJob(DataClassDictMixin):
     """Prediction job"""
@@ -37,6 +73,56 @@ class PredictionJob(DataClassDictMixin):
     result_path: Optional[str] = None
     error_message: Optional[str] = None
 
+class _JobStore:
+    """Thread-safe LRU mapping of job ids to jobs.
+
+    Holds at most ``max_jobs`` entries; inserting into a full store evicts
+    the least recently used job so long-running servers don't grow forever.
+    When a Redis cache is configured every write also goes to Redis and
+    reads prefer it, so job state is shared across replicas and restarts.
+    """
+
+    def __init__(
+        self,
+        max_jobs: int,
+        cache: Optional[RedisCache] = None,
+        ttl: int = 86400,
+    ):
+        self._max_jobs = max(1, max_jobs)
+        self._jobs: "OrderedDict[str, PredictionJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._cache = cache
+        self._ttl = ttl
+
+    def __setitem__(self, job_id: str, job: PredictionJob):
+        with self._lock:
+            self._jobs[job_id] = job
+            self._jobs.move_to_end(job_id)
+            while len(self._jobs) > self._max_jobs:
+                self._jobs.popitem(last=False)
+        if self._cache is not None:
+            try:
+                self._cache.set_job(job_id, job.to_dict(), expire=self._ttl)
+            except redis.RedisError as e:
+                logger.warning(f"Failed to persist job {job_id}: {e}")
+
+    def get(self, job_id: str) -> Optional[PredictionJob]:
+        if self._cache is not None:
+            try:
+                data = self._cache.get_job(job_id)
+                if data is not None:
+                    return PredictionJob.from_dict(data)
+            except redis.RedisError as e:
+                logger.warning(f"Failed to load job {job_id}: {e}")
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._jobs.move_to_end(job_id)
+            return job
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
 class InferenceService(inference_service_pb2_grpc.InferenceServiceServicer):
     """Inference service implementation"""
     
@@ -55,36 +141,132 @@ class InferenceService(inference_service_pb2_grpc.InferenceServiceServicer):
         self.cache_dir = config.cache_dir
         self.model_path = os.path.join(self.cache_dir, "models")
         
-        # Load models
+        # Discover models; checkpoints are loaded on first use
+        self.max_gpu_models = max(1, getattr(config, "max_gpu_models", 1))
+        self.max_host_models = max(0, getattr(config, "max_host_models", 2))
         self._load_models()
         
-        # Job queue
-        self.jobs: Dict[str, PredictionJob] = {}
+        # Job queue, bounded so finished jobs don't accumulate forever
+        self.jobs = _JobStore(
+            getattr(config, "max_jobs", 10000),
+            cache=get_redis_cache(),
+            ttl=getattr(config, "job_ttl", 86400),
+        )
+        
+        # Concurrent requests are coalesced into batched forward passes
+        self.max_batch_size = max(1, getattr(config, "max_batch_size", 8))
+        self.max_batch_wait_s = getattr(config, "max_batch_wait_ms", 5) / 1000
+        self.prediction_timeout = getattr(config, "prediction_timeout", 3600)
+        self._inbox: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        # Guards _closed so no job is queued behind the shutdown sentinel
+        self._inbox_lock = threading.Lock()
+        self._closed = False
+        self._batcher = threading.Thread(
+            target=self._batch_loop, name="boltz-batcher", daemon=True
+        )
+        self._batcher.start()
+        
+    def shutdown(self):
+        """Stop the batching thread after draining queued jobs
+
+        Jobs submitted after this are failed immediately.
+        """
+        with self._inbox_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._inbox.put(None)
+        self._batcher.join()
+        
+    def _submit(self, job: PredictionJob) -> futures.Future:
+        """Queue a job for the next batch
+
+        Parameters
+        ----------
+        job : PredictionJob
+            Job to run
+
+        Returns
+        -------
+        futures.Future
+            Resolves to the job's result path
+        """
+        future = futures.Future()
+        with self._inbox_lock:
+            if self._closed:
+                future.set_exception(RuntimeError("Inference service is shutting down"))
+            else:
+                self._inbox.put((job, future))
+        return future
         
     def _load_models(self):
-        """Load models"""
-        # Load all available model versions
-        self.models = {}
-        for model_dir in os.listdir(self.model_path):
-            if os.path.isdir(os.path.join(self.model_path, model_dir)):
-                try:
-                    model = BoltzModel.load_from_checkpoint(
-                        os.path.join(self.model_path, model_dir, "model.ckpt")
-                    )
-                    model.eval()
-                    if torch.cuda.is_available():
-                        model = model.cuda()
-                    self.models[model_dir] = model
-                except Exception as e:
-                    logger.error(f"Failed to load model {model_dir}: {e}")
+        """Discover available model versions"""
+        with os.scandir(self.model_path) as entries:
+            self.model_dirs = {
+                sys.intern(entry.name): entry.path
+                for entry in entries
+                if entry.is_dir()
+            }
         
-        if not self.models:
+        if not self.model_dirs:
             raise RuntimeError("No models available")
             
-        # Set latest version
-        latest_version = max(self.models.keys())
-        self.models["latest"] = self.models[latest_version]
+        # Resolve the "latest" alias once
+        self._latest_key = max(self.model_dirs, key=_version_key)
+        
+        # At most max_gpu_models models are resident on the device, in LRU
+        # order; evicted models are parked in host memory, up to
+        # max_host_models of them, and dropped after that
+        self.models: "OrderedDict[str, BoltzModel]" = OrderedDict()
+        self._offloaded: "OrderedDict[str, BoltzModel]" = OrderedDict()
+        self._models_lock = threading.Lock()
         
+    def _get_model(self, version: str) -> "BoltzModel":
+        """Return a model ready for inference, loading it if needed
+
+        Parameters
+        ----------
+        version : str
+            Model version, or "latest"
+
+        Returns
+        -------
+        BoltzModel
+            The requested model
+        """
+        key = self._latest_key if version == "latest" else version
+        with self._models_lock:
+            model = self.models.get(key)
+            if model is not None:
+                self.models.move_to_end(key)
+                return model
+                
+            if key not in self.model_dirs:
+                raise ValueError(f"Unknown model version: {version}")
+                
+            model = self._offloaded.pop(key, None)
+            if model is None:
+                model = _model_class().load_from_checkpoint(
+                    os.path.join(self.model_dirs[key], "model.ckpt"),
+                    map_location="cpu",
+                )
+                model.eval()
+                model.requires_grad_(False)
+                
+            use_cuda = torch.cuda.is_available()
+            if use_cuda:
+                model = model.cuda()
+            self.models[key] = model
+            
+            while len(self.models) > self.max_gpu_models:
+                evicted_key, evicted = self.models.popitem(last=False)
+                if use_cuda and self.max_host_models:
+                    self._offloaded[evicted_key] = evicted.to("cpu")
+                    while len(self._offloaded) > self.max_host_models:
+                        self._offloaded.popitem(last=False)
+                    
+            return model
+            
     def PredictStructure(
         self,
         request: inference_service_pb2.PredictionRequest,
@@ -106,12 +288,32 @@ class InferenceService(inference_service_pb2_grpc.InferenceServiceServicer):
             # Save job
             self.jobs[job.job_id] = job
             
-            # Run prediction
-            result_path = self._run_prediction(job)
+            # Queue for the next batch and wait for its result, no longer
+            # than the client's deadline
+            future = self._submit(job)
+            timeout = context.time_remaining()
+            try:
+                result_path = future.result(
+                    timeout=self.prediction_timeout if timeout is None else timeout
+                )
+            except futures.TimeoutError:
+                # Drops the job if it has not started yet
+                future.cancel()
+                job.status = "failed"
+                job.error_message = "Prediction timed out"
+                self.jobs[job.job_id] = job
+                context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+                context.set_details(job.error_message)
+                return inference_service_pb2.PredictionResponse(
+                    job_id=job.job_id,
+                    status=job.status,
+                    error_message=job.error_message,
+                )
             
             # Update job status
             job.status = "completed"
             job.result_path = result_path
+            self.jobs[job.job_id] = job
             
             return inference_service_pb2.PredictionResponse(
                 job_id=job.job_id,
@@ -170,6 +372,7 @@ class InferenceService(inference_service_pb2_grpc.InferenceServiceServicer):
                 
             # Update job status
             job.status = "cancelled"
+            self.jobs[job.job_id] = job
             
             return common_pb2.CancelJobResponse(
                 job_id=job.job_id,
@@ -182,59 +385,151 @@ class InferenceService(inference_service_pb2_grpc.InferenceServiceServicer):
             context.set_details(str(e))
             return common_pb2.CancelJobResponse()
             
-    def _run_prediction(self, job: PredictionJob) -> str:
-        """Run prediction
+    def _batch_loop(self):
+        """Collect queued jobs into batches and run them until shut down"""
+        stopping = False
+        while not stopping:
+            item = self._inbox.get()
+            if item is None:
+                break
+            batch = [item]
+            
+            # Wait briefly for concurrent requests to join the batch
+            deadline = time.monotonic() + self.max_batch_wait_s
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    item = self._inbox.get(timeout=max(0.0, timeout))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                # Keep the batcher alive, but never leave a caller waiting
+                logger.exception("Inference batch failed")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                        
+    def _run_batch(self, batch: List[tuple]):
+        """Run a collected batch, resolving each job's future
 
         Parameters
         ----------
-        job : PredictionJob
-            Prediction job
+        batch : List[tuple]
+            ``(job, future)`` pairs taken from the inbox
+        """
+        # Only jobs with the same model and sampling settings share a pass
+        groups = defaultdict(list)
+        for job, future in batch:
+            if future.set_running_or_notify_cancel():
+                groups[(
+                    job.model_version,
+                    job.recycling_steps,
+                    job.sampling_steps,
+                    job.diffusion_samples,
+                )].append((job, future))
+                
+        for group in groups.values():
+            jobs = [job for job, _ in group]
+            try:
+                result_paths = self._run_predictions(jobs)
+            except Exception as e:
+                for _, future in group:
+                    future.set_exception(e)
+            else:
+                if len(result_paths) != len(group):
+                    raise RuntimeError(
+                        f"Got {len(result_paths)} predictions for {len(group)} jobs"
+                    )
+                for (_, future), result_path in zip(group, result_paths):
+                    future.set_result(result_path)
+            
+    @staticmethod
+    def _autocast():
+        """Return a bf16 autocast context on capable GPUs, else a no-op"""
+        if torch.cuda.is_available() and torch.cuda.is_bf16_supported():
+            return torch.autocast("cuda", dtype=torch.bfloat16)
+        return contextlib.nullcontext()
+        
+    def _run_predictions(self, jobs: List[PredictionJob]) -> List[str]:
+        """Run one batched prediction
+
+        Parameters
+        ----------
+        jobs : List[PredictionJob]
+            Prediction jobs sharing model version and sampling settings
 
         Returns
         -------
-        str
-            Path to prediction result
+        List[str]
+            Paths to prediction results, in job order
         """
-        # Create output directory
-        output_dir = os.path.join(self.cache_dir, "predictions", job.job_id)
-        os.makedirs(output_dir, exist_ok=True)
+        from boltz_service.data.module.inference import BoltzInferenceDataModule
+        from boltz_service.data.write.writer import save_prediction
+
+        first = jobs[0]
         
         # Get model
-        model = self.models[job.model_version]
+        model = self._get_model(first.model_version)
         
         # Create data module
         data_module = BoltzInferenceDataModule(
-            sequences=[job.sequence],
-            batch_size=1,
+            sequences=[job.sequence for job in jobs],
+            batch_size=len(jobs),
             num_workers=2,
         )
         
-        # Run prediction
-        predictions = model.predict(
-            datamodule=data_module,
-            recycling_steps=job.recycling_steps,
-            sampling_steps=job.sampling_steps,
-            diffusion_samples=job.diffusion_samples,
-        )
+        # Run prediction without autograd bookkeeping, in bf16 where supported
+        with torch.inference_mode(), self._autocast():
+            predictions = model.predict(
+                datamodule=data_module,
+                recycling_steps=first.recycling_steps,
+                sampling_steps=first.sampling_steps,
+                diffusion_samples=first.diffusion_samples,
+            )
         
-        # Save prediction
-        output_path = os.path.join(output_dir, f"prediction.{job.output_format}")
-        save_prediction(predictions[0], output_path, format=job.output_format)
+        # Save predictions
+        output_paths = []
+        for job, prediction in zip(jobs, predictions):
+            output_dir = os.path.join(self.cache_dir, "predictions", job.job_id)
+            os.makedirs(output_dir, exist_ok=True)
+            output_path = os.path.join(output_dir, f"prediction.{job.output_format}")
+            save_prediction(prediction, output_path, format=job.output_format)
+            output_paths.append(output_path)
         
-        return output_path
+        return output_paths
+
+async def _serve(port: int, config: ServiceConfig):
+    """Run the inference service until terminated"""
+    service = InferenceService(config=config)
+    # Handlers stay sync and block on the batcher, so they run on this pool
+    network = NetworkConfig()
+    server = grpc.aio.server(
+        migration_thread_pool=network.worker_pool(),
+        maximum_concurrent_rpcs=network.max_concurrent_rpcs,
+        options=network.grpc_options(),
+    )
+    inference_service_pb2_grpc.add_InferenceServiceServicer_to_server(
+        service,
+        server
+    )
+    server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(grace=5)
+        service.shutdown()
 
 def serve(
     port: int,
     config: ServiceConfig,
 ):
     """Start service"""
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    inference_service_pb2_grpc.add_InferenceServiceServicer_to_server(
-        InferenceService(
-            config=config,
-        ),
-        server
-    )
-    server.add_insecure_port(f"[::]:{port}")
-    server.start()
-    server.wait_for_termination()
+    asyncio.run(_serve(port, config))
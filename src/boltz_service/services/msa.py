@@ -3,7 +3,7 @@ import logging
 import os
 import random
 import shutil
-import tempfile
+import subprocess
 import uuid
 from concurrent import futures
 from pathlib import Path
@@ -18,6 +18,7 @@ from boltz_service.data.parse.a3m import parse_a3m
 from boltz_service.protos import msa_service_pb2 as msa_pb2
 from boltz_service.protos import msa_service_pb2_grpc as msa_pb2_grpc
 from boltz_service.protos import common_pb2
+from boltz_service.config.base import NetworkConfig
 from boltz_service.data.types import ServiceConfig
 from boltz_service.utils.database import get_taxonomy_db
 from boltz_service.utils.database_config import DatabaseConfig
@@ -29,6 +30,43 @@ from boltz_service.utils.sequence import validate_sequence
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bytes of the HHblits log quoted in error messages
+_LOG_TAIL_BYTES = 4096
+
+def _tail(path: str, size: int = _LOG_TAIL_BYTES) -> str:
+    """Return the last ``size`` bytes of a file as text"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - size))
+        return f.read().decode(errors="replace")
+
+def _clone_file(src: str, dst: str):
+    """Copy ``src`` to ``dst`` as cheaply as the filesystem allows
+
+    Uses an in-kernel ``copy_file_range`` (a reflink on btrfs/XFS) and falls
+    back to ``shutil.copy``. Cached MSAs are other jobs' outputs, so ``dst``
+    always gets its own data; a hardlink would let a write to either file
+    corrupt the other.
+    """
+    if os.path.lexists(dst):
+        # Never write through an existing link into another file
+        os.unlink(dst)
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copymode(src, dst)
+                return
+        except OSError:
+            pass
+    shutil.copy(src, dst)
+
 class MSAService(msa_pb2_grpc.MSAServiceServicer):
     """MSA generation service"""
     
@@ -47,6 +85,13 @@ class MSAService(msa_pb2_grpc.MSAServiceServicer):
         self._setup_dirs()
         self._check_databases()
         
+        # HHblits runs as its own process; this pool only bounds how many
+        # searches run at once and keeps the gRPC handler threads free
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=getattr(config, "msa_workers", 4),
+            thread_name_prefix="hhblits"
+        )
+        
     def _setup_dirs(self):
         """Set up cache directory"""
         os.makedirs(self.cache_dir, exist_ok=True)
@@ -70,7 +115,11 @@ class MSAService(msa_pb2_grpc.MSAServiceServicer):
         except Exception as e:
             logger.warning(f"Failed to cleanup cache: {e}")
             
-    async def _run_hhblits(self, sequence: str, output_path: str, options: dict) -> None:
+    def shutdown(self):
+        """Stop the HHblits worker pool, waiting for running searches"""
+        self._executor.shutdown(wait=True)
+            
+    def _run_hhblits(self, sequence: str, output_path: str, options: dict) -> None:
         """Run HHblits for sequence search
         
         Parameters
@@ -83,13 +132,15 @@ class MSAService(msa_pb2_grpc.MSAServiceServicer):
             HHblits options
             
         """
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        
         # Check cache
         cache = get_redis_cache()
         if cache:
             cached_path = cache.get_msa(sequence)
             if cached_path and os.path.exists(cached_path):
                 logger.info(f"Using cached MSA: {cached_path}")
-                shutil.copy(cached_path, output_path)
+                _clone_file(cached_path, output_path)
                 return
                 
         bfd_path = os.getenv("BOLTZ_BFD_PATH")
@@ -98,59 +149,62 @@ class MSAService(msa_pb2_grpc.MSAServiceServicer):
         if not skip_bfd and (not bfd_path or not os.path.exists(bfd_path)):
             raise ValueError(f"BFD database not found at {bfd_path}")
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.fasta') as query_file:
-            query_file.write(f">query\n{sequence}\n")
-            query_file.flush()
-
-            # If skipping BFD, use minimal parameters for testing
-            if skip_bfd:
-                cmd = [
-                    "hhblits",
-                    "-i", query_file.name,
-                    "-oa3m", output_path,
-                    "-n", "1",  # Minimal iterations for testing
-                    "-cpu", "1"
-                ]
-            else:
-                cmd = [
-                    "hhblits",
-                    "-i", query_file.name,
-                    "-d", bfd_path,
-                    "-oa3m", output_path,
-                    "-n", "3",
-                    "-cpu", "4"
-                ]
-            
-            # Add additional options
-            if options:
-                cmd.extend([
-                    "-e", "0.001",
-                    "-maxseq", str(options["max_seqs"]),
-                    "-id", f"{int(options['min_identity']*100)}",
-                    "-cov", "70",
-                ])
-            
-            # Run HHblits
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+        # If skipping BFD, use minimal parameters for testing
+        if skip_bfd:
+            cmd = [
+                "hhblits",
+                "-i", "stdin",
+                "-oa3m", output_path,
+                "-n", "1",  # Minimal iterations for testing
+                "-cpu", "1"
+            ]
+        else:
+            cmd = [
+                "hhblits",
+                "-i", "stdin",
+                "-d", bfd_path,
+                "-oa3m", output_path,
+                "-n", "3",
+                "-cpu", "4"
+            ]
+        
+        # Add additional options
+        if options:
+            cmd.extend([
+                "-e", "0.001",
+                "-maxseq", str(options["max_seqs"]),
+                "-id", f"{int(options['min_identity']*100)}",
+                "-cov", "70",
+            ])
+        
+        # Run HHblits with the query FASTA on stdin. Send stderr straight to a log file next to the output instead
+        # of buffering HHblits' (often multi-MB) output in memory
+        log_path = os.path.splitext(output_path)[0] + ".hhblits.log"
+        with open(log_path, "wb") as log_file:
+            proc = subprocess.run(
+                cmd,
+                input=f">query\n{sequence}\n".encode(),
+                stdout=subprocess.DEVNULL,
+                stderr=log_file
             )
-            stdout, stderr = await proc.communicate()
+        
+        if proc.returncode != 0:
+            raise RuntimeError(f"HHblits failed: {_tail(log_path)}")
             
-            if proc.returncode != 0:
-                raise RuntimeError(f"HHblits failed: {stderr.decode()}")
-                
-            # Cache result
-            if cache:
-                cache.set_msa(sequence, output_path)
+        # Cache result
+        if cache:
+            cache.set_msa(sequence, output_path)
                 
-    def GenerateMSA(
+    async def GenerateMSA(
         self,
         request: msa_pb2.MSARequest,
-        context: grpc.ServicerContext
+        context: grpc.aio.ServicerContext
     ) -> msa_pb2.MSAResponse:
-        """Generate MSA for a sequence"""
+        """Generate MSA for a sequence
+        
+        Runs on the event loop and awaits the search on the HHblits pool,
+        so no server thread is held while HHblits runs.
+        """
         try:
             # Validate sequence
             if not validate_sequence(request.sequence):
@@ -158,9 +212,8 @@ class MSAService(msa_pb2_grpc.MSAServiceServicer):
                 context.set_details("Invalid sequence")
                 return msa_pb2.MSAResponse()
                 
-            # Create output directory
+            # Output directory is created by the worker
             output_dir = os.path.join(self.cache_dir, "msa", request.job_id)
-            os.makedirs(output_dir, exist_ok=True)
             
             # Set up HHblits options
             options = {
@@ -171,7 +224,9 @@ class MSAService(msa_pb2_grpc.MSAServiceServicer):
             
             # Run HHblits
             output_path = os.path.join(output_dir, "msa.a3m")
-            asyncio.run(self._run_hhblits(request.sequence, output_path, options))
+            await asyncio.wrap_future(self._executor.submit(
+                self._run_hhblits, request.sequence, output_path, options
+            ))
             
             return msa_pb2.MSAResponse(
                 job_id=request.job_id,
@@ -210,17 +265,28 @@ class MSAService(msa_pb2_grpc.MSAServiceServicer):
         return common_pb2.CancelJobResponse()
 
 
-def serve(port: int = 50053, config: ServiceConfig = None):
-    """Start service"""
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    msa_pb2_grpc.add_MSAServiceServicer_to_server(
-        MSAService(config=config),
-        server
+async def _serve(port: int, config: ServiceConfig):
+    """Run the MSA service until terminated"""
+    service = MSAService(config=config)
+    network = NetworkConfig()
+    server = grpc.aio.server(
+        migration_thread_pool=network.worker_pool(),
+        maximum_concurrent_rpcs=network.max_concurrent_rpcs,
+        options=network.grpc_options(),
     )
+    msa_pb2_grpc.add_MSAServiceServicer_to_server(service, server)
     server.add_insecure_port(f"[::]:{port}")
-    server.start()
+    await server.start()
     logger.info(f"MSA service started on port {port}")
-    server.wait_for_termination()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(grace=5)
+        service.shutdown()
+
+def serve(port: int = 50053, config: ServiceConfig = None):
+    """Start service"""
+    asyncio.run(_serve(port, config))
 
 if __name__ == "__main__":
     serve()
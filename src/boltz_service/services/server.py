@@ -4,11 +4,14 @@ This module provides a simplified server interface that wraps the main BoltzServ
 For the full implementation, see boltz_service.main.
 """
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from boltz_service.data.types import ServiceConfig
+# data.types pulls in numpy; it is only needed for annotations here
+if TYPE_CHECKING:
+    from boltz_service.data.types import ServiceConfig
 
 # Configure logging
 logging.basicConfig(
@@ -80,11 +83,9 @@ def serve_grpc(
     server = BoltzServer(config)
 
     try:
-        server.start()
-        server.wait_for_termination()
+        asyncio.run(server.serve())
     except KeyboardInterrupt:
         logger.info("Received interrupt, shutting down...")
-        server.stop()
 
 
 # Backwards compatibility alias
@@ -100,7 +101,7 @@ class BoltzServer:
         host: str = "0.0.0.0",
         port: int = 50051,
         max_workers: int = 10,
-        config: Optional[ServiceConfig] = None,
+        config: Optional["ServiceConfig"] = None,
     ):
         """Initialize Boltz gRPC server.
 
@@ -135,13 +136,18 @@ class BoltzServer:
         self.port = port
 
     def start(self):
-        """Start the gRPC server."""
-        self._server.start()
-        self._server.wait_for_termination()
+        """Start the gRPC server and block until it terminates."""
+        asyncio.run(self._server.serve())
 
     def stop(self):
-        """Stop the gRPC server."""
-        self._server.stop()
+        """Stop the gRPC server.
+
+        Safe to call from a thread other than the one running ``start``.
+        """
+        loop = self._server.loop
+        if loop is None or loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._server.stop(), loop).result()
 
 
 if __name__ == "__main__":
@@ -1,33 +1,39 @@
 """Boltz training service implementation."""
 
+import asyncio
 import logging
+import multiprocessing
 import os
+import signal
+import threading
+import time
+from collections import OrderedDict, defaultdict
 from concurrent import futures
-from typing import Dict, Optional
-import json
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 
 import grpc
-import torch
-import pytorch_lightning as pl
-from mashumaro import DataClassDictMixin
 from dataclasses import dataclass
-import wandb
 from pathlib import Path
 
-from boltz_service.data.module.training import BoltzTrainingDataModule
-from boltz_service.model.model import BoltzModel
+# torch, pytorch_lightning, wandb and the model are imported where they are
+# used: training runs in worker processes, and importing them here would
+# add seconds to server startup
 
 # Generated proto code
 from boltz_service.protos import training_service_pb2
 from boltz_service.protos import training_service_pb2_grpc
 from boltz_service.protos import common_pb2
+from boltz_service.config.base import (
+    DATACLASS_SLOTS,
+    NetworkConfig,
+)
 from boltz_service.data.types import ServiceConfig
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class TrainingJob(DataClassDictMixin):
+@dataclass(**DATACLASS_SLOTS)
+class TrainingJob:
     """Training job dataclass."""
 
     job_id: str
@@ -47,6 +53,158 @@ class TrainingJob(DataClassDictMixin):
     error_message: Optional[str] = None
 
 
+# Status updates from worker processes, set by _init_worker
+_updates = None
+
+# Statuses after which late updates from a worker are ignored
+_FINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# How long a built status response is reused for polling clients
+_STATUS_TTL_S = 0.25
+
+# Trainer arguments set by the service that hyperparameters may not override
+_TRAINER_ARGS = frozenset(
+    {"default_root_dir", "devices", "accelerator", "strategy", "callbacks"}
+)
+
+
+def _init_worker(updates, worker_pids):
+    """Install the status queue in a training worker process.
+
+    The worker also registers its PID so the service can stop it on
+    shutdown.
+    """
+    global _updates
+    _updates = updates
+    worker_pids.append(os.getpid())
+
+
+def _run_job(train, job: TrainingJob, cancelled) -> Optional[str]:
+    """Run ``train`` in a worker unless the job was cancelled meanwhile.
+
+    The pool hands jobs to its call queue before a worker is free, after
+    which their futures can no longer be cancelled; such jobs are skipped
+    here instead.
+
+    Parameters
+    ----------
+    train : callable
+        Training function, called as ``train(job, cancelled)``
+    job : TrainingJob
+        Training job
+    cancelled : multiprocessing.Event
+        Set by the service to cancel the job
+
+    Returns
+    -------
+    Optional[str]
+        Path to the best checkpoint, or None if the job never started
+    """
+    if cancelled.is_set():
+        return None
+    return train(job, cancelled)
+
+
+def _run_training(job: TrainingJob, cancelled) -> str:
+    """Execute a training job in a worker process.
+
+    Parameters
+    ----------
+    job : TrainingJob
+        Training job, pickled once into the worker
+    cancelled : multiprocessing.Event
+        Set by the service to stop training after the current step
+
+    Returns
+    -------
+    str
+        Path to the best checkpoint
+    """
+    import pytorch_lightning as pl
+    import torch
+    import wandb
+    from pytorch_lightning.plugins.io import AsyncCheckpointIO
+    from pytorch_lightning.strategies import DDPStrategy
+
+    from boltz_service.data.module.training import BoltzTrainingDataModule
+    from boltz_service.model.model import BoltzModel
+    from boltz_service.services.callbacks import (
+        CancelCallback,
+        CompileCallback,
+        StatusCallback,
+    )
+
+    _updates.put((job.job_id, {"status": "running"}))
+
+    # Let matmuls that stay in FP32 under autocast use TF32
+    torch.set_float32_matmul_precision("high")
+    # Ampere and newer train in bf16 with a compiled model; older GPUs use
+    # fp16 AMP in eager mode
+    ampere = (
+        torch.cuda.is_available() and torch.cuda.get_device_capability()[0] >= 8
+    )
+
+    # Initialize wandb
+    wandb.init(
+        project="boltz", name=job.experiment_name, config=job.hyperparameters
+    )
+    try:
+        # Create data module
+        datamodule = BoltzTrainingDataModule(cfg=job.hyperparameters)
+
+        # Create or load model
+        if job.resume and job.checkpoint:
+            model = BoltzModel.load_from_checkpoint(
+                job.checkpoint, **job.hyperparameters
+            )
+        else:
+            model = BoltzModel(**job.hyperparameters)
+        callbacks = [StatusCallback(job.job_id, _updates), CancelCallback(cancelled)]
+        if ampere:
+            # Compiled in place on each rank; a compiled wrapper does not
+            # survive pickling into spawned DDP ranks
+            callbacks.append(CompileCallback(fullgraph=False))
+
+        # Create trainer. Multi-GPU jobs run NCCL DDP, overlapping gradient
+        # all-reduce with backward; ranks are spawned from this worker
+        # rather than forked from it or re-launched from its command line.
+        if job.num_gpus > 1:
+            strategy = DDPStrategy(
+                start_method="spawn",
+                process_group_backend="nccl",
+                find_unused_parameters=False,
+                static_graph=False,
+                gradient_as_bucket_view=True,
+            )
+        else:
+            strategy = "auto"
+        trainer = pl.Trainer(
+            default_root_dir=job.output_dir,
+            devices=job.num_gpus,
+            accelerator="gpu",
+            strategy=strategy,
+            callbacks=callbacks,
+            **{
+                "precision": "bf16-mixed" if ampere else "16-mixed",
+                # Snapshot checkpoints on the device and write them from a
+                # background thread instead of stalling every epoch end;
+                # pending writes are flushed when fit() tears down
+                "plugins": [AsyncCheckpointIO()],
+                **{
+                    key: value for key, value in job.hyperparameters.items()
+                    if key not in _TRAINER_ARGS
+                },
+            },
+        )
+
+        # Start training
+        trainer.fit(model, datamodule)
+        return trainer.checkpoint_callback.best_model_path
+
+    finally:
+        wandb.finish()
+
+
 class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
     """Training service implementation."""
 
@@ -62,15 +220,60 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
         self.checkpoint_path = config.checkpoint_path
         self.model_path = config.model_path
 
-        # Training job queue
-        self.jobs: Dict[str, TrainingJob] = {}
-        # Current running job
-        self.current_job: Optional[str] = None
+        # Training job queue. Handlers, the update thread and completion
+        # callbacks all touch jobs, so every access goes through the lock;
+        # history is capped by evicting the oldest finished jobs.
+        self.jobs: "OrderedDict[str, TrainingJob]" = OrderedDict()
+        self._jobs_lock = threading.RLock()
+        self.max_jobs = max(1, getattr(config, "max_jobs", 10000))
+        # job_id -> (built at, response); dropped whenever the job changes
+        self._status_cache: Dict[
+            str, Tuple[float, training_service_pb2.TrainingJobStatusResponse]
+        ] = {}
+        # job_id -> (loop, event) of each open status stream
+        self._status_waiters: Dict[
+            str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+        ] = defaultdict(list)
+        # job_id -> (future, cancel event) of every job not yet finished,
+        # and the IDs of the jobs a worker is running
+        self._pending: Dict[str, Tuple[futures.Future, object]] = {}
+        self._active: Set[str] = set()
+        # (checkpoint path, mtime) -> loaded model, so repeated exports of a
+        # checkpoint skip reading and rebuilding it
+        self._model_cache: "OrderedDict[Tuple[str, float], object]" = OrderedDict()
+        self._model_cache_max = 2
+        self._model_cache_lock = threading.Lock()
+        # Exports are CPU-heavy tracing jobs; run them one at a time on their
+        # own thread so they cannot tie up the shared default executor
+        self._export_pool = futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="boltz-export"
+        )
+
+        # Training runs in spawned worker processes so it neither holds the
+        # server's GIL nor inherits its CUDA/gRPC state. Workers report
+        # progress over a queue drained by a background thread. Jobs beyond
+        # max_training_jobs queue rather than share the GPUs.
+        mp_context = multiprocessing.get_context("spawn")
+        self._updates = mp_context.Queue()
+        # Cancel events are manager proxies: unlike plain mp events they can
+        # be sent with a job and passed on to the job's DDP ranks
+        self._manager = mp_context.Manager()
+        self._worker_pids = self._manager.list()
+        self._train_pool = futures.ProcessPoolExecutor(
+            max_workers=max(1, getattr(config, "max_training_jobs", 1)),
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self._updates, self._worker_pids),
+        )
+        self._updates_thread = threading.Thread(
+            target=self._drain_updates, name="boltz-train-updates", daemon=True
+        )
+        self._updates_thread.start()
 
-    def StartTraining(
+    async def StartTraining(
         self,
         request: training_service_pb2.TrainingRequest,
-        context: grpc.ServicerContext,
+        context: grpc.aio.ServicerContext,
     ) -> training_service_pb2.TrainingResponse:
         """Start a training job.
 
@@ -78,7 +281,7 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
         ----------
         request : TrainingRequest
             Training request containing job configuration
-        context : grpc.ServicerContext
+        context : grpc.aio.ServicerContext
             gRPC context
 
         Returns
@@ -86,32 +289,36 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
         TrainingResponse
             Response containing job status
         """
-        # Check if job already exists
-        if request.job_id in self.jobs:
-            context.set_code(grpc.StatusCode.ALREADY_EXISTS)
-            context.set_details(f"Job {request.job_id} already exists")
-            return training_service_pb2.TrainingResponse(
-                job_id=request.job_id,
-                status="failed",
-                error_message="Job already exists",
-            )
-
         # Create job
         job = TrainingJob(
             job_id=request.job_id,
             config_path=request.config_path,
-            args=request.args,
+            args=list(request.args),
             num_gpus=request.num_gpus,
             output_dir=request.output_dir,
             resume=request.resume,
             checkpoint=request.checkpoint,
             experiment_name=request.experiment_name,
+            # The proto map cannot be pickled into the worker, so this is
+            # the one copy; the worker uses it as is
             hyperparameters=dict(request.hyperparameters),
         )
-        self.jobs[job.job_id] = job
+
+        # Check if job already exists
+        if not self._add_job(job):
+            context.set_code(grpc.StatusCode.ALREADY_EXISTS)
+            context.set_details(f"Job {request.job_id} already exists")
+            return training_service_pb2.TrainingResponse(
+                job_id=request.job_id,
+                status="failed",
+                error_message="Job already exists",
+            )
 
         # Execute training asynchronously
-        future = self._train_async(job)
+        cancelled = self._manager.Event()
+        future = self._train_async(job, cancelled)
+        with self._jobs_lock:
+            self._pending[job.job_id] = (future, cancelled)
         future.add_done_callback(
             lambda f: self._handle_training_complete(job.job_id, f)
         )
@@ -120,10 +327,10 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
             job_id=job.job_id, status="started"
         )
 
-    def GetTrainingStatus(
+    async def GetJobStatus(
         self,
         request: common_pb2.JobStatusRequest,
-        context: grpc.ServicerContext,
+        context: grpc.aio.ServicerContext,
     ) -> training_service_pb2.TrainingJobStatusResponse:
         """Get training job status.
 
@@ -131,7 +338,7 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
         ----------
         request : JobStatusRequest
             Request containing job ID
-        context : grpc.ServicerContext
+        context : grpc.aio.ServicerContext
             gRPC context
 
         Returns
@@ -139,12 +346,85 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
         TrainingJobStatusResponse
             Response containing training status
         """
-        job = self.jobs.get(request.job_id)
-        if not job:
-            context.set_code(grpc.StatusCode.NOT_FOUND)
-            context.set_details(f"Job {request.job_id} not found")
-            return training_service_pb2.TrainingJobStatusResponse()
+        # Polling clients within the TTL share one response
+        now = time.monotonic()
+        cached = self._status_cache.get(request.job_id)
+        if cached is not None and now - cached[0] < _STATUS_TTL_S:
+            return cached[1]
+
+        with self._jobs_lock:
+            job = self.jobs.get(request.job_id)
+            if not job:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(f"Job {request.job_id} not found")
+                return training_service_pb2.TrainingJobStatusResponse()
+
+            response = self._status_response(job)
+            self._status_cache[job.job_id] = (now, response)
+        return response
+
+    # Name used before the handler matched the proto's GetJobStatus RPC
+    GetTrainingStatus = GetJobStatus
+
+    async def StreamTrainingStatus(
+        self,
+        request: common_pb2.JobStatusRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[training_service_pb2.TrainingJobStatusResponse]:
+        """Stream training job status until the job finishes.
+
+        Sends the current status immediately and then one message per
+        change, replacing client-side polling of the job status.
 
+        Parameters
+        ----------
+        request : JobStatusRequest
+            Request containing job ID
+        context : grpc.aio.ServicerContext
+            gRPC context
+
+        Yields
+        ------
+        TrainingJobStatusResponse
+            Training status after each change
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._jobs_lock:
+            known = request.job_id in self.jobs
+            if known:
+                self._status_waiters[request.job_id].append(waiter)
+        if not known:
+            await context.abort(
+                grpc.StatusCode.NOT_FOUND, f"Job {request.job_id} not found"
+            )
+            return
+
+        try:
+            while True:
+                # Clear before reading so a change made meanwhile is not lost
+                waiter[1].clear()
+                with self._jobs_lock:
+                    job = self.jobs.get(request.job_id)
+                    if job is None:
+                        return
+                    response = self._status_response(job)
+                    finished = job.status in _FINAL_STATUSES
+                yield response
+                if finished:
+                    return
+                await waiter[1].wait()
+        finally:
+            with self._jobs_lock:
+                waiters = self._status_waiters.get(request.job_id)
+                if waiters is not None:
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del self._status_waiters[request.job_id]
+
+    def _status_response(
+        self, job: TrainingJob
+    ) -> training_service_pb2.TrainingJobStatusResponse:
+        """Build the status response of a job; call with the lock held."""
         # Build base status response
         base_status = common_pb2.JobStatusResponse(
             job_id=job.job_id, status=job.status, error_message=job.error_message
@@ -157,49 +437,57 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
             val_loss=job.val_loss,
             train_loss=job.train_loss,
             checkpoint_path=job.checkpoint_path,
-            error_message=job.error_message,
         )
 
-    def CancelJob(
+    async def CancelJob(
         self,
         request: common_pb2.CancelJobRequest,
-        context: grpc.ServicerContext,
-    ) -> training_service_pb2.TrainingResponse:
-        """Cancel a training job.
+        context: grpc.aio.ServicerContext,
+    ) -> common_pb2.CancelJobResponse:
+        """Cancel a queued or running training job.
+
+        A queued job is dropped from the pool. A running job is signalled
+        and stops after its current training step, freeing its worker; the
+        checkpoint written so far is still recorded.
 
         Parameters
         ----------
         request : CancelJobRequest
             Request containing job ID to cancel
-        context : grpc.ServicerContext
+        context : grpc.aio.ServicerContext
             gRPC context
 
         Returns
         -------
-        TrainingResponse
+        CancelJobResponse
             Response containing cancellation status
         """
-        if not self.current_job or request.job_id != self.current_job:
-            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
-            context.set_details("No active job to cancel")
-            return training_service_pb2.TrainingResponse(
-                job_id=request.job_id,
-                status="failed",
-                error_message="No active job to cancel",
-            )
+        with self._jobs_lock:
+            pending = self._pending.get(request.job_id)
+            if pending is None:
+                context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+                context.set_details("No active job to cancel")
+                return common_pb2.CancelJobResponse(
+                    job_id=request.job_id,
+                    status="failed",
+                    error_message="No active job to cancel",
+                )
+            self._update_job(request.job_id, status="cancelled")
+            running = request.job_id in self._active
 
-        # Stop training
-        job = self.jobs[request.job_id]
-        job.status = "cancelled"
+        # Queued jobs are dropped from the pool; running ones are signalled
+        future, cancelled = pending
+        if running or not future.cancel():
+            cancelled.set()
 
-        return training_service_pb2.TrainingResponse(
+        return common_pb2.CancelJobResponse(
             job_id=request.job_id, status="cancelled"
         )
 
-    def ExportModel(
+    async def ExportModel(
         self,
         request: training_service_pb2.ExportModelRequest,
-        context: grpc.ServicerContext,
+        context: grpc.aio.ServicerContext,
     ) -> training_service_pb2.ExportModelResponse:
         """Export a trained model.
 
@@ -207,7 +495,7 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
         ----------
         request : ExportModelRequest
             Request containing export configuration
-        context : grpc.ServicerContext
+        context : grpc.aio.ServicerContext
             gRPC context
 
         Returns
@@ -215,7 +503,9 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
         ExportModelResponse
             Response containing export status and path
         """
-        job = self.jobs.get(request.job_id)
+        with self._jobs_lock:
+            job = self.jobs.get(request.job_id)
+            checkpoint_path = job.checkpoint_path if job else None
         if not job:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details(f"Job {request.job_id} not found")
@@ -224,7 +514,7 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
             )
 
         # Check if checkpoint exists
-        if not job.checkpoint_path:
+        if not checkpoint_path:
             context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
             context.set_details("No checkpoint available")
             return training_service_pb2.ExportModelResponse(
@@ -233,27 +523,22 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
                 error_message="No checkpoint available",
             )
 
-        try:
-            # Load model
-            model = BoltzModel.load_from_checkpoint(job.checkpoint_path)
+        if request.format not in ("onnx", "torchscript"):
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"Unsupported format: {request.format}")
+            return training_service_pb2.ExportModelResponse(
+                job_id=request.job_id,
+                status="failed",
+                error_message=f"Unsupported format: {request.format}",
+            )
 
-            # Export model
+        try:
+            # Loading and exporting block for a long time, so keep them off
+            # the event loop
             output_path = Path(request.output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Export based on format
-            if request.format == "onnx":
-                model.to_onnx(output_path)
-            elif request.format == "torchscript":
-                model.to_torchscript(output_path)
-            else:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details(f"Unsupported format: {request.format}")
-                return training_service_pb2.ExportModelResponse(
-                    job_id=request.job_id,
-                    status="failed",
-                    error_message=f"Unsupported format: {request.format}",
-                )
+            await asyncio.wrap_future(self._export_pool.submit(
+                self._export_model, checkpoint_path, request.format, output_path
+            ))
 
             return training_service_pb2.ExportModelResponse(
                 job_id=request.job_id, status="success", model_path=str(output_path)
@@ -266,109 +551,177 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
                 job_id=request.job_id, status="failed", error_message=str(e)
             )
 
-    def _train_async(self, job: TrainingJob) -> futures.Future:
-        """Execute training asynchronously.
+    def _export_model(self, checkpoint_path: str, format: str, output_path: Path):
+        """Load a checkpoint and export it.
 
         Parameters
         ----------
-        job : TrainingJob
-            Training job to execute
-
-        Returns
-        -------
-        futures.Future
-            Future for the training task
+        checkpoint_path : str
+            Checkpoint to export
+        format : str
+            Export format, "onnx" or "torchscript"
+        output_path : Path
+            Destination of the exported model
         """
-        thread = futures.ThreadPoolExecutor(max_workers=1)
-        future = thread.submit(self._train, job)
-        return future
+        import torch
+
+        model = self._load_checkpoint(checkpoint_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with torch.no_grad():
+            if format == "onnx":
+                model.to_onnx(output_path)
+            else:
+                model.to_torchscript(output_path)
 
-    def _train(self, job: TrainingJob):
-        """Execute training.
+    def _load_checkpoint(self, checkpoint_path: str):
+        """Load a checkpoint, reusing the model while the file is unchanged.
 
         Parameters
         ----------
-        job : TrainingJob
-            Training job to execute
-        """
-        try:
-            # Set current job
-            self.current_job = job.job_id
-            job.status = "running"
+        checkpoint_path : str
+            Checkpoint to load
 
-            # Initialize wandb
-            wandb.init(
-                project="boltz", name=job.experiment_name, config=job.hyperparameters
-            )
+        Returns
+        -------
+        BoltzModel
+            Model in eval mode
+        """
+        from boltz_service.model.model import BoltzModel
 
-            # Create data module
-            datamodule = BoltzTrainingDataModule(cfg=job.hyperparameters)
+        key = (checkpoint_path, os.stat(checkpoint_path).st_mtime)
+        with self._model_cache_lock:
+            model = self._model_cache.get(key)
+            if model is not None:
+                self._model_cache.move_to_end(key)
+                return model
 
-            # Create or load model
-            if job.resume and job.checkpoint:
-                model = BoltzModel.load_from_checkpoint(
-                    job.checkpoint, **job.hyperparameters
-                )
-            else:
-                model = BoltzModel(**job.hyperparameters)
-
-            # Create trainer
-            trainer = pl.Trainer(
-                default_root_dir=job.output_dir,
-                devices=job.num_gpus,
-                accelerator="gpu",
-                callbacks=[self._create_status_callback(job)],
-                **job.hyperparameters,
-            )
+            model = BoltzModel.load_from_checkpoint(checkpoint_path, map_location="cpu")
+            model.eval()
+            self._model_cache[key] = model
+            while len(self._model_cache) > self._model_cache_max:
+                self._model_cache.popitem(last=False)
+            return model
 
-            # Start training
-            trainer.fit(model, datamodule)
+    def _add_job(self, job: TrainingJob) -> bool:
+        """Register a new job, evicting the oldest finished jobs if full.
 
-            # Update status
-            job.status = "completed"
-            job.checkpoint_path = trainer.checkpoint_callback.best_model_path
+        Parameters
+        ----------
+        job : TrainingJob
+            Job to register
 
-        except Exception as e:
-            logger.exception("Training failed")
-            job.status = "failed"
-            job.error_message = str(e)
-            raise
+        Returns
+        -------
+        bool
+            False if a job with the same ID already exists
+        """
+        with self._jobs_lock:
+            if job.job_id in self.jobs:
+                return False
+            self.jobs[job.job_id] = job
+            if len(self.jobs) > self.max_jobs:
+                finished = [
+                    job_id for job_id, old in self.jobs.items()
+                    if old.status in _FINAL_STATUSES
+                ]
+                for job_id in finished[:len(self.jobs) - self.max_jobs]:
+                    del self.jobs[job_id]
+                    self._status_cache.pop(job_id, None)
+            return True
+
+    def _update_job(self, job_id: str, **fields) -> Optional[TrainingJob]:
+        """Update fields of a job and drop its cached status.
 
-        finally:
-            # Clean up current job
-            if self.current_job == job.job_id:
-                self.current_job = None
-            wandb.finish()
+        Parameters
+        ----------
+        job_id : str
+            Job identifier
+        **fields
+            Field values to set
 
-    def _create_status_callback(self, job: TrainingJob):
-        """Create status update callback.
+        Returns
+        -------
+        Optional[TrainingJob]
+            The updated job, or None if it is unknown
+        """
+        with self._jobs_lock:
+            job = self.jobs.get(job_id)
+            if job is not None:
+                for name, value in fields.items():
+                    setattr(job, name, value)
+                self._status_cache.pop(job_id, None)
+                # Wake open status streams on their own event loops
+                for loop, event in self._status_waiters.get(job_id, ()):
+                    try:
+                        loop.call_soon_threadsafe(event.set)
+                    except RuntimeError:
+                        pass  # Loop already closed
+            return job
+
+    def _train_async(self, job: TrainingJob, cancelled) -> futures.Future:
+        """Execute training asynchronously.
 
         Parameters
         ----------
         job : TrainingJob
-            Training job to update
+            Training job to execute
+        cancelled : multiprocessing.Event
+            Event that stops the job once set
 
         Returns
         -------
-        pl.Callback
-            PyTorch Lightning callback for status updates
+        futures.Future
+            Future resolving to the best checkpoint path
         """
-
-        class StatusCallback(pl.Callback):
-            def on_train_epoch_end(self, trainer, pl_module):
-                job.current_epoch = trainer.current_epoch
-                job.train_loss = float(
-                    trainer.callback_metrics.get("train_loss", float("inf"))
-                )
-                job.val_loss = float(
-                    trainer.callback_metrics.get("val_loss", float("inf"))
-                )
-
-            def on_exception(self, trainer, pl_module, exception):
-                job.status = "failed"
-                job.error_message = str(exception)
-
-        return StatusCallback()
+        return self._train_pool.submit(_run_job, _run_training, job, cancelled)
+
+    def shutdown(self):
+        """Stop training and export jobs.
+
+        Queued jobs are cancelled and the training workers are terminated: a
+        job can take hours, and the executor's exit hook would otherwise
+        keep the server from exiting until it finished. Every worker
+        registers before taking a job, and a worker still starting skips its
+        job once the job's cancel event is set; once one worker is killed
+        the pool stops the rest too. DDP ranks spawned by a worker are sent
+        SIGINT by torch when it dies.
+        """
+        with self._jobs_lock:
+            for job in self.jobs.values():
+                if job.status not in _FINAL_STATUSES:
+                    self._update_job(job.job_id, status="cancelled")
+            for _, cancelled in self._pending.values():
+                cancelled.set()
+        for pid in list(self._worker_pids):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        # Returns once the pool has reaped the killed workers
+        self._train_pool.shutdown(wait=True, cancel_futures=True)
+        self._export_pool.shutdown(wait=False, cancel_futures=True)
+        self._updates.put(None)
+        self._updates_thread.join()
+        self._manager.shutdown()
+
+    def _drain_updates(self):
+        """Apply status updates sent by training workers."""
+        while True:
+            update = self._updates.get()
+            if update is None:
+                break
+            job_id, changes = update
+            with self._jobs_lock:
+                job = self.jobs.get(job_id)
+                if job is None:
+                    continue
+                # Updates can arrive after the job's future resolved; keep
+                # the final status but still record the last metrics
+                if job.status in _FINAL_STATUSES:
+                    changes.pop("status", None)
+                self._update_job(job_id, **changes)
+                if job.status == "running":
+                    self._active.add(job_id)
 
     def _handle_training_complete(self, job_id: str, future: futures.Future):
         """Handle training completion callback.
@@ -380,18 +733,37 @@ class TrainingService(training_service_pb2_grpc.TrainingServiceServicer):
         future : futures.Future
             Completed future
         """
-        try:
-            future.result()
-        except Exception as e:
-            logger.exception("Training failed")
+        # Workers cannot touch the job table, so this is the one place the
+        # final status is recorded
+        error = None if future.cancelled() else future.exception()
+
+        with self._jobs_lock:
+            self._pending.pop(job_id, None)
+            self._active.discard(job_id)
             job = self.jobs.get(job_id)
-            if job:
-                job.status = "failed"
-                job.error_message = str(e)
+            if job is None:
+                return
+            if job.status == "cancelled":
+                # A cancelled job that stopped cleanly still leaves its last
+                # checkpoint. One whose worker was killed on shutdown ends
+                # with BrokenProcessPool, which is not a failure.
+                if error is None and not future.cancelled() and future.result():
+                    self._update_job(job_id, checkpoint_path=future.result())
+                return
+            if error is not None:
+                logger.error(f"Training job {job_id} failed", exc_info=error)
+            if future.cancelled():
+                self._update_job(job_id, status="cancelled")
+            elif error is not None:
+                self._update_job(job_id, status="failed", error_message=str(error))
+            else:
+                self._update_job(
+                    job_id, status="completed", checkpoint_path=future.result()
+                )
 
 
-def serve(port: int, config: ServiceConfig):
-    """Start the training service.
+async def _serve(port: int, config: ServiceConfig):
+    """Run the training service until terminated.
 
     Parameters
     ----------
@@ -400,10 +772,33 @@ def serve(port: int, config: ServiceConfig):
     config : ServiceConfig
         Service configuration
     """
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    network = NetworkConfig()
+    server = grpc.aio.server(
+        migration_thread_pool=network.worker_pool(),
+        maximum_concurrent_rpcs=network.max_concurrent_rpcs,
+        options=network.grpc_options(),
+    )
+    service = TrainingService(config=config)
     training_service_pb2_grpc.add_TrainingServiceServicer_to_server(
-        TrainingService(config=config), server
+        service, server
     )
     server.add_insecure_port(f"[::]:{port}")
-    server.start()
-    server.wait_for_termination()
+    await server.start()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(grace=5)
+        service.shutdown()
+
+
+def serve(port: int, config: ServiceConfig):
+    """Start the training service.
+
+    Parameters
+    ----------
+    port : int
+        Port to listen on
+    config : ServiceConfig
+        Service configuration
+    """
+    asyncio.run(_serve(port, config))
@@ -1,29 +1,62 @@
 import os
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Iterable, Optional, Dict
 
 import redis
 import sqlite3
 
+# 单条语句的参数个数上限低于SQLite默认的999
+_MAX_VARIABLES = 900
+
+_SELECT_ONE = "SELECT taxonomy_id FROM taxonomy WHERE uniref_id = ?"
+
 class TaxonomyDB:
-    """分类数据库接口"""
+    """分类数据库接口
+    
+    路径以 ``.lmdb`` 结尾时使用只读mmap的LMDB（需安装可选依赖 ``lmdb``，
+    由 :func:`build_taxonomy_lmdb` 生成），值为4字节大端整数分类ID；
+    否则使用SQLite。两种后端返回的分类ID均为 ``int``。
+    """
     
     def __init__(self, db_path: str):
         self.db_path = db_path
         self._conn = None
+        self._env = None
         
     def connect(self):
         """连接到数据库"""
+        if str(self.db_path).endswith(".lmdb"):
+            if self._env is None:
+                import lmdb
+                
+                self._env = lmdb.open(
+                    str(self.db_path),
+                    subdir=False,
+                    readonly=True,
+                    lock=False,
+                    readahead=False,
+                )
+            return
         if self._conn is None:
             self._conn = sqlite3.connect(self.db_path)
+            # 只读访问：通过mmap读取、加大页缓存，临时表放在内存中
+            self._conn.executescript(
+                "PRAGMA query_only = 1;"
+                "PRAGMA mmap_size = 30000000000;"
+                "PRAGMA cache_size = -262144;"
+                "PRAGMA temp_store = MEMORY;"
+            )
             
     def close(self):
         """关闭数据库连接"""
         if self._conn is not None:
             self._conn.close()
             self._conn = None
+        if self._env is not None:
+            self._env.close()
+            self._env = None
             
-    def get(self, uniref_id: str) -> Optional[str]:
+    def get(self, uniref_id: str) -> Optional[int]:
         """获取分类ID
         
         Parameters
@@ -33,20 +66,103 @@ class TaxonomyDB:
             
         Returns
         -------
-        str or None
+        int or None
             分类ID，如果不存在则返回None
             
         """
-        if self._conn is None:
+        if self._conn is None and self._env is None:
             self.connect()
             
-        cursor = self._conn.cursor()
-        cursor.execute(
-            "SELECT taxonomy_id FROM taxonomy WHERE uniref_id = ?",
-            (uniref_id,)
+        if self._env is not None:
+            with self._env.begin(buffers=True) as txn:
+                value = txn.get(uniref_id.encode())
+                return None if value is None else int.from_bytes(value, "big")
+            
+        result = self._conn.execute(_SELECT_ONE, (uniref_id,)).fetchone()
+        return int(result[0]) if result else None
+        
+    def get_many(self, uniref_ids: Iterable[str]) -> Dict[str, int]:
+        """批量获取分类ID，每条查询最多包含900个ID
+        
+        Parameters
+        ----------
+        uniref_ids : Iterable[str]
+            UniRef ID
+            
+        Returns
+        -------
+        dict[str, int]
+            UniRef ID -> 分类ID，不存在的ID不包含在内
+            
+        """
+        if self._conn is None and self._env is None:
+            self.connect()
+            
+        ids = list(dict.fromkeys(uniref_ids))
+        found = {}
+        if self._env is not None:
+            with self._env.begin(buffers=True) as txn:
+                for uniref_id in ids:
+                    value = txn.get(uniref_id.encode())
+                    if value is not None:
+                        found[uniref_id] = int.from_bytes(value, "big")
+            return found
+            
+        for start in range(0, len(ids), _MAX_VARIABLES):
+            chunk = ids[start:start + _MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(
+                (uniref_id, int(taxonomy_id))
+                for uniref_id, taxonomy_id in self._conn.execute(
+                    "SELECT uniref_id, taxonomy_id FROM taxonomy "
+                    f"WHERE uniref_id IN ({placeholders})",
+                    chunk
+                )
+            )
+        return found
+
+def build_taxonomy_lmdb(sqlite_path: str, lmdb_path: str) -> int:
+    """由SQLite分类数据库离线生成LMDB文件
+    
+    Parameters
+    ----------
+    sqlite_path : str
+        SQLite数据库路径
+    lmdb_path : str
+        输出的LMDB文件路径，应以 ``.lmdb`` 结尾
+        
+    Returns
+    -------
+    int
+        写入的条目数
+        
+    """
+    import lmdb
+    
+    conn = sqlite3.connect(sqlite_path)
+    try:
+        (count,) = conn.execute("SELECT COUNT(*) FROM taxonomy").fetchone()
+        # append=True要求键严格按LMDB的字节序递增；显式指定BINARY排序规则
+        # （UTF-8下即memcmp），不受列上声明的排序规则影响
+        rows = conn.execute(
+            "SELECT uniref_id, taxonomy_id FROM taxonomy "
+            "ORDER BY uniref_id COLLATE BINARY"
+        )
+        env = lmdb.open(
+            lmdb_path, subdir=False, map_size=count * 128 + (64 << 20)
         )
-        result = cursor.fetchone()
-        return result[0] if result else None
+        try:
+            with env.begin(write=True) as txn:
+                txn.cursor().putmulti(
+                    ((uniref_id.encode(), int(taxonomy_id).to_bytes(4, "big"))
+                     for uniref_id, taxonomy_id in rows),
+                    append=True,
+                )
+        finally:
+            env.close()
+    finally:
+        conn.close()
+    return count
 
 class RedisCache:
     """Redis缓存接口"""
@@ -5,6 +5,16 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+# BFD文件MD5
+BFD_MD5 = {
+    "ffindex": "476941cf4a964d96fb3b68a82fe734d1",
+    "ffdata": "2dc0f09adabbcf1965ed578e0b2ab07e",
+    "cs219_index": "26d48869efdb50d036e2fb9056a0ae9d",
+    "cs219_data": "4bb63ac9c3a3dd088cf654df1f548d53", 
+    "hhm_index": "799f308b20627088129847709f1abed6",
+    "hhm_data": "9bd2da8a8adbcc30801f0221d0dc1987"
+}
+
 @dataclass
 class BFDConfig:
     """BFD数据库配置"""
@@ -53,16 +63,6 @@ class BFDConfig:
             "hhm_data": f"{base}_hhm.ffdata"
         }
         
-        # 验证文件MD5
-        expected_md5 = {
-            "ffindex": "476941cf4a964d96fb3b68a82fe734d1",
-            "ffdata": "2dc0f09adabbcf1965ed578e0b2ab07e",
-            "cs219_index": "26d48869efdb50d036e2fb9056a0ae9d",
-            "cs219_data": "4bb63ac9c3a3dd088cf654df1f548d53", 
-            "hhm_index": "799f308b20627088129847709f1abed6",
-            "hhm_data": "9bd2da8a8adbcc30801f0221d0dc1987"
-        }
-        
         files = {}
         for key, filename in required_files.items():
             path = db_path / filename
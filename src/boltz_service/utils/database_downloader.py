@@ -1,17 +1,21 @@
 """Database downloader utilities"""
 
 import hashlib
+import mmap
 import os
+import queue
 import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
 from tqdm import tqdm
 
-from boltz_service.utils.database_config import BFDConfig, DatabaseConfig
+from boltz_service.utils.database_config import BFD_MD5, BFDConfig, DatabaseConfig
 
 # BFD database URLs
 BFD_BASE_URL = "http://wwwuser.gwdg.de/~compbiol/uniclust/2018_08/bfd_metaclust_clu_complete_id30_c90_final_seq.sorted_opt"
@@ -24,6 +28,13 @@ BFD_FILES = {
     "hhm_data": "_hhm.ffdata"
 }
 
+# Download chunk size; large enough for hashing to release the GIL
+CHUNK_SIZE = 1024 * 1024
+
+# Parallel Range requests per file, and the smallest file worth splitting
+RANGE_CONNECTIONS = 8
+MIN_RANGED_SIZE = 64 * CHUNK_SIZE
+
 def calculate_md5(file_path: Path) -> str:
     """Calculate MD5 hash of a file
     
@@ -39,14 +50,101 @@ def calculate_md5(file_path: Path) -> str:
     """
     md5_hash = hashlib.md5()
     with open(file_path, "rb") as f:
-        # Read in chunks to handle large files
-        for chunk in iter(lambda: f.read(4096), b""):
-            md5_hash.update(chunk)
+        if os.fstat(f.fileno()).st_size == 0:
+            return md5_hash.hexdigest()
+        # Hash straight from the page cache without copying into Python buffers
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            md5_hash.update(mm)
     return md5_hash.hexdigest()
 
-def download_file(url: str, target_path: Path, desc: str = None) -> None:
+def _hash_chunks(md5_hash, chunks: queue.SimpleQueue) -> None:
+    """Feed queued chunks into ``md5_hash`` until a ``None`` sentinel."""
+    while True:
+        chunk = chunks.get()
+        if chunk is None:
+            return
+        md5_hash.update(chunk)
+
+def _session() -> requests.Session:
+    """Return a session whose pool keeps one connection per range alive."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=1, pool_maxsize=RANGE_CONNECTIONS
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def _probe(session: requests.Session, url: str) -> Tuple[int, bool]:
+    """Return the size of ``url`` and whether it serves byte ranges."""
+    response = session.head(url, allow_redirects=True)
+    response.raise_for_status()
+    size = int(response.headers.get("content-length", 0))
+    return size, response.headers.get("accept-ranges", "").lower() == "bytes"
+
+def _download_range(
+    session: requests.Session,
+    url: str,
+    fd: int,
+    start: int,
+    end: int,
+    pbar: tqdm,
+    lock: threading.Lock,
+) -> None:
+    """Fetch bytes ``start``..``end`` (inclusive) of ``url`` into ``fd`` in place."""
+    with session.get(
+        url, headers={"Range": f"bytes={start}-{end}"}, stream=True
+    ) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise IOError(f"Server ignored range request for {url}")
+        
+        offset = start
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+            with lock:
+                pbar.update(len(chunk))
+    if offset != end + 1:
+        raise IOError(f"Incomplete range {start}-{end} for {url}")
+
+def _download_ranged(
+    session: requests.Session, url: str, tmp_path: str, size: int, desc: str, position: int
+) -> None:
+    """Download ``url`` into ``tmp_path`` over parallel Range requests."""
+    span = -(-size // RANGE_CONNECTIONS)
+    ranges = [(start, min(start + span, size) - 1) for start in range(0, size, span)]
+    lock = threading.Lock()
+    
+    fd = os.open(tmp_path, os.O_WRONLY)
+    try:
+        # Preallocate so every range lands at its final offset
+        os.ftruncate(fd, size)
+        with tqdm(total=size, unit='iB', unit_scale=True, desc=desc,
+                  position=position) as pbar, \
+                ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            for future in [
+                pool.submit(_download_range, session, url, fd, start, end, pbar, lock)
+                for start, end in ranges
+            ]:
+                future.result()
+    finally:
+        os.close(fd)
+
+def download_file(
+    url: str,
+    target_path: Path,
+    desc: str = None,
+    expected_md5: Optional[str] = None,
+    position: int = 0,
+) -> str:
     """Download file with progress bar
     
+    Large files on servers that accept byte ranges are fetched over
+    ``RANGE_CONNECTIONS`` parallel Range requests written in place, then
+    hashed in one pass. Otherwise the file is streamed and its MD5 is
+    computed on a worker thread while it is written.
+    
     Parameters
     ----------
     url : str
@@ -55,21 +153,81 @@ def download_file(url: str, target_path: Path, desc: str = None) -> None:
         Path to save file to
     desc : str, optional
         Description for progress bar
+    expected_md5 : str, optional
+        If given, the download is discarded unless its MD5 matches
+    position : int, optional
+        Line of the progress bar, for concurrent downloads
+        
+    Returns
+    -------
+    str
+        MD5 hash of the downloaded file
     """
-    response = requests.get(url, stream=True)
-    response.raise_for_status()
-    
+    # One keep-alive session per file: the probe and every range request
+    # reuse pooled connections instead of reconnecting each time
+    with _session() as session:
+        size, ranged = _probe(session, url)
+        if ranged and size >= MIN_RANGED_SIZE and hasattr(os, "pwrite"):
+            with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
+                pass
+            try:
+                _download_ranged(session, url, tmp_file.name, size, desc, position)
+                digest = calculate_md5(Path(tmp_file.name))
+            except BaseException:
+                os.remove(tmp_file.name)
+                raise
+            return _finish_download(url, tmp_file.name, target_path, digest, expected_md5)
+        
+        with session.get(url, stream=True) as response:
+            response.raise_for_status()
+            return _stream_download(response, url, target_path, desc, expected_md5, position)
+
+def _stream_download(
+    response: requests.Response,
+    url: str,
+    target_path: Path,
+    desc: str,
+    expected_md5: Optional[str],
+    position: int,
+) -> str:
+    """Stream ``response`` to a temp file, hashing it on a worker thread."""
     total_size = int(response.headers.get('content-length', 0))
     
-    with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-        with tqdm(total=total_size, unit='iB', unit_scale=True, desc=desc) as pbar:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    tmp_file.write(chunk)
-                    pbar.update(len(chunk))
+    md5_hash = hashlib.md5()
+    chunks = queue.SimpleQueue()
+    hasher = threading.Thread(target=_hash_chunks, args=(md5_hash, chunks), daemon=True)
+    hasher.start()
+    
+    try:
+        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
+            with tqdm(total=total_size, unit='iB', unit_scale=True, desc=desc,
+                      position=position) as pbar:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if chunk:
+                        chunks.put(chunk)
+                        tmp_file.write(chunk)
+                        pbar.update(len(chunk))
+    finally:
+        chunks.put(None)
+        hasher.join()
+    
+    return _finish_download(
+        url, tmp_file.name, target_path, md5_hash.hexdigest(), expected_md5
+    )
+
+def _finish_download(
+    url: str, tmp_path: str, target_path: Path, digest: str, expected_md5: Optional[str]
+) -> str:
+    """Verify a finished download and move it into place."""
+    if expected_md5 and digest != expected_md5:
+        os.remove(tmp_path)
+        raise ValueError(
+            f"MD5 mismatch for {url}: expected {expected_md5}, got {digest}"
+        )
     
     # Move temp file to target path
-    shutil.move(tmp_file.name, target_path)
+    shutil.move(tmp_path, target_path)
+    return digest
 
 def download_bfd(target_dir: Path) -> Optional[BFDConfig]:
     """Download BFD database
@@ -90,15 +248,32 @@ def download_bfd(target_dir: Path) -> Optional[BFDConfig]:
     print(f"Downloading BFD database to {target_dir}")
     
     try:
+        pending = []
         for file_type, suffix in BFD_FILES.items():
             url = f"{BFD_BASE_URL}{suffix}"
             target_path = target_dir / f"bfd_metaclust_clu_complete_id30_c90_final_seq.sorted_opt{suffix}"
             
             if not target_path.exists():
-                print(f"Downloading {file_type}...")
-                download_file(url, target_path, desc=f"Downloading {file_type}")
+                pending.append((file_type, url, target_path))
             else:
                 print(f"File {file_type} already exists, skipping download")
+        
+        # Fetch all missing files at once so the link is never idle
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+                downloads = [
+                    pool.submit(
+                        download_file,
+                        url,
+                        target_path,
+                        desc=f"Downloading {file_type}",
+                        expected_md5=BFD_MD5.get(file_type),
+                        position=position,
+                    )
+                    for position, (file_type, url, target_path) in enumerate(pending)
+                ]
+                for future in as_completed(downloads):
+                    future.result()
                 
         # Verify downloads
         bfd_config = BFDConfig.from_env()
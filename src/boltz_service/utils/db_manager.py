@@ -1,24 +1,99 @@
 """数据库管理工具"""
 
-import hashlib
+import heapq
 import json
 import logging
 import os
 import shutil
-import subprocess
+import tarfile
+import time
 from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import requests
 from tqdm import tqdm
 
 from boltz_service.utils.database_config import BFDConfig, DatabaseConfig
+from boltz_service.utils.database_downloader import calculate_md5
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 数据库配置的缓存时长（秒）
+_CONFIG_TTL = 30
+
+# 决定数据库配置的环境变量
+_CONFIG_ENV = ("BOLTZ_BFD_PATH", "BOLTZ_UNIREF_PATH", "BOLTZ_TAXONOMY_PATH")
+
+@lru_cache(maxsize=1)
+def _cached_env_config(bucket: int, env: tuple) -> DatabaseConfig:
+    """按时间段与环境变量缓存的数据库配置"""
+    return DatabaseConfig.from_env()
+
+def _env_config() -> DatabaseConfig:
+    """获取数据库配置，避免每次调用都检查全部数据库文件
+    
+    Returns
+    -------
+    DatabaseConfig
+        最多 ``_CONFIG_TTL`` 秒前读取的配置，环境变量变化时立即重新读取
+        
+    """
+    return _cached_env_config(
+        int(time.monotonic() // _CONFIG_TTL),
+        tuple(os.getenv(name) for name in _CONFIG_ENV)
+    )
+
+def _file_size(path) -> int:
+    """返回文件大小，文件不存在时返回0"""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+# 流式解压的读取块大小
+_TAR_BUFSIZE = 1024 * 1024
+
+# 支持时只允许解压普通数据文件，拒绝绝对路径与越界链接
+_TAR_EXTRACT_ARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+class _ProgressReader:
+    """包装下载流，读取时更新进度条"""
+    
+    def __init__(self, raw, pbar: tqdm):
+        self._raw = raw
+        self._pbar = pbar
+        
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self._pbar.update(len(data))
+        return data
+
+def _walk_files(root: str) -> Iterator[Tuple[float, str, int]]:
+    """递归遍历目录下的文件，每个文件只调用一次stat
+    
+    Parameters
+    ----------
+    root : str
+        根目录
+        
+    Returns
+    -------
+    Iterator[Tuple[float, str, int]]
+        (修改时间, 路径, 大小)
+        
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                st = entry.stat()
+                yield st.st_mtime, entry.path, st.st_size
+
 class DatabaseManager:
     """数据库管理器"""
     
@@ -74,11 +149,8 @@ class DatabaseManager:
             MD5哈希值
             
         """
-        hash_md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        # 与下载器共用基于 mmap 的实现，避免逐 4 KiB 读取
+        return calculate_md5(Path(file_path))
         
     def download_bfd(self, target_dir: str):
         """下载BFD数据库
@@ -92,36 +164,26 @@ class DatabaseManager:
         target_dir = os.path.expanduser(target_dir)
         os.makedirs(target_dir, exist_ok=True)
         
-        # 下载文件
+        # 边下载边解压，压缩包不落盘
         url = "https://bfd.mmseqs.com/bfd_metaclust_clu_complete_id30_c90_final_seq.sorted_opt.tar.gz"
-        output = os.path.join(target_dir, "bfd.tar.gz")
-        
-        logger.info(f"Downloading BFD database to {output}")
-        response = requests.get(url, stream=True)
-        total_size = int(response.headers.get("content-length", 0))
-        
-        with open(output, "wb") as f, tqdm(
-            total=total_size,
-            unit="iB",
-            unit_scale=True
-        ) as pbar:
-            for data in response.iter_content(chunk_size=1024):
-                size = f.write(data)
-                pbar.update(size)
-                
-        # 解压文件
-        logger.info("Extracting files...")
-        subprocess.run(
-            ["tar", "xzf", output],
-            cwd=target_dir,
-            check=True
-        )
-        
-        # 删除压缩包
-        os.remove(output)
-        
-        # 验证文件
+        
+        logger.info(f"Downloading and extracting BFD database to {target_dir}")
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            total_size = int(response.headers.get("content-length", 0))
+            
+            with tqdm(total=total_size, unit="iB", unit_scale=True) as pbar, \
+                    tarfile.open(
+                        fileobj=_ProgressReader(response.raw, pbar),
+                        mode="r|gz",
+                        bufsize=_TAR_BUFSIZE
+                    ) as archive:
+                archive.extractall(target_dir, **_TAR_EXTRACT_ARGS)
+        
+        # 验证文件；下载改变了文件，缓存的配置作废
         logger.info("Verifying files...")
+        _cached_env_config.cache_clear()
         config = BFDConfig.from_env()
         if not config:
             raise RuntimeError("Failed to verify BFD database")
@@ -141,7 +203,7 @@ class DatabaseManager:
             
         """
         errors = []
-        config = DatabaseConfig.from_env()
+        config = _env_config()
         
         # 检查BFD
         if config.bfd:
@@ -175,26 +237,18 @@ class DatabaseManager:
             return
             
         # 获取所有缓存文件
-        files = []
-        total_size = 0
-        for path in Path(cache_dir).rglob("*"):
-            if path.is_file():
-                size = path.stat().st_size
-                mtime = path.stat().st_mtime
-                files.append((path, size, mtime))
-                total_size += size
+        files = list(_walk_files(cache_dir))
+        total_size = sum(size for _, _, size in files)
                 
-        # 如果超过最大大小,删除最旧的文件
+        # 如果超过最大大小,删除最旧的文件；建堆为O(N)，只需弹出被删除的文件
         if total_size > max_size:
             logger.info(f"Cache size ({total_size} bytes) exceeds limit ({max_size} bytes)")
-            files.sort(key=lambda x: x[2])  # 按修改时间排序
+            heapq.heapify(files)
             
-            for path, size, _ in files:
-                if total_size <= max_size:
-                    break
-                    
+            while files and total_size > max_size:
+                _, path, size = heapq.heappop(files)
                 try:
-                    path.unlink()
+                    os.unlink(path)
                     total_size -= size
                     logger.info(f"Removed cache file: {path}")
                 except OSError as e:
@@ -210,7 +264,7 @@ class DatabaseManager:
             
         """
         versions = self._load_versions()
-        config = DatabaseConfig.from_env()
+        config = _env_config()
         
         info = {
             "versions": versions,
@@ -222,10 +276,7 @@ class DatabaseManager:
             info["status"]["bfd"] = {
                 "available": True,
                 "path": str(config.bfd.db_path),
-                "size": sum(
-                    os.path.getsize(p) for p in asdict(config.bfd).values()
-                    if os.path.exists(p)
-                )
+                "size": sum(_file_size(p) for p in asdict(config.bfd).values())
             }
         else:
             info["status"]["bfd"] = {"available": False}
@@ -137,6 +137,10 @@ class MetricsManager:
         self.config = config
         self.metrics = ServiceMetrics()
         
+        # Labelled children, resolved once per label set. labels() validates
+        # and takes the metric's lock on every call, which adds up on hot paths.
+        self._children: Dict[tuple, object] = {}
+        
         if config.enable_prometheus:
             try:
                 start_http_server(config.prometheus_port)
@@ -144,6 +148,14 @@ class MetricsManager:
             except Exception as e:
                 logger.error(f"Failed to start Prometheus metrics server: {e}")
                 
+    def _child(self, metric, *labels):
+        """Return the child of ``metric`` for ``labels``, cached."""
+        key = (id(metric), labels)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children.setdefault(key, metric.labels(*labels))
+        return child
+        
     @contextmanager
     def record_request(self, service: str, method: str):
         """Record request metrics.
@@ -155,16 +167,20 @@ class MetricsManager:
         method : str
             Method name
         """
-        start_time = time.time()
+        success = self._child(self.metrics.request_count, service, method, "success")
+        # Resolving both statuses up front also exports the error series at 0
+        error = self._child(self.metrics.request_count, service, method, "error")
+        duration = self._child(self.metrics.request_duration, service, method)
+        
+        start_time = time.perf_counter()
         try:
             yield
-            self.metrics.request_count.labels(service, method, "success").inc()
+            success.inc()
         except Exception:
-            self.metrics.request_count.labels(service, method, "error").inc()
+            error.inc()
             raise
         finally:
-            duration = time.time() - start_time
-            self.metrics.request_duration.labels(service, method).observe(duration)
+            duration.observe(time.perf_counter() - start_time)
             
     def update_resource_metrics(
         self,
@@ -191,11 +207,11 @@ class MetricsManager:
         
         if gpu_utils:
             for i, util in enumerate(gpu_utils):
-                self.metrics.gpu_utilization.labels(f"gpu{i}").set(util)
+                self._child(self.metrics.gpu_utilization, f"gpu{i}").set(util)
                 
         if gpu_memory_utils:
             for i, util in enumerate(gpu_memory_utils):
-                self.metrics.gpu_memory.labels(f"gpu{i}").set(util)
+                self._child(self.metrics.gpu_memory, f"gpu{i}").set(util)
                 
     def record_cache_metrics(
         self,
@@ -215,12 +231,12 @@ class MetricsManager:
             Current cache size in bytes
         """
         if hit:
-            self.metrics.cache_hits.labels(cache_type).inc()
+            self._child(self.metrics.cache_hits, cache_type).inc()
         else:
-            self.metrics.cache_misses.labels(cache_type).inc()
+            self._child(self.metrics.cache_misses, cache_type).inc()
             
         if size is not None:
-            self.metrics.cache_size.labels(cache_type).set(size)
+            self._child(self.metrics.cache_size, cache_type).set(size)
             
     @contextmanager
     def record_model_metrics(
@@ -243,15 +259,19 @@ class MetricsManager:
         sequence_length : Optional[int]
             Sequence length
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             yield
         finally:
-            duration = time.time() - start_time
-            self.metrics.inference_time.labels(model_name, model_version).observe(duration)
+            duration = time.perf_counter() - start_time
+            self._child(
+                self.metrics.inference_time, model_name, model_version
+            ).observe(duration)
             
             if batch_size is not None:
-                self.metrics.batch_size.labels(model_name).observe(batch_size)
+                self._child(self.metrics.batch_size, model_name).observe(batch_size)
                 
             if sequence_length is not None:
-                self.metrics.sequence_length.labels(model_name).observe(sequence_length)
+                self._child(
+                    self.metrics.sequence_length, model_name
+                ).observe(sequence_length)
@@ -120,15 +120,24 @@ class PrometheusManager:
             Process object with memory_info() and cpu_times() methods
         """
         try:
-            memory_info = process.memory_info()
-            self.process_resident_memory.set(memory_info.rss)
-            self.process_virtual_memory.set(memory_info.vms)
-            
-            cpu_times = process.cpu_times()
-            self.process_cpu_seconds.set(cpu_times.user + cpu_times.system)
+            self.update_process_metrics(process.memory_info(), process.cpu_times())
         except Exception as e:
             logger.warning(f"Failed to update resource metrics: {e}")
             
+    def update_process_metrics(self, memory_info: Any, cpu_times: Any):
+        """Update process resource metrics from already-collected values.
+        
+        Parameters
+        ----------
+        memory_info : Any
+            Result of ``process.memory_info()``
+        cpu_times : Any
+            Result of ``process.cpu_times()``
+        """
+        self.process_resident_memory.set(memory_info.rss)
+        self.process_virtual_memory.set(memory_info.vms)
+        self.process_cpu_seconds.set(cpu_times.user + cpu_times.system)
+            
     def clear(self):
         """Clear all metrics."""
         for collector in list(self.registry._collector_to_names.keys()):
@@ -1,10 +1,41 @@
 """Redis缓存工具"""
 
+import hashlib
 import os
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 import redis
 
+# 进程内MSA缓存的容量与有效期（秒），有效期限制了与Redis之间的不一致时间
+LOCAL_CACHE_SIZE = 4096
+LOCAL_CACHE_TTL = 300
+
+def msa_key(sequence: str) -> str:
+    """计算MSA缓存键
+    
+    序列经规范化（去除首尾空白、转大写）后取BLAKE2b-160摘要，
+    使键长固定且等价序列共享同一缓存项。
+    
+    Parameters
+    ----------
+    sequence : str
+        蛋白质序列
+        
+    Returns
+    -------
+    str
+        缓存键
+        
+    """
+    digest = hashlib.blake2b(
+        sequence.strip().upper().encode(), digest_size=20
+    ).hexdigest()
+    return f"msa:{digest}"
+
 class RedisCache:
     """Redis缓存接口"""
     
@@ -22,6 +53,30 @@ class RedisCache:
             password=password,
             decode_responses=True
         )
+        # 进程内LRU：键 -> (过期时间, MSA路径)，重复序列无需访问Redis
+        self._local: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._local_lock = threading.Lock()
+        
+    def _local_get(self, key: str) -> Optional[str]:
+        """从进程内缓存读取，命中时移至队尾"""
+        with self._local_lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return entry[1]
+            
+    def _local_put(self, key: str, msa_path: str, expire: int):
+        """写入进程内缓存，超出容量时淘汰最久未用的项"""
+        expires_at = time.monotonic() + min(expire, LOCAL_CACHE_TTL)
+        with self._local_lock:
+            self._local[key] = (expires_at, msa_path)
+            self._local.move_to_end(key)
+            while len(self._local) > LOCAL_CACHE_SIZE:
+                self._local.popitem(last=False)
         
     def get_msa(self, sequence: str) -> Optional[str]:
         """从缓存获取MSA
@@ -37,7 +92,38 @@ class RedisCache:
             MSA文件路径，如果不存在则返回None
             
         """
-        return self.client.get(f"msa:{sequence}")
+        return self.mget_msa([sequence])[0]
+        
+    def mget_msa(self, sequences: List[str]) -> List[Optional[str]]:
+        """批量获取MSA，未命中本地缓存的序列通过一次流水线往返查询
+        
+        Parameters
+        ----------
+        sequences : List[str]
+            蛋白质序列
+            
+        Returns
+        -------
+        List[Optional[str]]
+            与输入顺序对应的MSA文件路径，不存在的为None
+            
+        """
+        keys = [msa_key(sequence) for sequence in sequences]
+        paths = [self._local_get(key) for key in keys]
+        missing = sorted({key for key, path in zip(keys, paths) if path is None})
+        if not missing:
+            return paths
+            
+        pipe = self.client.pipeline(transaction=False)
+        for key in missing:
+            pipe.get(key)
+        found = {}
+        for key, path in zip(missing, pipe.execute()):
+            if path is not None:
+                found[key] = path
+                self._local_put(key, path, LOCAL_CACHE_TTL)
+        return [path if path is not None else found.get(key)
+                for key, path in zip(keys, paths)]
         
     def set_msa(self, sequence: str, msa_path: str, expire: int = 86400):
         """将MSA添加到缓存
@@ -52,7 +138,57 @@ class RedisCache:
             过期时间（秒）
             
         """
-        self.client.set(f"msa:{sequence}", msa_path, ex=expire)
+        self.mset_msa({sequence: msa_path}, expire=expire)
+        
+    def mset_msa(self, msa_paths: Dict[str, str], expire: int = 86400):
+        """批量添加MSA，通过一次流水线往返写入
+        
+        Parameters
+        ----------
+        msa_paths : Dict[str, str]
+            蛋白质序列 -> MSA文件路径
+        expire : int
+            过期时间（秒）
+            
+        """
+        pipe = self.client.pipeline(transaction=False)
+        for sequence, msa_path in msa_paths.items():
+            key = msa_key(sequence)
+            pipe.set(key, msa_path, ex=expire)
+            self._local_put(key, msa_path, expire)
+        pipe.execute()
+        
+    def get_job(self, job_id: str) -> Optional[dict]:
+        """从缓存获取任务状态
+        
+        Parameters
+        ----------
+        job_id : str
+            任务ID
+            
+        Returns
+        -------
+        dict or None
+            任务状态，如果不存在则返回None
+            
+        """
+        value = self.client.get(f"job:{job_id}")
+        return orjson.loads(value) if value is not None else None
+        
+    def set_job(self, job_id: str, job: dict, expire: int = 86400):
+        """保存任务状态，供所有副本共享
+        
+        Parameters
+        ----------
+        job_id : str
+            任务ID
+        job : dict
+            任务状态
+        expire : int
+            过期时间（秒）
+            
+        """
+        self.client.set(f"job:{job_id}", orjson.dumps(job), ex=expire)
         
     def get_stats(self) -> dict:
         """获取缓存统计信息
@@ -82,6 +218,9 @@ class RedisCache:
             要清理的键模式
             
         """
+        if pattern.startswith("msa:"):
+            with self._local_lock:
+                self._local.clear()
         cursor = 0
         while True:
             cursor, keys = self.client.scan(cursor, match=pattern)
@@ -90,9 +229,15 @@ class RedisCache:
             if cursor == 0:
                 break
 
+# 按连接参数共享的缓存实例，使进程内缓存与连接池在调用之间复用
+_caches: Dict[tuple, RedisCache] = {}
+_caches_lock = threading.Lock()
+
 def get_redis_cache() -> Optional[RedisCache]:
     """获取Redis缓存
     
+    同一连接参数只在首次调用时创建实例并测试连接。
+    
     Returns
     -------
     RedisCache or None
@@ -107,10 +252,20 @@ def get_redis_cache() -> Optional[RedisCache]:
     db = int(os.getenv("REDIS_DB", "0"))
     password = os.getenv("REDIS_PASSWORD")
     
-    try:
-        cache = RedisCache(host=host, port=port, db=db, password=password)
-        # 测试连接
-        cache.client.ping()
+    params = (host, port, db, password)
+    cache = _caches.get(params)
+    if cache is not None:
+        return cache
+        
+    with _caches_lock:
+        cache = _caches.get(params)
+        if cache is not None:
+            return cache
+        try:
+            cache = RedisCache(host=host, port=port, db=db, password=password)
+            # 测试连接
+            cache.client.ping()
+        except redis.ConnectionError:
+            return None
+        _caches[params] = cache
         return cache
-    except redis.ConnectionError:
-        return None
@@ -1,6 +1,12 @@
 import re
 from typing import Optional
 
+# 有效氨基酸字符（大小写均可），用于bytes.translate快速校验
+_AMINO_ACIDS = b"ACDEFGHIKLMNPQRSTVWY"
+_VALID_BYTES = _AMINO_ACIDS + _AMINO_ACIDS.lower()
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
 def validate_sequence(sequence: str) -> bool:
     """验证蛋白质序列是否有效
     
@@ -22,11 +28,13 @@ def validate_sequence(sequence: str) -> bool:
     if len(sequence) > 2000:
         return False
         
-    # 检查氨基酸字符
-    valid_chars = set("ACDEFGHIKLMNPQRSTVWY")
-    sequence_chars = set(sequence.upper())
-    
-    return sequence_chars.issubset(valid_chars)
+    # 检查氨基酸字符：删除所有有效字符后应为空
+    try:
+        encoded = sequence.encode("ascii")
+    except UnicodeEncodeError:
+        return False
+        
+    return not encoded.translate(None, _VALID_BYTES)
 
 def format_sequence(sequence: str) -> Optional[str]:
     """格式化蛋白质序列
@@ -43,7 +51,7 @@ def format_sequence(sequence: str) -> Optional[str]:
         
     """
     # 移除空白字符
-    sequence = re.sub(r"\s+", "", sequence)
+    sequence = _WHITESPACE_RE.sub("", sequence)
     
     # 转换为大写
     sequence = sequence.upper()
@@ -0,0 +1,78 @@
+"""
+Test service configuration
+"""
+import logging
+import os
+import threading
+import time
+
+from boltz_service.config.base import BaseConfig, NetworkConfig, configure_compile_cache
+from boltz_service.config.server import ServerConfig
+
+
+def test_rpc_limit_is_advertised_as_configured():
+    network = NetworkConfig(max_workers=4, max_concurrent_rpcs=100)
+    assert ("grpc.max_concurrent_streams", 100) in network.grpc_options()
+
+    # Only sync handlers are bounded by the worker count
+    running, peak, lock = 0, 0, threading.Lock()
+
+    def handler():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    with network.worker_pool() as pool:
+        for _ in range(12):
+            pool.submit(handler)
+    assert peak <= 4
+
+
+def test_validate_leaves_rpc_limit_unchanged(tmp_path, caplog):
+    config = BaseConfig()
+    config.cache.cache_dir = tmp_path / "cache"
+    config.network.max_workers = 4
+    config.network.max_concurrent_rpcs = 100
+
+    with caplog.at_level(logging.WARNING):
+        assert config.validate() == []
+
+    assert config.network.max_concurrent_rpcs == 100
+    assert not caplog.records
+
+
+def test_server_config_validate_sees_later_changes(tmp_path):
+    config = ServerConfig(model_cache=tmp_path / "models")
+    config.cache.cache_dir = tmp_path / "cache"
+    assert config.validate() == []
+
+    config.max_epochs = 0
+    config.network.port = 70000
+    errors = config.validate()
+    assert "max_epochs must be positive" in errors
+    assert "Invalid port number: 70000" in errors
+    # Building and validating a config has no filesystem side effects
+    assert not config.model_cache.exists()
+
+    config.create_directories()
+    assert config.model_cache.is_dir()
+
+
+def test_configure_compile_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("TORCHINDUCTOR_CACHE_DIR", raising=False)
+    monkeypatch.delenv("TORCH_COMPILE_DEBUG_DIR", raising=False)
+    BaseConfig()
+    assert "TORCHINDUCTOR_CACHE_DIR" not in os.environ
+
+    configure_compile_cache(tmp_path)
+    assert os.environ["TORCHINDUCTOR_CACHE_DIR"] == str(tmp_path / "inductor")
+    assert os.environ["TORCH_COMPILE_DEBUG_DIR"] == str(tmp_path / "compile_debug")
+    assert (tmp_path / "inductor").is_dir()
+
+    # Explicit settings win
+    configure_compile_cache(tmp_path / "other")
+    assert os.environ["TORCHINDUCTOR_CACHE_DIR"] == str(tmp_path / "inductor")
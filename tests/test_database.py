@@ -0,0 +1,65 @@
+"""
+Test the taxonomy database
+"""
+import sqlite3
+
+import pytest
+
+from boltz_service.utils.database import TaxonomyDB, build_taxonomy_lmdb
+
+
+@pytest.fixture
+def taxonomy_sqlite(tmp_path):
+    path = tmp_path / "taxonomy.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE taxonomy (uniref_id TEXT PRIMARY KEY, taxonomy_id TEXT)")
+    conn.executemany(
+        "INSERT INTO taxonomy VALUES (?, ?)",
+        [(f"UPI{i:05d}", str(i * 7)) for i in range(2000)],
+    )
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def test_get(taxonomy_sqlite):
+    db = TaxonomyDB(taxonomy_sqlite)
+    assert db.get("UPI00003") == 21
+    assert db.get("missing") is None
+    db.close()
+
+
+def test_get_many_spans_query_chunks(taxonomy_sqlite):
+    db = TaxonomyDB(taxonomy_sqlite)
+    ids = [f"UPI{i:05d}" for i in range(2500)] + ["UPI00001", "missing"]
+
+    found = db.get_many(ids)
+
+    assert len(found) == 2000
+    assert found["UPI01999"] == 1999 * 7
+    assert all(isinstance(value, int) for value in found.values())
+    assert found == {uniref_id: db.get(uniref_id) for uniref_id in found}
+    db.close()
+
+
+def test_connection_is_read_only(taxonomy_sqlite):
+    db = TaxonomyDB(taxonomy_sqlite)
+    db.connect()
+    with pytest.raises(sqlite3.OperationalError):
+        db._conn.execute("INSERT INTO taxonomy VALUES ('a', '1')")
+    db.close()
+
+
+def test_lmdb_matches_sqlite(taxonomy_sqlite, tmp_path):
+    pytest.importorskip("lmdb")
+    lmdb_path = str(tmp_path / "taxonomy.lmdb")
+    assert build_taxonomy_lmdb(taxonomy_sqlite, lmdb_path) == 2000
+
+    sqlite_db = TaxonomyDB(taxonomy_sqlite)
+    lmdb_db = TaxonomyDB(lmdb_path)
+    ids = [f"UPI{i:05d}" for i in range(0, 2100, 7)]
+    assert lmdb_db.get_many(ids) == sqlite_db.get_many(ids)
+    assert lmdb_db.get("UPI00003") == 21
+    assert lmdb_db.get("missing") is None
+    sqlite_db.close()
+    lmdb_db.close()
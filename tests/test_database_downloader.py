@@ -0,0 +1,84 @@
+"""
+Test database downloads against a local HTTP server
+"""
+import hashlib
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from boltz_service.utils import database_downloader
+
+DATA = os.urandom(3 * 1024 * 1024 + 17)
+MD5 = hashlib.md5(DATA).hexdigest()
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    accept_ranges = True
+
+    def log_message(self, *args):
+        pass
+
+    def _send_headers(self, code, length):
+        self.send_response(code)
+        self.send_header("Content-Length", str(length))
+        if self.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._send_headers(200, len(DATA))
+
+    def do_GET(self):
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if match and self.accept_ranges:
+            start, end = map(int, match.groups())
+            body = DATA[start:end + 1]
+            self._send_headers(206, len(body))
+        else:
+            body = DATA
+            self._send_headers(200, len(body))
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def url(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    # Small enough that the test file takes the ranged path
+    monkeypatch.setattr(database_downloader, "MIN_RANGED_SIZE", 1)
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    yield f"http://127.0.0.1:{server.server_port}/db.tar.gz"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("accept_ranges", [True, False])
+def test_download_file(url, tmp_path, monkeypatch, accept_ranges):
+    monkeypatch.setattr(RangeHandler, "accept_ranges", accept_ranges)
+    target = tmp_path / "db.tar.gz"
+
+    digest = database_downloader.download_file(url, target, expected_md5=MD5)
+
+    assert digest == MD5
+    assert target.read_bytes() == DATA
+
+
+@pytest.mark.parametrize("accept_ranges", [True, False])
+def test_download_file_md5_mismatch(url, tmp_path, monkeypatch, accept_ranges):
+    monkeypatch.setattr(RangeHandler, "accept_ranges", accept_ranges)
+    target = tmp_path / "db.tar.gz"
+
+    with pytest.raises(ValueError, match="MD5 mismatch"):
+        database_downloader.download_file(url, target, expected_md5="0" * 32)
+
+    assert not target.exists()
+
+
+def test_calculate_md5(tmp_path):
+    path = tmp_path / "data"
+    path.write_bytes(DATA)
+    assert database_downloader.calculate_md5(path) == MD5
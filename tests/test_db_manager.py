@@ -0,0 +1,41 @@
+"""
+Test database manager cache maintenance
+"""
+import os
+
+from boltz_service.utils.db_manager import DatabaseManager
+
+
+def make_file(path, size, mtime):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+
+
+def test_cleanup_cache_evicts_oldest_first(tmp_path):
+    manager = DatabaseManager(base_dir=str(tmp_path / "boltz"))
+    cache = tmp_path / "cache"
+    make_file(cache / "old.a3m", 100, 1000)
+    make_file(cache / "nested" / "older.a3m", 100, 500)
+    make_file(cache / "nested" / "deep" / "new.a3m", 100, 3000)
+    make_file(cache / "newer.a3m", 100, 2000)
+
+    manager.cleanup_cache(str(cache), max_size=250)
+
+    remaining = sorted(
+        os.path.relpath(os.path.join(root, name), cache)
+        for root, _, names in os.walk(cache)
+        for name in names
+    )
+    assert remaining == [os.path.join("nested", "deep", "new.a3m"), "newer.a3m"]
+
+
+def test_cleanup_cache_under_limit_keeps_files(tmp_path):
+    manager = DatabaseManager(base_dir=str(tmp_path / "boltz"))
+    cache = tmp_path / "cache"
+    make_file(cache / "a.a3m", 100, 1000)
+
+    manager.cleanup_cache(str(cache), max_size=100)
+    manager.cleanup_cache(str(tmp_path / "missing"), max_size=0)
+
+    assert (cache / "a.a3m").exists()
@@ -0,0 +1,134 @@
+"""
+Test the inference job store and request micro-batcher
+"""
+import threading
+import time
+import unittest.mock as mock
+
+import grpc
+import pytest
+
+from boltz_service.data.types import ServiceConfig
+from boltz_service.services import inference
+from boltz_service.services.inference import InferenceService, PredictionJob, _JobStore
+
+
+def make_job(job_id, **kwargs):
+    return PredictionJob(job_id=job_id, sequence="ACDEFGHIK", **kwargs)
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    """Inference service with one (unloaded) model and no Redis"""
+    (tmp_path / "models" / "v1").mkdir(parents=True)
+    monkeypatch.setattr(inference, "get_redis_cache", lambda: None)
+    config = ServiceConfig(cache_dir=tmp_path, max_batch_size=4, max_batch_wait_ms=200)
+    service = InferenceService(config=config)
+    yield service
+    service.shutdown()
+
+
+def test_job_store_evicts_least_recently_used():
+    store = _JobStore(max_jobs=2)
+    store["a"] = make_job("a")
+    store["b"] = make_job("b")
+    # Reading "a" makes "b" the least recently used
+    assert store.get("a").job_id == "a"
+    store["c"] = make_job("c")
+
+    assert len(store) == 2
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert store.get("c") is not None
+
+
+def test_job_store_prefers_cache():
+    cache = mock.Mock()
+    store = _JobStore(max_jobs=10, cache=cache, ttl=60)
+    job = make_job("a")
+    store["a"] = job
+    cache.set_job.assert_called_once_with("a", job.to_dict(), expire=60)
+
+    cache.get_job.return_value = dict(job.to_dict(), status="completed")
+    assert store.get("a").status == "completed"
+
+    # Jobs missing from the cache fall back to the local store
+    cache.get_job.return_value = None
+    assert store.get("a").status == "pending"
+
+
+def test_batcher_coalesces_concurrent_jobs(service):
+    calls = []
+    service._run_predictions = lambda jobs: (
+        calls.append([job.job_id for job in jobs]) or [f"/out/{job.job_id}" for job in jobs]
+    )
+
+    pending = [service._submit(make_job(job_id)) for job_id in ("a", "b", "c")]
+
+    assert [future.result(timeout=5) for future in pending] == ["/out/a", "/out/b", "/out/c"]
+    assert calls == [["a", "b", "c"]]
+
+
+def test_batcher_groups_by_settings(service):
+    calls = []
+    service._run_predictions = lambda jobs: (
+        calls.append(sorted(job.job_id for job in jobs)) or ["/out"] * len(jobs)
+    )
+
+    pending = [
+        service._submit(make_job("a", sampling_steps=10)),
+        service._submit(make_job("b", sampling_steps=20)),
+        service._submit(make_job("c", sampling_steps=10)),
+    ]
+    for future in pending:
+        future.result(timeout=5)
+
+    assert sorted(calls) == [["a", "c"], ["b"]]
+
+
+def test_batcher_propagates_errors(service):
+    def fail(jobs):
+        raise RuntimeError("out of memory")
+
+    service._run_predictions = fail
+    with pytest.raises(RuntimeError, match="out of memory"):
+        service._submit(make_job("a")).result(timeout=5)
+
+    # A malformed result fails the batch without killing the batcher
+    service._run_predictions = lambda jobs: []
+    with pytest.raises(RuntimeError, match="0 predictions"):
+        service._submit(make_job("b")).result(timeout=5)
+
+    service._run_predictions = lambda jobs: ["/out/c"]
+    assert service._submit(make_job("c")).result(timeout=5) == "/out/c"
+
+
+def test_predict_structure_honours_deadline(service):
+    release = threading.Event()
+    service._run_predictions = lambda jobs: release.wait(5) and ["/out"]
+    request = mock.Mock(
+        job_id="a",
+        sequence="ACDEFGHIK",
+        recycling_steps=3,
+        sampling_steps=200,
+        diffusion_samples=1,
+        output_format="mmcif",
+        model_version="latest",
+    )
+    context = mock.Mock()
+    context.time_remaining.return_value = 0.1
+
+    start = time.monotonic()
+    response = service.PredictStructure(request, context)
+    release.set()
+
+    assert time.monotonic() - start < 2
+    assert response.status == "failed"
+    context.set_code.assert_called_once_with(grpc.StatusCode.DEADLINE_EXCEEDED)
+    assert service.jobs.get("a").status == "failed"
+
+
+def test_submit_after_shutdown_fails(service):
+    service.shutdown()
+    with pytest.raises(RuntimeError, match="shutting down"):
+        service._submit(make_job("a")).result(timeout=1)
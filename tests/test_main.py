@@ -0,0 +1,39 @@
+"""
+Test lazy service construction in the server entry point
+"""
+import unittest.mock as mock
+
+import pytest
+
+from boltz_service.config.base import BaseConfig
+from boltz_service.main import _LazyServicer
+from boltz_service.utils.errors import ServiceError
+
+
+class FakeService:
+    def __init__(self, config):
+        self.config = config
+
+
+class BrokenService:
+    def __init__(self, config):
+        raise RuntimeError("no models")
+
+
+def test_lazy_servicer_reports_ready_once():
+    on_ready = mock.Mock()
+    servicer = _LazyServicer(FakeService, BaseConfig(), on_ready)
+    on_ready.assert_not_called()
+
+    service = servicer._get()
+    assert servicer._get() is service
+    on_ready.assert_called_once_with()
+
+
+def test_lazy_servicer_not_ready_when_construction_fails():
+    on_ready = mock.Mock()
+    servicer = _LazyServicer(BrokenService, BaseConfig(), on_ready)
+
+    with pytest.raises(ServiceError):
+        servicer._get()
+    on_ready.assert_not_called()
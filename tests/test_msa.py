@@ -0,0 +1,37 @@
+"""
+Test MSA file handling
+"""
+import os
+
+from boltz_service.services.msa import _clone_file
+
+
+def test_clone_file_copies_data(tmp_path):
+    src = tmp_path / "cached.a3m"
+    dst = tmp_path / "job.a3m"
+    src.write_text(">query\nACDEFGHIK\n")
+
+    _clone_file(str(src), str(dst))
+
+    assert dst.read_text() == src.read_text()
+    assert os.stat(src).st_nlink == 1
+
+    # Writing the job's copy leaves the cached MSA intact
+    with open(dst, "a") as f:
+        f.write(">hit\nACDEFGHIK\n")
+    assert src.read_text() == ">query\nACDEFGHIK\n"
+
+
+def test_clone_file_replaces_existing_link(tmp_path):
+    src = tmp_path / "cached.a3m"
+    other = tmp_path / "other.a3m"
+    dst = tmp_path / "job.a3m"
+    src.write_text(">query\nACD\n")
+    other.write_text(">other\nEFG\n")
+    os.symlink(other, dst)
+
+    _clone_file(str(src), str(dst))
+
+    assert not dst.is_symlink()
+    assert dst.read_text() == ">query\nACD\n"
+    assert other.read_text() == ">other\nEFG\n"
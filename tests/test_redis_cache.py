@@ -0,0 +1,81 @@
+"""
+Test the Redis MSA cache
+"""
+import pytest
+
+from boltz_service.utils.redis_cache import RedisCache, msa_key
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def get(self, key):
+        self.commands.append(lambda: self.client.data.get(key))
+
+    def set(self, key, value, ex=None):
+        def run():
+            self.client.data[key] = value
+            self.client.expiry[key] = ex
+            return True
+        self.commands.append(run)
+
+    def execute(self):
+        self.client.round_trips += 1
+        return [command() for command in self.commands]
+
+
+class FakeRedis:
+    """In-memory stand-in for the pipelined subset of redis.Redis"""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def cache():
+    cache = RedisCache()
+    cache.client = FakeRedis()
+    return cache
+
+
+def test_mset_msa_writes_in_one_round_trip(cache):
+    cache.mset_msa({"ACD": "/msa/1.a3m", "EFG": "/msa/2.a3m"}, expire=60)
+
+    assert cache.client.round_trips == 1
+    assert cache.client.data == {
+        msa_key("ACD"): "/msa/1.a3m",
+        msa_key("EFG"): "/msa/2.a3m",
+    }
+    assert set(cache.client.expiry.values()) == {60}
+
+
+def test_mget_msa_keeps_order_and_misses(cache):
+    cache.client.data[msa_key("ACD")] = "/msa/1.a3m"
+    cache.client.data[msa_key("EFG")] = "/msa/2.a3m"
+
+    paths = cache.mget_msa(["EFG", "missing", "ACD", "EFG"])
+
+    assert paths == ["/msa/2.a3m", None, "/msa/1.a3m", "/msa/2.a3m"]
+    assert cache.client.round_trips == 1
+
+
+def test_mget_msa_serves_repeats_locally(cache):
+    cache.set_msa("ACD", "/msa/1.a3m")
+    round_trips = cache.client.round_trips
+
+    # Keys are normalized, and local hits skip Redis entirely
+    assert cache.mget_msa(["acd ", "ACD"]) == ["/msa/1.a3m", "/msa/1.a3m"]
+    assert cache.get_msa("ACD") == "/msa/1.a3m"
+    assert cache.client.round_trips == round_trips
+
+    # Only the sequences missing locally go to Redis
+    cache.client.data[msa_key("EFG")] = "/msa/2.a3m"
+    assert cache.mget_msa(["ACD", "EFG"]) == ["/msa/1.a3m", "/msa/2.a3m"]
+    assert cache.client.round_trips == round_trips + 1
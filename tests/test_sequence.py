@@ -0,0 +1,24 @@
+"""
+Test protein sequence validation
+"""
+import pytest
+
+from boltz_service.utils.sequence import format_sequence, validate_sequence
+
+
+@pytest.mark.parametrize("sequence", ["ACDEFGHIKLMNPQRSTVWY", "acdefghik", "MkTaY"])
+def test_validate_sequence_accepts_amino_acids(sequence):
+    assert validate_sequence(sequence)
+
+
+@pytest.mark.parametrize(
+    "sequence",
+    ["", "ACDX", "ACD EFG", "ACD-", "ACDÉ", "ACDΑ", "A" * 2001],
+)
+def test_validate_sequence_rejects(sequence):
+    assert not validate_sequence(sequence)
+
+
+def test_format_sequence():
+    assert format_sequence(" acd\nefg\t") == "ACDEFG"
+    assert format_sequence("ACDB") is None
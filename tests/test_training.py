@@ -0,0 +1,217 @@
+"""
+Test the training service job pool
+"""
+import asyncio
+import os
+import time
+import unittest.mock as mock
+
+import grpc
+import pytest
+
+from boltz_service.data.types import ServiceConfig
+from boltz_service.protos import (
+    common_pb2,
+    training_service_pb2,
+    training_service_pb2_grpc,
+)
+from boltz_service.services import training
+from boltz_service.services.training import TrainingService
+
+
+# Stand-ins for _run_training. They run in spawned workers, which import
+# them from this module by name.
+def train_until_cancelled(job, cancelled):
+    training._updates.put((job.job_id, {"status": "running"}))
+    cancelled.wait(30)
+    return f"{job.output_dir}/last.ckpt"
+
+
+def train_instantly(job, cancelled):
+    training._updates.put((job.job_id, {"status": "running", "current_epoch": 1}))
+    return f"{job.output_dir}/best.ckpt"
+
+
+def train_in_worker(job, cancelled):
+    return str(os.getpid())
+
+
+def train_ignoring_cancel(job, cancelled):
+    training._updates.put((job.job_id, {"status": "running"}))
+    time.sleep(600)
+
+
+def wait_until(condition, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError("condition not met")
+        time.sleep(0.05)
+
+
+def start(service, job_id):
+    request = training_service_pb2.TrainingRequest(job_id=job_id, output_dir=f"/out/{job_id}")
+    return asyncio.run(service.StartTraining(request, mock.Mock()))
+
+
+def cancel(service, job_id, context=None):
+    request = common_pb2.CancelJobRequest(job_id=job_id)
+    return asyncio.run(service.CancelJob(request, context or mock.Mock()))
+
+
+def status(service, job_id):
+    with service._jobs_lock:
+        return service.jobs[job_id].status
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = TrainingService(ServiceConfig(cache_dir=tmp_path, max_training_jobs=1))
+    yield service
+    service.shutdown()
+
+
+def test_cancel_running_job_frees_worker(service, monkeypatch):
+    monkeypatch.setattr(training, "_run_training", train_until_cancelled)
+    start(service, "a")
+    wait_until(lambda: status(service, "a") == "running")
+
+    assert cancel(service, "a").status == "cancelled"
+
+    # The worker stops and its checkpoint is kept
+    wait_until(lambda: "a" not in service._pending)
+    assert status(service, "a") == "cancelled"
+    assert service.jobs["a"].checkpoint_path == "/out/a/last.ckpt"
+
+    # The freed worker takes the next job
+    monkeypatch.setattr(training, "_run_training", train_instantly)
+    start(service, "b")
+    wait_until(lambda: status(service, "b") == "completed")
+    assert service.jobs["b"].checkpoint_path == "/out/b/best.ckpt"
+
+
+def test_cancel_queued_job(service, monkeypatch):
+    monkeypatch.setattr(training, "_run_training", train_until_cancelled)
+    start(service, "a")
+    monkeypatch.setattr(training, "_run_training", train_instantly)
+    start(service, "b")
+    wait_until(lambda: status(service, "a") == "running")
+
+    assert cancel(service, "b").status == "cancelled"
+    cancel(service, "a")
+    wait_until(lambda: not service._pending)
+
+    # "b" never ran, and "a" still finished
+    assert status(service, "b") == "cancelled"
+    assert service.jobs["b"].current_epoch == 0
+    assert service.jobs["b"].checkpoint_path is None
+    assert service.jobs["a"].checkpoint_path == "/out/a/last.ckpt"
+
+
+def test_cancel_finished_or_unknown_job(service, monkeypatch):
+    monkeypatch.setattr(training, "_run_training", train_instantly)
+    start(service, "a")
+    wait_until(lambda: status(service, "a") == "completed")
+
+    for job_id in ("a", "missing"):
+        context = mock.Mock()
+        assert cancel(service, job_id, context).status == "failed"
+        context.set_code.assert_called_once_with(grpc.StatusCode.FAILED_PRECONDITION)
+    assert status(service, "a") == "completed"
+
+
+def test_training_runs_in_registered_worker(service, monkeypatch):
+    monkeypatch.setattr(training, "_run_training", train_in_worker)
+    start(service, "a")
+    wait_until(lambda: status(service, "a") == "completed")
+
+    worker_pid = int(service.jobs["a"].checkpoint_path)
+    assert worker_pid != os.getpid()
+    assert worker_pid in list(service._worker_pids)
+
+
+def test_shutdown_stops_running_jobs(tmp_path, monkeypatch):
+    service = TrainingService(ServiceConfig(cache_dir=tmp_path, max_training_jobs=1))
+    monkeypatch.setattr(training, "_run_training", train_ignoring_cancel)
+    start(service, "a")
+    start(service, "b")
+    wait_until(lambda: status(service, "a") == "running")
+    worker_pids = list(service._worker_pids)
+
+    started = time.monotonic()
+    service.shutdown()
+
+    assert time.monotonic() - started < 10
+    assert status(service, "a") == "cancelled"
+    assert status(service, "b") == "cancelled"
+    for pid in worker_pids:
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+
+async def call_over_grpc(service, call):
+    server = grpc.aio.server()
+    training_service_pb2_grpc.add_TrainingServiceServicer_to_server(service, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+            return await call(training_service_pb2_grpc.TrainingServiceStub(channel))
+    finally:
+        await server.stop(None)
+
+
+def get_job_status_over_grpc(service, job_id):
+    request = common_pb2.JobStatusRequest(job_id=job_id)
+    return asyncio.run(call_over_grpc(service, lambda stub: stub.GetJobStatus(request)))
+
+
+def test_get_job_status_through_stub(service, monkeypatch):
+    monkeypatch.setattr(training, "_run_training", train_instantly)
+    start(service, "a")
+    wait_until(lambda: status(service, "a") == "completed")
+
+    response = get_job_status_over_grpc(service, "a")
+    assert response.base.status == "completed"
+    assert response.current_epoch == 1
+    assert response.checkpoint_path == "/out/a/best.ckpt"
+
+    with pytest.raises(grpc.aio.AioRpcError) as error:
+        get_job_status_over_grpc(service, "missing")
+    assert error.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+def test_stream_status_until_job_finishes(service, monkeypatch):
+    monkeypatch.setattr(training, "_run_training", train_until_cancelled)
+    start(service, "a")
+    wait_until(lambda: status(service, "a") == "running")
+
+    async def stream(stub):
+        statuses = []
+        async for response in stub.StreamTrainingStatus(
+            common_pb2.JobStatusRequest(job_id="a")
+        ):
+            statuses.append(response.base.status)
+            if response.base.status == "running":
+                await service.CancelJob(
+                    common_pb2.CancelJobRequest(job_id="a"), mock.Mock()
+                )
+        return statuses
+
+    statuses = asyncio.run(call_over_grpc(service, stream))
+
+    # The stream opens with the current status and ends on the final one
+    assert statuses[0] == "running"
+    assert statuses[-1] == "cancelled"
+    assert not service._status_waiters
+
+
+def test_stream_status_of_unknown_job(service):
+    async def stream(stub):
+        request = common_pb2.JobStatusRequest(job_id="missing")
+        return [response async for response in stub.StreamTrainingStatus(request)]
+
+    with pytest.raises(grpc.aio.AioRpcError) as error:
+        asyncio.run(call_over_grpc(service, stream))
+    assert error.value.code() == grpc.StatusCode.NOT_FOUND
+    assert not service._status_waiters